@@ -1,5 +1,11 @@
 # content of conftest.py
 
+import gzip
+import os
+import sqlite3
+
+from pkg_resources import resource_filename
+
 import pytest
 
 
@@ -21,3 +27,24 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _weather_cache(tmp_path_factory):
+    """Point eeweather at a cache built from the weather data that ships in
+    thermostat_nw/resources/cache.sql.gz, so the thermostat fixtures don't have
+    to fetch it from NOAA. An explicitly configured EEWEATHER_CACHE_URL is
+    left alone.
+    """
+    if "EEWEATHER_CACHE_URL" in os.environ:
+        yield
+        return
+
+    cache_db = tmp_path_factory.mktemp("eeweather") / "cache.db"
+    dump = resource_filename("thermostat_nw.resources", "cache.sql.gz")
+    with gzip.open(dump, "rt") as f, sqlite3.connect(str(cache_db)) as conn:
+        conn.executescript(f.read())
+
+    os.environ["EEWEATHER_CACHE_URL"] = "sqlite:///{}".format(cache_db)
+    yield
+    del os.environ["EEWEATHER_CACHE_URL"]
@@ -0,0 +1,11 @@
+from thermostat_nw.importers import from_csv
+from thermostat_nw.util.testing import get_data_path
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _load(path):
+    # Parse each metadata file (and fetch its weather) only once per session,
+    # however many fixtures are built from it. A tuple, rather than the
+    # one-shot iterator from_csv returns, so every test can iterate over it.
+    return tuple(from_csv(get_data_path(path)))
@@ -2,7 +2,11 @@ from thermostat_nw.importers import from_csv
 from thermostat_nw.importers import get_single_thermostat
 from thermostat_nw.util.testing import get_data_path
 from thermostat_nw.core import Thermostat, CoreDaySet
+from thermostat_nw.columns import EXPORT_COLUMNS
 from tempfile import TemporaryDirectory
+from types import MappingProxyType
+from functools import lru_cache
+import numbers
 
 import pandas as pd
 import numpy as np
@@ -10,6 +14,8 @@ from numpy import nan
 
 import pytest
 
+from . import _load
+
 # Note:
 # The following fixtures can be quite slow without a prebuilt weather cache
 # they the from_csv command fetches weather data. (This happens with builds on
@@ -22,32 +28,21 @@ import pytest
     params=["../data/single_stage/metadata_type_1_single_utc_offset_0.csv"],
 )
 def thermostat_type_1_utc(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-
-@pytest.fixture(
-    scope="session",
-    params=["../data/single_stage/metadata_type_1_single_utc_offset_bad.csv"],
-)
-def thermostat_type_1_utc_bad(request):
-    thermostats = from_csv(get_data_path(request.param))
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_1_single_bad_zip.csv"]
 )
 def thermostat_type_1_zip_bad(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return list(thermostats)
+    return _load(request.param)
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_multiple_same_key.csv"]
 )
 def thermostats_multiple_same_key(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return thermostats
+    return _load(request.param)
 
 
 @pytest.fixture(
@@ -55,8 +50,7 @@ def thermostats_multiple_same_key(request):
     params=["../data/single_stage/metadata_type_1_single_too_many_minutes.csv"],
 )
 def thermostat_type_1_too_many_minutes(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return list(thermostats)
+    return _load(request.param)
 
 
 @pytest.fixture(
@@ -64,8 +58,7 @@ def thermostat_type_1_too_many_minutes(request):
     params=["../data/single_stage/metadata_type_1_single_data_out_of_order.csv"],
 )
 def thermostat_type_1_data_out_of_order(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return list(thermostats)
+    return _load(request.param)
 
 
 @pytest.fixture(
@@ -73,16 +66,14 @@ def thermostat_type_1_data_out_of_order(request):
     params=["../data/single_stage/metadata_type_1_single_data_missing_header.csv"],
 )
 def thermostat_type_1_data_missing_header(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return list(thermostats)
+    return _load(request.param)
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_1_single.csv"]
 )
 def thermostat_type_1(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
@@ -96,44 +87,46 @@ def thermostat_type_1_cache(request):
         return next(thermostats)
 
 
+@pytest.fixture(scope="session")
+def thermostat_by_type(request):
+    # Use with indirect parametrization over the single stage types, e.g.
+    # @pytest.mark.parametrize("thermostat_by_type", ["type_3"], indirect=True)
+    return _load(f"../data/single_stage/metadata_{request.param}_single.csv")[0]
+
+
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_2_single.csv"]
 )
 def thermostat_type_2(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_3_single.csv"]
 )
 def thermostat_type_3(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_4_single.csv"]
 )
 def thermostat_type_4(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_type_5_single.csv"]
 )
 def thermostat_type_5(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
     scope="session", params=["../data/single_stage/metadata_single_zero_days.csv"]
 )
 def thermostat_zero_days(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
@@ -141,18 +134,30 @@ def thermostat_zero_days(request):
     params=["../data/single_stage/metadata_single_emg_aux_constant_on_outlier.csv"],
 )
 def thermostat_emg_aux_constant_on_outlier(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return thermostats
+    return _load(request.param)
+
+
+@pytest.fixture(scope="session")
+def _type_1_core_day_set(thermostat_type_1):
+    # Each core day set is computed once, on first use, and shared by the type 1
+    # fixtures below, including the empty ones.
+    @lru_cache(maxsize=None)
+    def core_day_set(heating_or_cooling, method):
+        if heating_or_cooling == "heating":
+            return thermostat_type_1.get_core_heating_days(method=method)[0]
+        return thermostat_type_1.get_core_cooling_days(method=method)[0]
+
+    return core_day_set
 
 
 @pytest.fixture(scope="session")
-def core_heating_day_set_type_1_mid_to_mid(thermostat_type_1):
-    return thermostat_type_1.get_core_heating_days(method="year_mid_to_mid")[0]
+def core_heating_day_set_type_1_mid_to_mid(_type_1_core_day_set):
+    return _type_1_core_day_set("heating", "year_mid_to_mid")
 
 
 @pytest.fixture(scope="session")
-def core_heating_day_set_type_1_entire(thermostat_type_1):
-    return thermostat_type_1.get_core_heating_days(method="entire_dataset")[0]
+def core_heating_day_set_type_1_entire(_type_1_core_day_set):
+    return _type_1_core_day_set("heating", "entire_dataset")
 
 
 @pytest.fixture(scope="session")
@@ -171,30 +176,29 @@ def core_heating_day_set_type_4(thermostat_type_4):
 
 
 @pytest.fixture(scope="session")
-def core_cooling_day_set_type_1_end_to_end(thermostat_type_1):
-    return thermostat_type_1.get_core_cooling_days(method="year_end_to_end")[0]
+def core_cooling_day_set_type_1_end_to_end(_type_1_core_day_set):
+    return _type_1_core_day_set("cooling", "year_end_to_end")
 
 
 @pytest.fixture(scope="session")
-def core_cooling_day_set_type_1_entire(thermostat_type_1):
-    return thermostat_type_1.get_core_cooling_days(method="entire_dataset")[0]
+def core_cooling_day_set_type_1_entire(_type_1_core_day_set):
+    return _type_1_core_day_set("cooling", "entire_dataset")
+
+
+def _false_series(like):
+    # A read-only, stride-0 view of a single False: no backing buffer is
+    # allocated, whatever the length of the index.
+    return pd.Series(
+        np.broadcast_to(np.False_, like.shape), index=like.index, copy=False
+    )
 
 
 @pytest.fixture(scope="session")
-def core_cooling_day_set_type_1_empty(thermostat_type_1):
-    core_cooling_day_set = thermostat_type_1.get_core_cooling_days(
-        method="entire_dataset"
-    )[0]
+def core_cooling_day_set_type_1_empty(_type_1_core_day_set):
+    core_cooling_day_set = _type_1_core_day_set("cooling", "entire_dataset")
     core_day_set = CoreDaySet(
         "empty",
-        pd.Series(
-            np.tile(False, core_cooling_day_set.daily.shape),
-            index=core_cooling_day_set.daily.index,
-        ),
-        pd.Series(
-            np.tile(False, core_cooling_day_set.hourly.shape),
-            index=core_cooling_day_set.hourly.index,
-        ),
+        _false_series(core_cooling_day_set.daily),
         core_cooling_day_set.start_date,
         core_cooling_day_set.end_date,
     )
@@ -202,20 +206,11 @@ def core_cooling_day_set_type_1_empty(thermostat_type_1):
 
 
 @pytest.fixture(scope="session")
-def core_heating_day_set_type_1_empty(thermostat_type_1):
-    core_heating_day_set = thermostat_type_1.get_core_heating_days(
-        method="entire_dataset"
-    )[0]
+def core_heating_day_set_type_1_empty(_type_1_core_day_set):
+    core_heating_day_set = _type_1_core_day_set("heating", "entire_dataset")
     core_day_set = CoreDaySet(
         "empty",
-        pd.Series(
-            np.tile(False, core_heating_day_set.daily.shape),
-            index=core_heating_day_set.daily.index,
-        ),
-        pd.Series(
-            np.tile(False, core_heating_day_set.hourly.shape),
-            index=core_heating_day_set.hourly.index,
-        ),
+        _false_series(core_heating_day_set.daily),
         core_heating_day_set.start_date,
         core_heating_day_set.end_date,
     )
@@ -237,11 +232,9 @@ def core_cooling_day_set_type_5(thermostat_type_5):
     return thermostat_type_5.get_core_cooling_days(method="year_end_to_end")[0]
 
 
-@pytest.fixture(scope="session")
-def metrics_type_1_data():
-
-    # this data comes from a script in scripts/test_data_generation.ipynb
-    data = [
+# this data comes from a script in scripts/test_data_generation.ipynb
+_METRICS_TYPE_1_DATA = (
+    MappingProxyType(
         {
             "sw_version": "0.1.3",
             "ct_identifier": "8465829e-df0d-449e-97bf-96317c24dec3",
@@ -316,7 +309,9 @@ def metrics_type_1_data():
             "excess_resistance_score_1hr": nan,
             "excess_resistance_score_2hr": nan,
             "excess_resistance_score_3hr": nan,
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "sw_version": "0.1.3",
             "ct_identifier": "8465829e-df0d-449e-97bf-96317c24dec3",
@@ -433,7 +428,28 @@ def metrics_type_1_data():
             "rhu2_50F_to_55F": 0.052322643343051506,
             "rhu2_55F_to_60F": 0.028319891645631964,
             "rhu2_30F_to_45F": 0.22154695797667256,
-        },
-    ]
+        }
+    ),
+)
 
-    return data
+
+def metrics_as_array(rows, columns=EXPORT_COLUMNS):
+    """Project the real-valued fields of metrics rows onto a
+    (len(rows), len(columns)) float array, NaN where a row has no real value,
+    so that whole sets of metrics can be compared in a single assert_allclose.
+    """
+    array = np.full((len(rows), len(columns)), np.nan)
+    for i, row in enumerate(rows):
+        for j, column in enumerate(columns):
+            value = row.get(column)
+            if isinstance(value, numbers.Real):
+                array[i, j] = value
+    return array
+
+
+METRICS_TYPE_1_ARRAY = metrics_as_array(_METRICS_TYPE_1_DATA)
+
+
+@pytest.fixture(scope="session")
+def metrics_type_1_data():
+    return _METRICS_TYPE_1_DATA
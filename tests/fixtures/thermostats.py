@@ -20,12 +20,14 @@ def thermostat_template():
     cool_stage = None
     zipcode = "FAKE"
     station = "FAKE"
-    temperature_in = pd.Series([], dtype="Float64")
-    temperature_out = pd.Series([], dtype="Float64")
-    cool_runtime = pd.Series([], dtype="Float64")
-    heat_runtime = pd.Series([], dtype="Float64")
-    auxiliary_heat_runtime = pd.Series([], dtype="Float64")
-    emergency_heat_runtime = pd.Series([], dtype="Float64")
+    # plain numpy float64, as produced by the importers; Thermostat only relies
+    # on NaN (not pd.NA) for missing values
+    temperature_in = pd.Series(dtype="float64")
+    temperature_out = pd.Series(dtype="float64")
+    cool_runtime = pd.Series(dtype="float64")
+    heat_runtime = pd.Series(dtype="float64")
+    auxiliary_heat_runtime = pd.Series(dtype="float64")
+    emergency_heat_runtime = pd.Series(dtype="float64")
 
     thermostat = Thermostat(
         thermostat_id,
@@ -1,6 +1,4 @@
-from thermostat_nw.importers import from_csv
 from thermostat_nw.importers import get_single_thermostat
-from thermostat_nw.util.testing import get_data_path
 from thermostat_nw.core import Thermostat, CoreDaySet
 from tempfile import TemporaryDirectory
 
@@ -10,6 +8,9 @@ from numpy import nan
 
 import pytest
 
+from . import _load
+
+
 """ Abbreviations used in this file:
 
     XX - Heating system type: fu (furnace), hp (heat pump),  er (electric resistance), ot (other)
@@ -28,8 +29,7 @@ import pytest
     ],
 )
 def thermostat_ert_fu_2_ce_2(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
@@ -39,8 +39,7 @@ def thermostat_ert_fu_2_ce_2(request):
     ],
 )
 def thermostat_ert_fu_2_na_1(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
@@ -50,8 +49,7 @@ def thermostat_ert_fu_2_na_1(request):
     ],
 )
 def thermostat_ert_hpeb_2_hp_2(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(
@@ -59,8 +57,7 @@ def thermostat_ert_hpeb_2_hp_2(request):
     params=["../data/two_stage_ert/metadata_none_two_stage_heat_pump_two_stage.csv"],
 )
 def thermostat_ert_na_2_hp_2(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+    return _load(request.param)[0]
 
 
 @pytest.fixture(scope="session")
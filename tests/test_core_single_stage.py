@@ -1,16 +1,21 @@
 import pytest
 import warnings
+import copy
 import numpy as np
 from numpy.testing import assert_allclose
 from numpy import isnan
 import pandas as pd
 
 from datetime import datetime
+from pkg_resources import resource_stream
 
 from thermostat_nw.core import (
     __pandas_warnings,
     percent_savings,
     RESISTANCE_HEAT_USE_BIN_PAIRS,
+    Thermostat,
+    CoreDaySet,
+    _savings_summary,
 )
 from thermostat_nw.importers import from_csv
 from thermostat_nw.util.testing import get_data_path
@@ -21,6 +26,7 @@ from .fixtures.single_stage import (
     thermostat_type_3,
     thermostat_type_4,
     thermostat_type_5,
+    _type_1_core_day_set,
     core_heating_day_set_type_1_entire,
     core_heating_day_set_type_2,
     core_heating_day_set_type_3,
@@ -77,6 +83,42 @@ def test_perecent_saings(thermostat_type_1):
     assert result == np.inf
 
 
+@pytest.mark.parametrize(
+    "baseline_demand, alpha",
+    [
+        ([1.0, 2.0, 0.5, 3.0], 20.0),
+        ([1.0, np.nan, 0.5, 3.0], 20.0),
+        ([1.0, 2.0, 0.5, 3.0], np.nan),
+    ],
+)
+def test_savings_summary_skips_missing_days(baseline_demand, alpha):
+    observed = np.array([10.0, 30.0, np.nan, 50.0])
+    baseline = (alpha * pd.Series(baseline_demand)).clip(lower=0)
+    avoided = baseline - pd.Series(observed)
+    expected = (
+        avoided.mean() / baseline.mean() * 100.0,
+        avoided.mean(),
+        avoided.sum(),
+        baseline.mean(),
+        baseline.sum(),
+    )
+    assert_allclose(
+        _savings_summary(np.array(baseline_demand), alpha, observed), expected
+    )
+
+
+def test_core_day_set_empty_daily(thermostat_type_1):
+    daily = pd.Series([], index=pd.DatetimeIndex([]), dtype=bool)
+    core_day_set = CoreDaySet(
+        "empty", daily, datetime(2011, 1, 1), datetime(2011, 12, 31)
+    )
+    assert core_day_set.hourly.empty
+    assert core_day_set.hourly.dtype == bool
+    assert isinstance(core_day_set.hourly.index, pd.DatetimeIndex)
+    assert core_day_set.n_hours == 0
+    assert not thermostat_type_1._core_hours(core_day_set).any()
+
+
 def test_zero_days_warning(thermostat_zero_days):
     output = thermostat_zero_days.calculate_epa_field_savings_metrics(
         core_cooling_day_set_method="entire_dataset",
@@ -167,6 +209,79 @@ def test_thermostat_type_1_get_core_heating_days(thermostat_type_1):
     assert len(core_heating_day_sets) == 5
 
 
+def test_thermostat_type_1_get_core_days_runtime_after_temperature(
+    thermostat_type_1,
+):
+    def thermostat_from(start):
+        return Thermostat(
+            thermostat_type_1.thermostat_id,
+            thermostat_type_1.heat_type,
+            thermostat_type_1.heat_stage,
+            thermostat_type_1.cool_type,
+            thermostat_type_1.cool_stage,
+            thermostat_type_1.zipcode,
+            thermostat_type_1.station,
+            thermostat_type_1.temperature_in,
+            thermostat_type_1.temperature_out,
+            thermostat_type_1.cool_runtime_hourly[start:],
+            thermostat_type_1.heat_runtime_hourly[start:],
+            thermostat_type_1.auxiliary_heat_runtime[start:],
+            thermostat_type_1.emergency_heat_runtime[start:],
+        )
+
+    # Runtime data starting 30 days after the temperature data
+    start = thermostat_type_1.temperature_in.index[0] + pd.Timedelta(days=30)
+    thermostat = thermostat_from(start)
+    thermostat_full = thermostat_from(None)
+
+    for get_core_days, runtime_daily in (
+        ("get_core_heating_days", "heat_runtime_daily"),
+        ("get_core_cooling_days", "cool_runtime_daily"),
+    ):
+        (core_day_set,) = getattr(thermostat, get_core_days)(method="entire_dataset")
+        (full_core_day_set,) = getattr(thermostat_full, get_core_days)(
+            method="entire_dataset"
+        )
+        assert core_day_set.daily.index.equals(getattr(thermostat, runtime_daily).index)
+        assert core_day_set.n_days > 0
+        assert (
+            core_day_set.daily.values == full_core_day_set.daily[start:].values
+        ).all()
+
+
+def test_thermostat_type_1_assign_hourly_input(
+    thermostat_type_1, core_cooling_day_set_type_1_entire
+):
+    tau = thermostat_type_1.get_cooling_demand(core_cooling_day_set_type_1_entire)[1]
+    constants = thermostat_type_1.get_temperature_constants(
+        core_cooling_day_set_type_1_entire
+    )
+
+    temperature_in = thermostat_type_1.temperature_in
+    thermostat_type_1.temperature_in = temperature_in + 3
+    try:
+        # Cooling demand is fit on indoor minus outdoor temperature, so tau
+        # moves with the indoor temperature.
+        assert_allclose(
+            thermostat_type_1.get_cooling_demand(core_cooling_day_set_type_1_entire)[1],
+            tau + 3,
+            rtol=1e-6,
+        )
+        assert (
+            thermostat_type_1.get_temperature_constants(
+                core_cooling_day_set_type_1_entire
+            )
+            is not constants
+        )
+    finally:
+        thermostat_type_1.temperature_in = temperature_in
+
+    assert_allclose(
+        thermostat_type_1.get_cooling_demand(core_cooling_day_set_type_1_entire)[1],
+        tau,
+    )
+
+
 def test_thermostat_type_1_get_core_heating_days_bad_methods(thermostat_type_1):
     with pytest.raises(NotImplementedError) as record:
         core_heating_day_sets = thermostat_type_1.get_core_heating_days(
@@ -242,6 +357,117 @@ def test_thermostat_type_1_baseline_regional_comfort_temperature_none(
         assert result.get(baseline_key, None) is None
 
 
+def test_thermostat_type_1_hourly_baseline_temperature_leap_years(
+    thermostat_type_1, core_heating_day_set_type_1_entire
+):
+    # The entire dataset core heating days span 2011 to 2014, February 29th
+    # 2012 included, so hours of year repeat. Each baseline temperature is
+    # its own hour of year, so it must match the timestamp of its hour.
+    temp_baseline = pd.DataFrame({"hour_of_year": np.arange(1, 8761)})
+    temp_baseline["temperature_in"] = temp_baseline["hour_of_year"].astype(float)
+    temperature_in = thermostat_type_1._hourly_baseline_temperature(
+        core_heating_day_set_type_1_entire, temp_baseline
+    )
+
+    hours = core_heating_day_set_type_1_entire.hourly
+    hours = hours.index[hours.values]
+    assert len(np.unique(hours.year)) > 1
+    assert ((hours.month == 2) & (hours.day == 29)).any()
+
+    # Hours since the start of the year, less a day in leap years from
+    # February 28th on
+    year_start = pd.to_datetime(
+        pd.DataFrame({"year": hours.year, "month": 1, "day": 1})
+    )
+    expected = (hours - pd.DatetimeIndex(year_start)) // pd.Timedelta("1H") + 1
+    leap_adjustment = hours.is_leap_year & (
+        (hours.month > 2) | ((hours.month == 2) & (hours.day >= 28))
+    )
+    expected = expected - 24 * leap_adjustment
+    assert_allclose(temperature_in, expected)
+
+    def on(year, day):
+        return temperature_in[
+            (hours.year == year) & (hours.month == 2) & (hours.day == day)
+        ]
+
+    assert_allclose(on(2012, 29), on(2011, 28))
+    assert_allclose(on(2012, 28), on(2011, 27))
+
+
+def test_thermostat_type_1_get_delta_df_heatpump(
+    thermostat_type_1, core_heating_day_set_type_1_entire
+):
+    df_daily = thermostat_type_1.get_delta_df_heatpump(
+        core_heating_day_set_type_1_entire
+    )
+    assert list(df_daily.columns) == [
+        "temperature_delta",
+        "heat_runtime",
+        "adjusted_heat_runtime",
+        "resistance_runtime",
+    ]
+
+    # Daily heat runtime on the core heating days, not NaN
+    heat_runtime = thermostat_type_1.heat_runtime_hourly.resample("D").sum()
+    heat_runtime = heat_runtime[core_heating_day_set_type_1_entire.daily]
+    assert not df_daily.heat_runtime.isnull().any()
+    assert df_daily.heat_runtime.index.equals(heat_runtime.index)
+    assert_allclose(df_daily.heat_runtime, heat_runtime)
+
+
+@pytest.mark.parametrize(
+    "climate_zone, heat_type, cool_type, heating_filename, cooling_filename",
+    [
+        (
+            "2",
+            "heat_pump_electric_backup",
+            "heat_pump",
+            "temperature_baseline_hz2_heat_pump.csv",
+            "temperature_baseline_cz2_heat_pump.csv",
+        ),
+        # No heat pump baseline in heating zone 3, nor a baseline without
+        # cooling in cooling zone 3: the zone defaults are used.
+        (
+            "3",
+            "heat_pump_electric_backup",
+            "none",
+            "temperature_baseline_hz3_default.csv",
+            "temperature_baseline_cz3_default.csv",
+        ),
+        (
+            None,
+            "heat_pump_electric_backup",
+            "heat_pump",
+            "temperature_baseline_default.csv",
+            "temperature_baseline_default.csv",
+        ),
+    ],
+)
+def test_thermostat_type_1_find_baselines(
+    thermostat_type_1,
+    climate_zone,
+    heat_type,
+    cool_type,
+    heating_filename,
+    cooling_filename,
+):
+    thermostat = copy.copy(thermostat_type_1)
+    thermostat.heating_zone_nw = climate_zone
+    thermostat.cooling_zone_nw = climate_zone
+    thermostat.heat_type = heat_type
+    thermostat.cool_type = cool_type
+    thermostat.find_baselines()
+
+    package = "thermostat_nw.resources.temperature_baselines_nw"
+    for temperature_baseline, filename in (
+        (thermostat.hourly_temperature_baseline_heating, heating_filename),
+        (thermostat.hourly_temperature_baseline_cooling, cooling_filename),
+    ):
+        with resource_stream(package, filename) as f:
+            pd.testing.assert_frame_equal(temperature_baseline, pd.read_csv(f))
+
+
 def test_thermostat_type_2_get_core_heating_days(thermostat_type_2):
     core_heating_day_sets = thermostat_type_2.get_core_heating_days(
         method="year_mid_to_mid"
@@ -351,7 +577,6 @@ def test_rhu_bins_none(thermostat_type_1):
         rhu_type="rhu1",
         rhu_bins=None,
         rhu_usage_bins=RESISTANCE_HEAT_USE_BIN_PAIRS,
-        duty_cycle=None,
     )
     unique_rhu = set(rhu.values()).pop()
     assert unique_rhu is None
@@ -364,6 +589,19 @@ def test_thermostat_core_heating_day_set_attributes(core_heating_day_set_type_1_
     assert isinstance(core_heating_day_set_type_1_entire.hourly, pd.Series)
     assert core_heating_day_set_type_1_entire.daily.shape == (1461,)
     assert core_heating_day_set_type_1_entire.hourly.shape == (35064,)
+    assert (
+        core_heating_day_set_type_1_entire.n_days
+        == core_heating_day_set_type_1_entire.daily.sum()
+    )
+    assert (
+        core_heating_day_set_type_1_entire.n_hours
+        == core_heating_day_set_type_1_entire.hourly.sum()
+    )
+    assert core_heating_day_set_type_1_entire.daily_index.equals(
+        core_heating_day_set_type_1_entire.daily[
+            core_heating_day_set_type_1_entire.daily
+        ].index
+    )
     assert isinstance(
         core_heating_day_set_type_1_entire.start_date, datetime
     ) or isinstance(core_heating_day_set_type_1_entire.start_date, np.datetime64)
@@ -379,6 +617,19 @@ def test_thermostat_core_cooling_day_set_attributes(core_cooling_day_set_type_1_
     assert isinstance(core_cooling_day_set_type_1_entire.hourly, pd.Series)
     assert core_cooling_day_set_type_1_entire.daily.shape == (1461,)
     assert core_cooling_day_set_type_1_entire.hourly.shape == (35064,)
+    assert (
+        core_cooling_day_set_type_1_entire.n_days
+        == core_cooling_day_set_type_1_entire.daily.sum()
+    )
+    assert (
+        core_cooling_day_set_type_1_entire.n_hours
+        == core_cooling_day_set_type_1_entire.hourly.sum()
+    )
+    assert core_cooling_day_set_type_1_entire.daily_index.equals(
+        core_cooling_day_set_type_1_entire.daily[
+            core_cooling_day_set_type_1_entire.daily
+        ].index
+    )
     assert isinstance(
         core_cooling_day_set_type_1_entire.start_date, datetime
     ) or isinstance(core_cooling_day_set_type_1_entire.start_date, np.datetime64)
@@ -425,6 +676,13 @@ def test_thermostat_type_1_total_heating_runtime(
     )
 
 
+def test_thermostat_type_5_total_heating_runtime(
+    thermostat_type_5, core_cooling_day_set_type_5
+):
+    with pytest.raises(ValueError):
+        thermostat_type_5.total_heating_runtime(core_cooling_day_set_type_5)
+
+
 def test_thermostat_type_1_total_emergency_heating_runtime(
     thermostat_type_1, core_heating_day_set_type_1_entire, metrics_type_1_data
 ):
@@ -465,6 +723,33 @@ def test_thermostat_type_1_total_cooling_runtime(
     )
 
 
+def test_thermostat_type_1_get_temperature_constants_cached(
+    thermostat_type_1, core_heating_day_set_type_1_entire, metrics_type_1_data
+):
+
+    constants = thermostat_type_1.get_temperature_constants(
+        core_heating_day_set_type_1_entire
+    )
+    assert_allclose(
+        constants,
+        (
+            metrics_type_1_data[1]["heat_gain_constant"],
+            metrics_type_1_data[1]["heat_loss_constant"],
+        ),
+        rtol=1e-3,
+    )
+    assert (
+        thermostat_type_1.get_temperature_constants(core_heating_day_set_type_1_entire)
+        is constants
+    )
+
+    thermostat_type_1._invalidate_daily_cache()
+    assert (
+        thermostat_type_1.get_temperature_constants(core_heating_day_set_type_1_entire)
+        is not constants
+    )
+
+
 def test_thermostat_type_1_get_resistance_heat_utilization_bins_rhu1(
     thermostat_type_1, core_heating_day_set_type_1_entire, metrics_type_1_data
 ):
@@ -4,8 +4,11 @@ from numpy.testing import assert_allclose
 
 import pytest
 
+from thermostat_nw.multiple import multiple_thermostat_fit_demands
+
 from .fixtures.single_stage import (
     thermostat_type_1,
+    _type_1_core_day_set,
     core_heating_day_set_type_1_entire as core_heating_day_set_type_1,
     core_cooling_day_set_type_1_entire as core_cooling_day_set_type_1,
     core_heating_day_set_type_1_empty,
@@ -69,3 +72,22 @@ def test_get_heating_demand(
     assert_allclose(
         demand.mean(), metrics_type_1_data[1]["mean_demand"], rtol=RTOL, atol=ATOL
     )
+
+
+def test_multiple_thermostat_fit_demands(thermostat_type_1, metrics_type_1_data):
+    (demands,) = multiple_thermostat_fit_demands(
+        [thermostat_type_1], how="entire_dataset"
+    )
+    assert sorted(demands) == ["cooling_ALL", "heating_ALL"]
+    assert_allclose(
+        demands["cooling_ALL"][0].mean(),
+        metrics_type_1_data[0]["mean_demand"],
+        rtol=RTOL,
+        atol=ATOL,
+    )
+    assert_allclose(
+        demands["heating_ALL"][0].mean(),
+        metrics_type_1_data[1]["mean_demand"],
+        rtol=RTOL,
+        atol=ATOL,
+    )
@@ -4,6 +4,7 @@ import pytest
 
 from thermostat_nw.importers import (
     from_csv,
+    from_records,
     normalize_utc_offset,
 )
 
@@ -12,7 +13,6 @@ from thermostat_nw.util.testing import get_data_path
 from .fixtures.single_stage import (
     thermostat_type_1,
     thermostat_type_1_utc,
-    thermostat_type_1_utc_bad,
     thermostat_type_1_too_many_minutes,
     thermostat_type_1_zip_bad,
     thermostat_type_1_data_out_of_order,
@@ -39,11 +39,37 @@ def test_import_csv(thermostat_type_1):
     assert_is_series_with_shape(thermostat_type_1.temperature_out, (35064,))
 
 
+def test_from_records(thermostat_type_1):
+    record = {
+        "thermostat_id": thermostat_type_1.thermostat_id,
+        "heat_type": thermostat_type_1.heat_type,
+        "heat_stage": thermostat_type_1.heat_stage,
+        "cool_type": thermostat_type_1.cool_type,
+        "cool_stage": thermostat_type_1.cool_stage,
+        "zipcode": thermostat_type_1.zipcode,
+        "station": thermostat_type_1.station,
+        "temperature_in": thermostat_type_1.temperature_in,
+        "temperature_out": thermostat_type_1.temperature_out,
+        "cool_runtime": thermostat_type_1.cool_runtime_hourly,
+        "heat_runtime": thermostat_type_1.heat_runtime_hourly,
+        "auxiliary_heat_runtime": thermostat_type_1.auxiliary_heat_runtime,
+        "emergency_heat_runtime": thermostat_type_1.emergency_heat_runtime,
+    }
+    thermostats = from_records([record, record], processes=2)
+
+    assert len(thermostats) == 2
+    for thermostat in thermostats:
+        assert thermostat.thermostat_id == thermostat_type_1.thermostat_id
+        pd.testing.assert_series_equal(
+            thermostat.heat_runtime_daily, thermostat_type_1.heat_runtime_daily
+        )
+
+
 def test_import_csv_cache(thermostat_type_1_cache):
     assert thermostat_type_1_cache is not None
 
 
-def test_utc_offset(thermostat_type_1_utc, thermostat_type_1_utc_bad):
+def test_utc_offset(thermostat_type_1_utc):
     assert normalize_utc_offset("+0") == datetime.timedelta(0)
     assert normalize_utc_offset("-0") == datetime.timedelta(0)
     assert normalize_utc_offset("0") == datetime.timedelta(0)
@@ -59,7 +85,12 @@ def test_utc_offset(thermostat_type_1_utc, thermostat_type_1_utc_bad):
     # Load a thermostat with utc offset == 0
     assert isinstance(thermostat_type_1_utc.cool_runtime_daily, pd.Series)
     assert isinstance(thermostat_type_1_utc.cool_runtime_hourly, pd.Series)
-    assert thermostat_type_1_utc_bad is None
+
+    # A thermostat with a bad utc offset is skipped on import
+    thermostats = from_csv(
+        get_data_path("data/single_stage/metadata_type_1_single_utc_offset_bad.csv")
+    )
+    assert len(list(thermostats)) == 0
 
 
 def test_too_many_minutes(thermostat_type_1_too_many_minutes):
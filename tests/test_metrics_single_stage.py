@@ -9,17 +9,19 @@ import pytest
 from thermostat_nw.exporters import metrics_to_csv
 from thermostat_nw.multiple import (
     multiple_thermostat_calculate_epa_field_savings_metrics,
+    multiple_thermostat_fit_linear_models,
 )
 
 from .fixtures.single_stage import (
     thermostat_type_1,
     thermostat_type_2,
-    thermostat_type_3,
-    thermostat_type_4,
-    thermostat_type_5,
+    thermostat_by_type,
     metrics_type_1_data,
+    metrics_as_array,
+    METRICS_TYPE_1_ARRAY,
 )
-from thermostat_nw.columns import EXPORT_COLUMNS
+from thermostat_nw.columns import EXPORT_COLUMNS, EXPORT_COLUMN_POSITIONS
+import numbers
 import six
 
 
@@ -44,49 +46,70 @@ RTOL = 1e-3
 ATOL = 1e-3
 
 
+def assert_metrics_match_type_1(metrics, metrics_type_1_data):
+    assert len(metrics) == len(metrics_type_1_data)
+
+    # Real-valued metrics are compared all at once; everything else (strings,
+    # cov_x, ...) key by key.
+    assert_allclose(
+        metrics_as_array(metrics), METRICS_TYPE_1_ARRAY, rtol=RTOL, atol=ATOL
+    )
+    for row, target_row in zip(metrics, metrics_type_1_data):
+        for key, test_value in row.items():
+            target_value = target_row[key]
+            if isinstance(test_value, numbers.Real) and key in EXPORT_COLUMN_POSITIONS:
+                continue
+            elif isinstance(test_value, six.string_types):
+                assert test_value == target_value
+            else:
+                assert_allclose(test_value, target_value, rtol=RTOL, atol=ATOL)
+
+
 def test_calculate_epa_field_savings_metrics_type_1(
     metrics_type_1, metrics_type_1_data
 ):
-    assert len(metrics_type_1) == len(metrics_type_1_data)
-
-    for key in metrics_type_1[0].keys():
-        test_value = metrics_type_1[0][key]
-        target_value = metrics_type_1_data[0][key]
-        if isinstance(test_value, six.string_types):
-            assert test_value == target_value
-        else:
-            assert_allclose(test_value, target_value, rtol=RTOL, atol=ATOL)
-
-    for key in metrics_type_1[1].keys():
-        test_value = metrics_type_1[1][key]
-        target_value = metrics_type_1_data[1][key]
-        if isinstance(test_value, six.string_types):
-            assert test_value == target_value
-        else:
-            assert_allclose(test_value, target_value, rtol=RTOL, atol=ATOL)
+    assert_metrics_match_type_1(metrics_type_1, metrics_type_1_data)
 
 
 def test_multiple_thermostat_calculate_epa_field_savings_metrics_type_1(
     metrics_type_1_multiple, metrics_type_1_data
 ):
     # Test multiprocessing thermostat code
-    assert len(metrics_type_1_multiple) == len(metrics_type_1_data)
+    assert_metrics_match_type_1(metrics_type_1_multiple, metrics_type_1_data)
+
 
-    for key in metrics_type_1_multiple[0].keys():
-        test_value = metrics_type_1_multiple[0][key]
-        target_value = metrics_type_1_data[0][key]
-        if isinstance(test_value, six.string_types):
-            assert test_value == target_value
-        else:
-            assert_allclose(test_value, target_value, rtol=RTOL, atol=ATOL)
+def test_calculate_epa_field_savings_metrics_parallel_type_1(
+    thermostat_type_1, metrics_type_1_data
+):
+    # Core day sets computed in separate processes
+    metrics = thermostat_type_1.calculate_epa_field_savings_metrics(
+        core_cooling_day_set_method="entire_dataset",
+        core_heating_day_set_method="entire_dataset",
+        parallel=True,
+    )
+    assert_metrics_match_type_1(metrics, metrics_type_1_data)
 
-    for key in metrics_type_1_multiple[1].keys():
-        test_value = metrics_type_1_multiple[1][key]
-        target_value = metrics_type_1_data[1][key]
-        if isinstance(test_value, six.string_types):
-            assert test_value == target_value
-        else:
-            assert_allclose(test_value, target_value, rtol=RTOL, atol=ATOL)
+
+def test_multiple_thermostat_fit_linear_models_type_1(
+    thermostat_type_1, metrics_type_1_data
+):
+    (linear_models,) = multiple_thermostat_fit_linear_models(
+        [thermostat_type_1], how="entire_dataset"
+    )
+    assert sorted(linear_models) == ["cooling_ALL", "heating_ALL"]
+    for name, target in zip(["cooling_ALL", "heating_ALL"], metrics_type_1_data):
+        intercept, intercept_se, main_slope, main_slope_se = linear_models[name][:4]
+        assert_allclose(
+            [intercept, intercept_se, main_slope, main_slope_se],
+            [
+                target["lm_intercept"],
+                target["lm_intercept_se"],
+                target["lm_main_slope"],
+                target["lm_main_slope_se"],
+            ],
+            rtol=RTOL,
+            atol=ATOL,
+        )
 
 
 def test_calculate_epa_field_savings_metrics_type_2(thermostat_type_2):
@@ -103,28 +126,19 @@ def test_calculate_epa_field_savings_metrics_type_2(thermostat_type_2):
     assert len(metrics_type_2_yearly) == 9
 
 
-def test_calculate_epa_field_savings_metrics_type_3(thermostat_type_3):
-    metrics_type_3 = thermostat_type_3.calculate_epa_field_savings_metrics(
-        core_cooling_day_set_method="entire_dataset",
-        core_heating_day_set_method="entire_dataset",
-    )
-    assert len(metrics_type_3) == 2
-
-
-def test_calculate_epa_field_savings_metrics_type_4(thermostat_type_4):
-    metrics_type_4 = thermostat_type_4.calculate_epa_field_savings_metrics(
-        core_cooling_day_set_method="entire_dataset",
-        core_heating_day_set_method="entire_dataset",
-    )
-    assert len(metrics_type_4) == 1
-
-
-def test_calculate_epa_field_savings_metrics_type_5(thermostat_type_5):
-    metrics_type_5 = thermostat_type_5.calculate_epa_field_savings_metrics(
+@pytest.mark.parametrize(
+    "thermostat_by_type, n_metrics",
+    [("type_3", 2), ("type_4", 1), ("type_5", 1)],
+    indirect=["thermostat_by_type"],
+)
+def test_calculate_epa_field_savings_metrics_entire_dataset(
+    thermostat_by_type, n_metrics
+):
+    metrics = thermostat_by_type.calculate_epa_field_savings_metrics(
         core_cooling_day_set_method="entire_dataset",
         core_heating_day_set_method="entire_dataset",
     )
-    assert len(metrics_type_5) == 1
+    assert len(metrics) == n_metrics
 
 
 def test_metrics_to_csv(metrics_type_1):
@@ -140,4 +154,4 @@ def test_metrics_to_csv(metrics_type_1):
         lines = f.readlines()
         assert len(lines) == 3
         column_heads = lines[0].strip().split(",")
-        assert column_heads == EXPORT_COLUMNS
+        assert column_heads == list(EXPORT_COLUMNS)
@@ -166,4 +166,4 @@ def test_metrics_to_csv(
         lines = f.readlines()
         assert len(lines) == 3
         column_heads = lines[0].strip().split(",")
-        assert column_heads == EXPORT_COLUMNS
+        assert column_heads == list(EXPORT_COLUMNS)
@@ -1,14 +1,19 @@
 VERSION = "0.1.3"
 
+__all__ = ("Thermostat", "get_version", "VERSION")
+
 
 def get_version():
     return VERSION
 
 
-# This try/except clause is a hack to make the get_version method work for the
-# initial setup, which will fail with an ImportError because pandas hasn't yet
-# been installed. Post-setup, this provides an import shortcut to Thermostat.
-try:
-    from .core import Thermostat  # noqa: F401
-except ImportError:
-    pass
+# Thermostat is imported lazily on first access (PEP 562) so that importing
+# the package for get_version, e.g. during setup before pandas is installed,
+# doesn't pull in core and its dependencies. This provides an import shortcut
+# to Thermostat.
+def __getattr__(name):
+    if name == "Thermostat":
+        from .core import Thermostat
+
+        return Thermostat
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
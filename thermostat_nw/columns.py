@@ -1,128 +1,51 @@
-RHU_COLUMNS = [
-    "rhu1_00F_to_05F",
-    "rhu1_05F_to_10F",
-    "rhu1_10F_to_15F",
-    "rhu1_15F_to_20F",
-    "rhu1_20F_to_25F",
-    "rhu1_25F_to_30F",
-    "rhu1_30F_to_35F",
-    "rhu1_35F_to_40F",
-    "rhu1_40F_to_45F",
-    "rhu1_45F_to_50F",
-    "rhu1_50F_to_55F",
-    "rhu1_55F_to_60F",
-    "rhu1_30F_to_45F",
-    "rhu2_00F_to_05F",
-    "rhu2_05F_to_10F",
-    "rhu2_10F_to_15F",
-    "rhu2_15F_to_20F",
-    "rhu2_20F_to_25F",
-    "rhu2_25F_to_30F",
-    "rhu2_30F_to_35F",
-    "rhu2_35F_to_40F",
-    "rhu2_40F_to_45F",
-    "rhu2_45F_to_50F",
-    "rhu2_50F_to_55F",
-    "rhu2_55F_to_60F",
-    "rhu2_30F_to_45F",
-    "dnru_daily",
-    "dnru_reduction_daily",
-    "mu_estimate_daily",
-    "sigma_estimate_daily",
-    "sigmoid_model_error_daily",
-    "sigmoid_integral_daily",
-    "dnru_hourly",
-    "dnru_reduction_hourly",
-    "mu_estimate_hourly",
-    "sigma_estimate_hourly",
-    "sigmoid_model_error_hourly",
-    "sigmoid_integral_hourly",
-]
+import sys
 
-RHU2_IQFLT_COLUMNS = [
-    "rhu2IQFLT_00F_to_05F",
-    "rhu2IQFLT_05F_to_10F",
-    "rhu2IQFLT_10F_to_15F",
-    "rhu2IQFLT_15F_to_20F",
-    "rhu2IQFLT_20F_to_25F",
-    "rhu2IQFLT_25F_to_30F",
-    "rhu2IQFLT_30F_to_35F",
-    "rhu2IQFLT_35F_to_40F",
-    "rhu2IQFLT_40F_to_45F",
-    "rhu2IQFLT_45F_to_50F",
-    "rhu2IQFLT_50F_to_55F",
-    "rhu2IQFLT_55F_to_60F",
-    "rhu2IQFLT_30F_to_45F",
-]
+# Resistance heat utilization bins in degrees F, matching
+# RESISTANCE_HEAT_USE_BIN_PAIRS and RESISTANCE_HEAT_USE_WIDE_BIN_PAIRS in core.
+_RHU_BIN_EDGES = tuple(range(0, 65, 5))
+_RHU_BIN_PAIRS = tuple(zip(_RHU_BIN_EDGES, _RHU_BIN_EDGES[1:])) + ((30, 45),)
 
-REAL_OR_INTEGER_VALUED_COLUMNS_HEATING = [
-    "n_days_in_inputfile_date_range",
-    "n_days_both_heating_and_cooling",
-    "n_days_insufficient_data",
-    "n_core_heating_days",
-    "baseline_percentile_core_heating_comfort_temperature",
-    "regional_average_baseline_heating_comfort_temperature",
-    "percent_savings_baseline_percentile",
-    "avoided_daily_mean_core_day_runtime_baseline_percentile",
-    "avoided_total_core_day_runtime_baseline_percentile",
-    "baseline_daily_mean_core_day_runtime_baseline_percentile",
-    "baseline_total_core_day_runtime_baseline_percentile",
-    "_daily_mean_core_day_demand_baseline_baseline_percentile",
-    "percent_savings_baseline_regional",
-    "avoided_daily_mean_core_day_runtime_baseline_regional",
-    "avoided_total_core_day_runtime_baseline_regional",
-    "baseline_daily_mean_core_day_runtime_baseline_regional",
-    "baseline_total_core_day_runtime_baseline_regional",
-    "_daily_mean_core_day_demand_baseline_baseline_regional",
-    "percent_savings_baseline_hourly_regional",
-    "avoided_daily_mean_core_day_runtime_baseline_hourly_regional",
-    "avoided_total_core_day_runtime_baseline_hourly_regional",
-    "baseline_daily_mean_core_day_runtime_baseline_hourly_regional",
-    "baseline_total_core_day_runtime_baseline_hourly_regional",
-    "_daily_mean_core_day_demand_baseline_baseline_hourly_regional",
-    "mean_demand",
-    "alpha",
-    "tau",
-    "mean_sq_err",
-    "root_mean_sq_err",
-    "cv_root_mean_sq_err",
-    "mean_abs_err",
-    "mean_abs_pct_err",
-    "nfev",
-    "total_core_heating_runtime",
-    "total_auxiliary_heating_core_day_runtime",
-    "total_emergency_heating_core_day_runtime",
-    "daily_mean_core_heating_runtime",
-    "core_heating_days_mean_indoor_temperature",
-    "core_heating_days_mean_outdoor_temperature",
-    "core_mean_indoor_temperature",
-    "core_mean_outdoor_temperature",
-    "heat_gain_constant",
-    "heat_loss_constant",
-    "hvac_constant",
-    "overall_temperature_variance",
-    "weekly_temperature_variance",
-    "avg_daily_cooling_runtime",
-    "avg_daily_heating_runtime",
-    "avg_daily_auxiliary_runtime",
-    "avg_daily_emergency_runtime",
-    "lm_intercept",
-    "lm_intercept_se",
-    "lm_main_slope",
-    "lm_main_slope_se",
-    "lm_secondary_slope",
-    "lm_secondary_slope_se",
-    "lm_cvrmse",
-    "lm_rsquared",
-] + RHU_COLUMNS
 
-REAL_OR_INTEGER_VALUED_COLUMNS_COOLING = [
+def _rhu_columns(rhu_type):
+    # Interned like the literal column names, which the compiler interns.
+    return tuple(
+        sys.intern(
+            "{rhu_type}_{low:02d}F_to_{high:02d}F".format(
+                rhu_type=rhu_type, low=low, high=high
+            )
+        )
+        for low, high in _RHU_BIN_PAIRS
+    )
+
+
+RHU_COLUMNS = (
+    _rhu_columns("rhu1")
+    + _rhu_columns("rhu2")
+    + (
+        "dnru_daily",
+        "dnru_reduction_daily",
+        "mu_estimate_daily",
+        "sigma_estimate_daily",
+        "sigmoid_model_error_daily",
+        "sigmoid_integral_daily",
+        "dnru_hourly",
+        "dnru_reduction_hourly",
+        "mu_estimate_hourly",
+        "sigma_estimate_hourly",
+        "sigmoid_model_error_hourly",
+        "sigmoid_integral_hourly",
+    )
+)
+
+RHU2_IQFLT_COLUMNS = _rhu_columns("rhu2IQFLT")
+
+_DATE_RANGE_COLUMNS = (
     "n_days_in_inputfile_date_range",
     "n_days_both_heating_and_cooling",
     "n_days_insufficient_data",
-    "n_core_cooling_days",
-    "baseline_percentile_core_cooling_comfort_temperature",
-    "regional_average_baseline_cooling_comfort_temperature",
+)
+
+_SAVINGS_COLUMNS = (
     "percent_savings_baseline_percentile",
     "avoided_daily_mean_core_day_runtime_baseline_percentile",
     "avoided_total_core_day_runtime_baseline_percentile",
@@ -150,10 +73,9 @@ REAL_OR_INTEGER_VALUED_COLUMNS_COOLING = [
     "mean_abs_err",
     "mean_abs_pct_err",
     "nfev",
-    "total_core_cooling_runtime",
-    "daily_mean_core_cooling_runtime",
-    "core_cooling_days_mean_indoor_temperature",
-    "core_cooling_days_mean_outdoor_temperature",
+)
+
+_MODEL_COLUMNS = (
     "core_mean_indoor_temperature",
     "core_mean_outdoor_temperature",
     "heat_gain_constant",
@@ -173,83 +95,78 @@ REAL_OR_INTEGER_VALUED_COLUMNS_COOLING = [
     "lm_secondary_slope_se",
     "lm_cvrmse",
     "lm_rsquared",
+)
+
+_EXCESS_RESISTANCE_COLUMNS = (
     "excess_resistance_score_1hr",
     "excess_resistance_score_2hr",
     "excess_resistance_score_3hr",
-]
+)
+
+REAL_OR_INTEGER_VALUED_COLUMNS_HEATING = (
+    _DATE_RANGE_COLUMNS
+    + (
+        "n_core_heating_days",
+        "baseline_percentile_core_heating_comfort_temperature",
+        "regional_average_baseline_heating_comfort_temperature",
+    )
+    + _SAVINGS_COLUMNS
+    + (
+        "total_core_heating_runtime",
+        "total_auxiliary_heating_core_day_runtime",
+        "total_emergency_heating_core_day_runtime",
+        "daily_mean_core_heating_runtime",
+        "core_heating_days_mean_indoor_temperature",
+        "core_heating_days_mean_outdoor_temperature",
+    )
+    + _MODEL_COLUMNS
+    + RHU_COLUMNS
+)
+
+REAL_OR_INTEGER_VALUED_COLUMNS_COOLING = (
+    _DATE_RANGE_COLUMNS
+    + (
+        "n_core_cooling_days",
+        "baseline_percentile_core_cooling_comfort_temperature",
+        "regional_average_baseline_cooling_comfort_temperature",
+    )
+    + _SAVINGS_COLUMNS
+    + (
+        "total_core_cooling_runtime",
+        "daily_mean_core_cooling_runtime",
+        "core_cooling_days_mean_indoor_temperature",
+        "core_cooling_days_mean_outdoor_temperature",
+    )
+    + _MODEL_COLUMNS
+    + _EXCESS_RESISTANCE_COLUMNS
+)
 
 REAL_OR_INTEGER_VALUED_COLUMNS_ALL = (
-    [
-        "n_days_in_inputfile_date_range",
-        "n_days_both_heating_and_cooling",
-        "n_days_insufficient_data",
+    _DATE_RANGE_COLUMNS
+    + (
         "n_core_cooling_days",
         "n_core_heating_days",
         "baseline_percentile_core_cooling_comfort_temperature",
         "baseline_percentile_core_heating_comfort_temperature",
         "regional_average_baseline_cooling_comfort_temperature",
         "regional_average_baseline_heating_comfort_temperature",
-        "percent_savings_baseline_percentile",
-        "avoided_daily_mean_core_day_runtime_baseline_percentile",
-        "avoided_total_core_day_runtime_baseline_percentile",
-        "baseline_daily_mean_core_day_runtime_baseline_percentile",
-        "baseline_total_core_day_runtime_baseline_percentile",
-        "_daily_mean_core_day_demand_baseline_baseline_percentile",
-        "percent_savings_baseline_regional",
-        "avoided_daily_mean_core_day_runtime_baseline_regional",
-        "avoided_total_core_day_runtime_baseline_regional",
-        "baseline_daily_mean_core_day_runtime_baseline_regional",
-        "baseline_total_core_day_runtime_baseline_regional",
-        "_daily_mean_core_day_demand_baseline_baseline_regional",
-        "percent_savings_baseline_hourly_regional",
-        "avoided_daily_mean_core_day_runtime_baseline_hourly_regional",
-        "avoided_total_core_day_runtime_baseline_hourly_regional",
-        "baseline_daily_mean_core_day_runtime_baseline_hourly_regional",
-        "baseline_total_core_day_runtime_baseline_hourly_regional",
-        "_daily_mean_core_day_demand_baseline_baseline_hourly_regional",
-        "mean_demand",
-        "alpha",
-        "tau",
-        "mean_sq_err",
-        "root_mean_sq_err",
-        "cv_root_mean_sq_err",
-        "mean_abs_err",
-        "mean_abs_pct_err",
-        "nfev",
+    )
+    + _SAVINGS_COLUMNS
+    + (
         "total_core_cooling_runtime",
         "total_core_heating_runtime",
         "total_auxiliary_heating_core_day_runtime",
         "total_emergency_heating_core_day_runtime",
         "daily_mean_core_cooling_runtime",
         "daily_mean_core_heating_runtime",
-        "core_mean_indoor_temperature",
-        "core_mean_outdoor_temperature",
-        "heat_gain_constant",
-        "heat_loss_constant",
-        "hvac_constant",
-        "overall_temperature_variance",
-        "weekly_temperature_variance",
-        "avg_daily_cooling_runtime",
-        "avg_daily_heating_runtime",
-        "avg_daily_auxiliary_runtime",
-        "avg_daily_emergency_runtime",
-        "lm_intercept",
-        "lm_intercept_se",
-        "lm_main_slope",
-        "lm_main_slope_se",
-        "lm_secondary_slope",
-        "lm_secondary_slope_se",
-        "lm_cvrmse",
-        "lm_rsquared",
-        "excess_resistance_score_1hr",
-        "excess_resistance_score_2hr",
-        "excess_resistance_score_3hr",
-    ]
+    )
+    + _MODEL_COLUMNS
+    + _EXCESS_RESISTANCE_COLUMNS
     + RHU_COLUMNS
     + RHU2_IQFLT_COLUMNS
 )
 
-EXPORT_COLUMNS = [
+EXPORT_COLUMNS = (
     "sw_version",
     "ct_identifier",
     "heat_type",
@@ -334,9 +251,9 @@ EXPORT_COLUMNS = [
     "excess_resistance_score_1hr",
     "excess_resistance_score_2hr",
     "excess_resistance_score_3hr",
-] + RHU_COLUMNS
+) + RHU_COLUMNS
 
-CERTIFICATION_HEADERS = [
+CERTIFICATION_HEADERS = (
     "product_id",
     "sw_version",
     "metric",
@@ -345,4 +262,20 @@ CERTIFICATION_HEADERS = [
     "statistic",
     "season",
     "value",
-]
+)
+
+# Position of each column in the exported files.
+EXPORT_COLUMN_POSITIONS = {column: i for i, column in enumerate(EXPORT_COLUMNS)}
+CERTIFICATION_HEADERS_POSITIONS = {
+    column: i for i, column in enumerate(CERTIFICATION_HEADERS)
+}
+
+# Set forms of the column lists above for membership tests; iterate over the
+# lists when order matters.
+REAL_OR_INTEGER_VALUED_COLUMNS_HEATING_SET = frozenset(
+    REAL_OR_INTEGER_VALUED_COLUMNS_HEATING
+)
+REAL_OR_INTEGER_VALUED_COLUMNS_COOLING_SET = frozenset(
+    REAL_OR_INTEGER_VALUED_COLUMNS_COOLING
+)
+REAL_OR_INTEGER_VALUED_COLUMNS_ALL_SET = frozenset(REAL_OR_INTEGER_VALUED_COLUMNS_ALL)
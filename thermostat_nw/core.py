@@ -1,6 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from collections import namedtuple
-import inspect
+from functools import lru_cache, partial, wraps
+from itertools import product
+import sys
 import warnings
 import logging
 
@@ -9,7 +11,7 @@ import numpy as np
 from scipy.optimize import leastsq, least_squares
 from scipy.special import erf
 from scipy import integrate
-import statsmodels.formula.api as smf
+import statsmodels.api as sm
 
 from thermostat_nw import get_version
 from thermostat_nw.climate_zone import retrieve_climate_zone
@@ -25,16 +27,104 @@ from thermostat_nw.equipment_type import (
     validate_cool_stage,
 )
 
-from pkg_resources import resource_stream, resource_exists
+from pkg_resources import resource_stream, resource_listdir
 
 warnings.simplefilter("module", Warning)
 
 # Ignore divide-by-zero errors
 np.seterr(divide="ignore", invalid="ignore")
 
-CoreDaySet = namedtuple(
-    "CoreDaySet", ["name", "daily", "hourly", "start_date", "end_date"]
-)
+
+class CoreDaySet(object):
+    """A set of core heating or cooling days.
+
+    Attributes
+    ----------
+    name : str
+        Name of the core day set (e.g. "heating_ALL", "cooling_2012").
+    daily : pd.Series
+        Boolean daily mask of the days in the set.
+    start_date : datetime.datetime
+        Start of the period the set was selected from.
+    end_date : datetime.datetime
+        End of the period the set was selected from.
+    hourly : pd.Series
+        Boolean hourly mask of the hours in the set. Built from daily on first
+        access.
+    daily_values, hourly_values : np.ndarray
+        The daily and hourly masks as boolean arrays, for code that does not
+        need the index.
+    daily_index : pd.DatetimeIndex
+        The days in the set.
+    n_days, n_hours : int
+        Number of days and hours in the set.
+    """
+
+    __slots__ = (
+        "name",
+        "daily",
+        "start_date",
+        "end_date",
+        "_hourly_values",
+        "_hourly",
+        "_daily_index",
+        "_n_days",
+    )
+
+    def __init__(self, name, daily, start_date, end_date):
+        self.name = name
+        self.daily = daily
+        self.start_date = start_date
+        self.end_date = end_date
+        self._hourly_values = None
+        self._hourly = None
+        self._daily_index = None
+        self._n_days = None
+
+    def __repr__(self):
+        return "CoreDaySet(name={!r}, start_date={!r}, end_date={!r})".format(
+            self.name, self.start_date, self.end_date
+        )
+
+    @property
+    def daily_values(self):
+        return self.daily.values
+
+    @property
+    def hourly_values(self):
+        if self._hourly_values is None:
+            self._hourly_values = np.repeat(self.daily.values, 24)
+        return self._hourly_values
+
+    @property
+    def daily_index(self):
+        if self._daily_index is None:
+            self._daily_index = self.daily.index[self.daily.values]
+        return self._daily_index
+
+    @property
+    def n_days(self):
+        if self._n_days is None:
+            self._n_days = np.count_nonzero(self.daily.values)
+        return self._n_days
+
+    @property
+    def n_hours(self):
+        return 24 * self.n_days
+
+    @property
+    def hourly(self):
+        if self._hourly is None:
+            if len(self.daily) == 0:
+                # No first day to start the hourly index from
+                self._hourly = pd.Series([], index=pd.DatetimeIndex([]), dtype=bool)
+            else:
+                index = _hourly_index(
+                    self.daily.index[0], self.daily.index.shape[0] * 24
+                )
+                self._hourly = pd.Series(self.hourly_values, index)
+        return self._hourly
+
 
 logger = logging.getLogger("epathermostat")
 
@@ -43,22 +133,54 @@ VAR_MIN_RHU_RUNTIME = 30 * 60  # Unit is in minutes (30 hours * 60 minutes)
 RESISTANCE_HEAT_USE_BINS_MIN_TEMP = 0  # Unit is 1 degree F.
 RESISTANCE_HEAT_USE_BINS_MAX_TEMP = 60  # Unit is 1 degree F.
 RESISTANCE_HEAT_USE_BIN_TEMP_WIDTH = 5  # Unit is 1 degree F.
-RESISTANCE_HEAT_USE_BIN = list(
-    t
-    for t in range(
-        RESISTANCE_HEAT_USE_BINS_MIN_TEMP,
-        RESISTANCE_HEAT_USE_BINS_MAX_TEMP + RESISTANCE_HEAT_USE_BIN_TEMP_WIDTH,
-        RESISTANCE_HEAT_USE_BIN_TEMP_WIDTH,
-    )
+# Bin edges, and the (low, high) pair of each bin, as arrays for vectorized
+# binning (e.g. with np.digitize).
+RESISTANCE_HEAT_USE_BINS_ARR = np.arange(
+    RESISTANCE_HEAT_USE_BINS_MIN_TEMP,
+    RESISTANCE_HEAT_USE_BINS_MAX_TEMP + RESISTANCE_HEAT_USE_BIN_TEMP_WIDTH,
+    RESISTANCE_HEAT_USE_BIN_TEMP_WIDTH,
+    dtype=np.int8,
 )
+RESISTANCE_HEAT_USE_BIN_PAIRS_ARR = np.stack(
+    [RESISTANCE_HEAT_USE_BINS_ARR[:-1], RESISTANCE_HEAT_USE_BINS_ARR[1:]], axis=1
+)
+RESISTANCE_HEAT_USE_BIN = RESISTANCE_HEAT_USE_BINS_ARR.tolist()
 RESISTANCE_HEAT_USE_BIN_PAIRS = [
-    (RESISTANCE_HEAT_USE_BIN[x], RESISTANCE_HEAT_USE_BIN[x + 1])
-    for x in range(0, len(RESISTANCE_HEAT_USE_BIN) - 1)
+    tuple(pair) for pair in RESISTANCE_HEAT_USE_BIN_PAIRS_ARR.tolist()
 ]
 
 RESISTANCE_HEAT_USE_WIDE_BIN = [30, 45]
 RESISTANCE_HEAT_USE_WIDE_BIN_PAIRS = [(30, 45)]
 
+
+@lru_cache(maxsize=None)
+def _format_rhu_column(rhu_type, low, high, duty_cycle):
+    """Column name of an RHU score; see Thermostat._format_rhu. Each name is
+    formatted once per process.
+    """
+    format_string = "{rhu_type}_{low:02d}F_to_{high:02d}F"
+    if low == -np.inf:
+        format_string = "{rhu_type}_less{high:02d}F"
+        low = 0  # Don't need this value so we zero it out
+    if high == np.inf:
+        format_string = "{rhu_type}_greater{low:02d}F"
+        high = 0  # Don't need this value so we zero it out
+
+    result = format_string.format(rhu_type=rhu_type, low=int(low), high=int(high))
+    if duty_cycle is not None:
+        result = "_".join((result, duty_cycle))
+    return result
+
+
+# The column names of the fixed RHU bins are formatted once, at import.
+for _rhu_type, (_low, _high), _duty_cycle in product(
+    ("rhu1", "rhu2"),
+    RESISTANCE_HEAT_USE_BIN_PAIRS + RESISTANCE_HEAT_USE_WIDE_BIN_PAIRS,
+    (None, "aux_duty_cycle", "emg_duty_cycle", "compressor_duty_cycle"),
+):
+    _format_rhu_column(_rhu_type, _low, _high, _duty_cycle)
+
+
 # FIXME: Turning off these warnings for now
 pd.set_option("mode.chained_assignment", None)
 
@@ -98,15 +220,440 @@ def avoided(baseline, observed):
 
 
 def percent_savings(avoided, baseline, thermostat_id):
-    savings = np.divide(avoided.mean(), baseline.mean()) * 100.0
+    # Scalar division on a NumPy float: a zero baseline still gives inf or nan
+    # like np.divide, without the ufunc call.
+    savings = avoided.mean() / np.float64(baseline.mean()) * 100.0
     return savings
 
 
+def _savings_summary(baseline_demand, alpha, observed):
+    """Savings of the observed daily runtimes against the baseline runtimes
+    for baseline_demand, for the savings metrics. The means are computed from
+    the totals, so each series is summed once; days with missing observed or
+    baseline runtime are skipped, like in Series.mean and Series.sum.
+
+    Returns
+    -------
+    percent_savings, avoided_daily_mean, avoided_total, baseline_daily_mean,
+    baseline_total : float
+    """
+    baseline = _baseline_runtime(baseline_demand, alpha)
+    avoided_runtime = avoided(baseline, observed)
+    missing = np.isnan(avoided_runtime)
+    if missing.any():
+        avoided_runtime[missing] = 0.0
+    n_observed = missing.shape[0] - missing.sum()
+
+    n_baseline = baseline.shape[0] - np.isnan(baseline).sum()
+
+    avoided_total = avoided_runtime.sum()
+    baseline_total = np.nansum(baseline)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avoided_daily_mean = avoided_total / np.float64(n_observed)
+        baseline_daily_mean = baseline_total / np.float64(n_baseline)
+        savings = avoided_daily_mean / baseline_daily_mean * 100.0
+    return (
+        savings,
+        avoided_daily_mean,
+        avoided_total,
+        baseline_daily_mean,
+        baseline_total,
+    )
+
+
+# Names of the savings metrics outputs of each baseline: the values of
+# _savings_summary, then the mean baseline demand.
+_SAVINGS_OUTPUT_NAMES = {
+    baseline: tuple(
+        name.format(baseline)
+        for name in (
+            "percent_savings_{}",
+            "avoided_daily_mean_core_day_runtime_{}",
+            "avoided_total_core_day_runtime_{}",
+            "baseline_daily_mean_core_day_runtime_{}",
+            "baseline_total_core_day_runtime_{}",
+            "_daily_mean_core_day_demand_baseline_{}",
+        )
+    )
+    for baseline in (
+        "baseline_percentile",
+        "baseline_regional",
+        "baseline_hourly_regional",
+    )
+}
+
+
+def _savings_outputs(baselines, baseline_demands, alpha, observed):
+    """Savings metrics outputs of every baseline of _SAVINGS_OUTPUT_NAMES.
+    baseline_demands holds the daily demand of each of baselines, one row per
+    baseline, and the mean demands of all rows are taken in one reduction.
+    The outputs of the other baselines are None.
+    """
+    demand_means = np.nanmean(baseline_demands, axis=1)
+    summaries = {
+        baseline: _savings_summary(baseline_demand, alpha, observed) + (demand_mean,)
+        for baseline, baseline_demand, demand_mean in zip(
+            baselines, baseline_demands, demand_means
+        )
+    }
+    outputs = {}
+    for baseline, names in _SAVINGS_OUTPUT_NAMES.items():
+        outputs.update(zip(names, summaries.get(baseline, (None,) * len(names))))
+    return outputs
+
+
+def _quantile(values, q):
+    """Quantile of the non-NaN values of an array, interpolated linearly like
+    Series.quantile, or NaN if there are none.
+    """
+    values = values[~np.isnan(values)]
+    if values.shape[0] == 0:
+        return np.nan
+    # Like pandas, pass the quantile as a percentile; np.percentile selects
+    # the neighbouring values with np.partition rather than a full sort.
+    return np.percentile(values, q * 100)
+
+
+def _baseline_runtime(baseline_demand, alpha):
+    """alpha * baseline_demand, clipped at zero, computed in a single buffer.
+    Returns a Series for a Series and an array for an array.
+    """
+    if not isinstance(baseline_demand, pd.Series):
+        runtime = np.multiply(alpha, baseline_demand, dtype=np.float64)
+        return np.maximum(runtime, 0, out=runtime)
+    runtime = np.multiply(alpha, baseline_demand.values, dtype=np.float64)
+    np.maximum(runtime, 0, out=runtime)
+    return pd.Series(runtime, index=baseline_demand.index, name=baseline_demand.name)
+
+
+def _core_day_series(core_day_set, values):
+    """Series of daily values for the days in core_day_set."""
+    return pd.Series(values, index=core_day_set.daily_index)
+
+
+def _elementwise_min(a, b):
+    """Elementwise min(a, b) of two arrays, with the NaN handling of the
+    builtin min: a, unless b is smaller.
+    """
+    with np.errstate(invalid="ignore"):
+        return np.where(b < a, b, a)
+
+
+def _shift(values, periods):
+    """Array shifted forward by periods, filled with NaN like Series.shift."""
+    shifted = np.empty(values.shape[0])
+    shifted[:periods] = np.nan
+    shifted[periods:] = values[: values.shape[0] - periods]
+    return shifted
+
+
+@lru_cache(maxsize=16)
+def _bin_index(bins):
+    """Edges array of the tuple of bin edges bins, and the index of the bins
+    like that of a groupby of pd.cut, built once per set of bin edges.
+    """
+    intervals = pd.IntervalIndex.from_breaks(bins)
+    index = pd.CategoricalIndex(
+        intervals, categories=intervals, ordered=True, name="bins"
+    )
+    return np.asarray(bins), index
+
+
+def _sum_by_bin(runtime_temp, bins, columns):
+    """Sums columns of runtime_temp by bin of its temperature column, with a
+    row for every bin, indexed by the bin intervals like a groupby of pd.cut.
+
+    The sums are taken with a single bincount over all the columns, column k
+    counting into bins k * n_bins onwards, rather than pd.cut and groupby.
+    Bins are closed on the right like pd.cut, rows outside the bins or without
+    a temperature are dropped, and missing values are skipped like in
+    groupby().sum().
+    """
+    edges, index = _bin_index(tuple(bins))
+    n_bins = len(index)
+    bin_idx = np.digitize(runtime_temp["temperature"].values, edges, right=True) - 1
+    in_bins = (bin_idx >= 0) & (bin_idx < n_bins)
+    bin_idx = bin_idx[in_bins]
+    weights = np.empty((len(columns), bin_idx.shape[0]))
+    for row, column in zip(weights, columns):
+        row[:] = runtime_temp[column].values[in_bins]
+    np.nan_to_num(weights, copy=False)
+    offsets = np.arange(0, len(columns) * n_bins, n_bins)
+    sums = np.bincount(
+        (bin_idx + offsets[:, np.newaxis]).ravel(),
+        weights=weights.ravel(),
+        minlength=len(columns) * n_bins,
+    ).reshape(len(columns), n_bins)
+    return pd.DataFrame(
+        dict(zip(columns, sums)),
+        index=index,
+        columns=columns,
+    ).astype(runtime_temp[columns].dtypes)
+
+
+def _temperature_gradient(temp_in, temp_out_minus_in, runtime=None):
+    """Change in indoor temperature since the previous hour divided by the
+    outdoor minus indoor temperature and, if given, by the runtime in this
+    hour and multiplied by 60. Divisors smaller than 0.1 in magnitude are taken
+    as 0.1, and the first hour is NaN. Computed in place in one buffer.
+    """
+    temp_gradient = np.empty(temp_in.shape[0])
+    temp_gradient[:1] = np.nan
+    gradient = temp_gradient[1:]
+    np.subtract(temp_in[1:], temp_in[:-1], out=gradient)
+    divisors = [temp_out_minus_in] if runtime is None else [temp_out_minus_in, runtime]
+    with np.errstate(invalid="ignore"):
+        for divisor in divisors:
+            divisor = divisor[1:]
+            np.divide(
+                gradient, np.where(np.abs(divisor) < 0.1, 0.1, divisor), out=gradient
+            )
+    if runtime is not None:
+        np.multiply(gradient, 60, out=gradient)
+    return temp_gradient
+
+
+def _daily_values(daily, index, fill_value):
+    """Values of the daily series on the days of index, as an array. Days
+    missing from daily take fill_value; the series is only reindexed if its
+    days differ.
+    """
+    if daily.index.equals(index):
+        return daily.values
+    return daily.reindex(index, fill_value=fill_value).values
+
+
+def _is_whole_days_hourly(index):
+    """True if index is regular hourly data covering whole days, starting at
+    midnight, so that it can be reshaped to (days, 24).
+    """
+    return (
+        len(index) > 0
+        and len(index) % 24 == 0
+        and getattr(index, "freqstr", None) == "H"
+        and index[0] == index[0].normalize()
+    )
+
+
+_NS_PER_HOUR = pd.Timedelta(hours=1).value
+
+
+def _daily_grid(values, index):
+    """Places hourly values on a (days, 24) grid, with one row for each
+    calendar day in index, in order, and NaN for the hours of those days that
+    are not in index. index is an hourly DatetimeIndex which need not cover
+    whole days. A 2-d values holds one series of hours per row and gives a
+    (rows, days, 24) grid.
+    """
+    hour = index.asi8 // _NS_PER_HOUR
+    days, day = np.unique(hour // 24, return_inverse=True)
+    grid = np.full(values.shape[:-1] + (days.shape[0] * 24,), np.nan)
+    grid[..., day * 24 + hour % 24] = values
+    return grid.reshape(values.shape[:-1] + (-1, 24))
+
+
+def _degree_hour_deltas(delta, sign, index=None):
+    """Prepares hourly temperature differences for _daily_degree_days.
+
+    The differences are multiplied by sign (-1 for cooling, 1 for heating), so
+    that the degree hours are [delta - sign * tau]_+, and reshaped to
+    (days, 24), with missing hours set to -inf so that they give zero degree
+    hours for any tau. Hours which do not cover whole days are placed on the
+    days of their index by _daily_grid. A 2-d delta holds one series of hours
+    per row and is reshaped to (rows, days, 24).
+    """
+    delta = sign * delta
+    if index is None:
+        delta = delta.reshape(delta.shape[:-1] + (-1, 24))
+    else:
+        delta = _daily_grid(delta, index)
+    return np.where(np.isnan(delta), -np.inf, delta)
+
+
+def _daily_degree_days(delta, tau, sign):
+    """Daily degree days, the sum of the day's hourly [delta - sign * tau]_+
+    divided by 24, for differences prepared by _degree_hour_deltas.
+
+    The division by 24 should be thought of as a unit conversion, not an
+    average.
+    """
+    degree_hours = delta - sign * tau
+    np.maximum(degree_hours, 0.0, out=degree_hours)
+    return degree_hours.sum(axis=-1) / 24
+
+
+def _hour_of_year(index):
+    """Hour of year (1 to 8760) of each timestamp in a DatetimeIndex, as used
+    by the hourly temperature baselines. In leap years, days from February
+    28th on take the hours of the day before, so February 27th and 28th share
+    their hours.
+    """
+    # Computed in place on a single int64 array: the zero-based day of year,
+    # less the leap day adjustment, in hours, plus the hour.
+    hour_of_year = index.dayofyear.values - 1
+    hour_of_year -= index.is_leap_year & (hour_of_year >= 58)
+    hour_of_year *= 24
+    hour_of_year += index.hour.values
+    hour_of_year += 1
+    return hour_of_year
+
+
+def _baseline_by_hour_of_year(temp_baseline):
+    """Lookup array of the baseline indoor temperatures in temp_baseline,
+    indexed by hour of year. Hours missing from the baseline are NaN.
+    """
+    hour_of_year = temp_baseline["hour_of_year"].values
+    baseline = np.full(hour_of_year.max() + 1, np.nan)
+    baseline[hour_of_year] = temp_baseline["temperature_in"].values
+    return baseline
+
+
+@lru_cache(maxsize=32)
+def _hourly_index(start, periods):
+    """Hourly DatetimeIndex shared by the hourly masks of core day sets that
+    span the same days.
+    """
+    return pd.date_range(start=start, periods=periods, freq="H")
+
+
+@lru_cache(maxsize=256)
+def _isoformat(date):
+    """ISO 8601 form of a core day set start or end date for the metrics
+    outputs. Core day sets of different thermostats mostly share dates.
+    """
+    return pd.Timestamp(date).to_pydatetime().isoformat()
+
+
+@lru_cache(maxsize=64)
+def _load_resource_csv(package, filename, dtype=None):
+    """Read a CSV file bundled with the package. Results are cached, so treat
+    the returned DataFrame as read-only and copy it before modifying it.
+    """
+    with resource_stream(package, filename) as f:
+        return pd.read_csv(f, dtype=dtype)
+
+
+@lru_cache(maxsize=None)
+def _list_resources(package):
+    """Names of the resource files bundled in package."""
+    return frozenset(resource_listdir(package, ""))
+
+
+@lru_cache(maxsize=None)
+def _zipcode_zone_map(filename):
+    """Map each zipcode in a bundled climate zone mapping file to its
+    (heating_zone, cooling_zone). The first row wins for repeated zipcodes.
+    """
+    mapping = _load_resource_csv("thermostat_nw.resources", filename, dtype=str)
+    zones = zip(mapping.heating_zone.values, mapping.cooling_zone.values)
+    return dict(reversed(list(zip(mapping.zipcode.values, zones))))
+
+
+# Thermostat attributes set by get_climate_zones and find_baselines.
+_CLIMATE_ZONE_ATTRIBUTES = frozenset(("heating_zone_nw", "cooling_zone_nw"))
+_BASELINE_ATTRIBUTES = frozenset(
+    (
+        "runtime_heatpump_baseline",
+        "hourly_temperature_baseline_heating",
+        "hourly_temperature_baseline_cooling",
+    )
+)
+
+
+def _requires(*guards):
+    """Decorator for Thermostat methods which are specific to some equipment.
+    Each guard (e.g. Thermostat._protect_heating) is called, in order, with
+    the method name before the method runs, so that no stack inspection is
+    needed to name the method in the error.
+    """
+
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            for guard in guards:
+                guard(self, name)
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _hourly_input(name, doc):
+    """Property for an hourly input series of Thermostat. Assigning it drops
+    the caches computed from the hourly data, as in
+    Thermostat._invalidate_daily_cache.
+    """
+    attribute = "_" + name
+
+    def fget(self):
+        return self.__dict__[attribute]
+
+    def fset(self, value):
+        self.__dict__[attribute] = value
+        self._invalidate_daily_cache()
+
+    return property(fget, fset, doc=doc)
+
+
+def _cached_per_core_day_set(method):
+    """Decorator for Thermostat methods of a core day set alone. The result is
+    cached per core day set, and dropped with the other caches of the hourly
+    data by Thermostat._invalidate_daily_cache.
+
+    The core day set itself is the key (CoreDaySet compares by identity), so
+    a cached result cannot be returned for another set that reuses its id().
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, core_day_set):
+        key = (name, core_day_set)
+        if key not in self._core_day_set_cache:
+            self._core_day_set_cache[key] = method(self, core_day_set)
+        return self._core_day_set_cache[key]
+
+    return wrapper
+
+
+def _python_scalars(outputs):
+    """outputs with its NumPy scalars replaced by the equal Python float, int
+    or bool, which take less memory and pickle and serialize faster.
+    """
+    return {
+        name: value.item() if isinstance(value, np.generic) else value
+        for name, value in outputs.items()
+    }
+
+
+def _core_day_set_metrics(thermostat, task):
+    """Runs Thermostat._core_day_set_metrics on one task. This function is
+    necessary for the process pool in
+    Thermostat.calculate_epa_field_savings_metrics, as map needs a picklable
+    function to run on.
+    """
+    return thermostat._core_day_set_metrics(*task)
+
+
+# Result of fit_linear_cooling_model and fit_linear_heating_model when there
+# is nothing to fit.
+_NO_LINEAR_MODEL = (np.nan,) * 11
+
+
 class Thermostat(object):
     """Main thermostat data container. Each parameter which contains
     timeseries data should be a pandas.Series with a datetimeIndex, and that
     each index should be equivalent.
 
+    Values derived from the hourly series (daily resamples, temperature
+    differences, core day set constants) are cached. Assigning
+    ``temperature_in``, ``temperature_out``, ``cool_runtime_hourly``,
+    ``heat_runtime_hourly``, ``auxiliary_heat_runtime`` or
+    ``emergency_heat_runtime`` drops these caches; after modifying one of
+    these series in place, call ``_invalidate_daily_cache()``.
+
     Parameters
     ----------
     thermostat_id : object
@@ -199,21 +746,21 @@ class Thermostat(object):
         self.zipcode = zipcode
         self.station = station
 
+        # Assigning the hourly inputs below drops these caches.
+        self._daily_cache = {}
+        self._core_day_set_cache = {}
+
         self.temperature_in = self._interpolate(temperature_in, method="linear")
         self.temperature_out = self._interpolate(temperature_out, method="linear")
 
         self.cool_runtime_hourly = cool_runtime
         self.heat_runtime_hourly = heat_runtime
         if hasattr(cool_runtime, "empty") and cool_runtime.empty is False:
-            self.cool_runtime_daily = cool_runtime.resample("D").agg(
-                pd.Series.sum, skipna=False
-            )
+            self.cool_runtime_daily = self._hourly_to_daily_sum(cool_runtime)
         else:
             self.cool_runtime_daily = pd.Series()
         if hasattr(heat_runtime, "empty") and heat_runtime.empty is False:
-            self.heat_runtime_daily = heat_runtime.resample("D").agg(
-                pd.Series.sum, skipna=False
-            )
+            self.heat_runtime_daily = self._hourly_to_daily_sum(heat_runtime)
         else:
             self.heat_runtime_daily = pd.Series()
         self.auxiliary_heat_runtime = auxiliary_heat_runtime
@@ -222,8 +769,8 @@ class Thermostat(object):
             hasattr(auxiliary_heat_runtime, "empty")
             and auxiliary_heat_runtime.empty is False
         ):
-            self.auxiliary_runtime_daily = auxiliary_heat_runtime.resample("D").agg(
-                pd.Series.sum, skipna=False
+            self.auxiliary_runtime_daily = self._hourly_to_daily_sum(
+                auxiliary_heat_runtime
             )
         else:
             self.auxiliary_runtime_daily = pd.Series()
@@ -231,8 +778,8 @@ class Thermostat(object):
             hasattr(emergency_heat_runtime, "empty")
             and emergency_heat_runtime.empty is False
         ):
-            self.emergency_runtime_daily = emergency_heat_runtime.resample("D").agg(
-                pd.Series.sum, skipna=False
+            self.emergency_runtime_daily = self._hourly_to_daily_sum(
+                emergency_heat_runtime
             )
         else:
             self.emergency_runtime_daily = pd.Series()
@@ -241,8 +788,123 @@ class Thermostat(object):
         self.tau = None
         self.hourly_temperature_baseline = None
         self.validate()
-        self.get_climate_zones()
-        self.find_baselines()
+
+    def __getattr__(self, name):
+        # The climate zones and baselines are only looked up when first used,
+        # by get_climate_zones and find_baselines, which set them as ordinary
+        # attributes.
+        if name in _CLIMATE_ZONE_ATTRIBUTES:
+            self.get_climate_zones()
+        elif name in _BASELINE_ATTRIBUTES:
+            self.find_baselines()
+        else:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+            )
+        return self.__dict__[name]
+
+    def _daily_resample(self, name, how):
+        # Daily resamples of the hourly series, computed on first use.
+        key = (name, how)
+        if key not in self._daily_cache:
+            resampler = getattr(self, name).resample("D")
+            self._daily_cache[key] = getattr(resampler, how)()
+        return self._daily_cache[key]
+
+    temperature_in = _hourly_input("temperature_in", "Hourly indoor temperature.")
+    temperature_out = _hourly_input("temperature_out", "Hourly outdoor temperature.")
+    cool_runtime_hourly = _hourly_input(
+        "cool_runtime_hourly", "Hourly cooling runtime."
+    )
+    heat_runtime_hourly = _hourly_input(
+        "heat_runtime_hourly", "Hourly heating runtime."
+    )
+    auxiliary_heat_runtime = _hourly_input(
+        "auxiliary_heat_runtime", "Hourly auxiliary heat runtime."
+    )
+    emergency_heat_runtime = _hourly_input(
+        "emergency_heat_runtime", "Hourly emergency heat runtime."
+    )
+
+    def _invalidate_daily_cache(self):
+        """Drops the cached daily resamples, temperature validity, hourly
+        temperature difference, hours of year, heat pump runtimes and core day
+        set constants. Called when an hourly input series is assigned; call it
+        after changing hourly data in place.
+        """
+        self._daily_cache.clear()
+        self._core_day_set_cache.clear()
+        self._enough_temp_daily_cache = None
+        self._hourly_deltaT = None
+        self._hour_of_year = None
+        self._full_heat_runtime_hourly = None
+        self._adjusted_heat_runtime_hourly = None
+
+    @property
+    def hourly_deltaT(self):
+        """Hourly indoor minus outdoor temperature."""
+        if self._hourly_deltaT is None:
+            self._hourly_deltaT = self.temperature_in - self.temperature_out
+        return self._hourly_deltaT
+
+    @property
+    def hour_of_year(self):
+        """NWMOD: Hour of year of each hour, as used by the hourly temperature
+        baselines.
+        """
+        if self._hour_of_year is None:
+            self._hour_of_year = _hour_of_year(self.temperature_in.index)
+        return self._hour_of_year
+
+    @property
+    def full_heat_runtime_hourly(self):
+        """NWMOD: Hourly heat pump runtime, in minutes, that would match a full
+        hour at rated capacity, given the capacity at the outdoor temperature.
+        """
+        if self._full_heat_runtime_hourly is None:
+            self._full_heat_runtime_hourly = 60 * (
+                1 - 0.012 * (47 - self.temperature_out)
+            )
+        return self._full_heat_runtime_hourly
+
+    @property
+    def adjusted_heat_runtime_hourly(self):
+        """NWMOD: Hourly heat runtime adjusted for the heat pump capacity at the
+        outdoor temperature.
+        """
+        if self._adjusted_heat_runtime_hourly is None:
+            self._adjusted_heat_runtime_hourly = self.heat_runtime_hourly * (
+                1 - 0.012 * (47 - self.temperature_out)
+            )
+        return self._adjusted_heat_runtime_hourly
+
+    def _core_hours(self, core_day_set):
+        """Boolean array marking the hours of ``core_day_set`` in the hourly
+        index of this thermostat.
+        """
+        index = self.temperature_in.index
+        if core_day_set.hourly.index.equals(index):
+            return core_day_set.hourly_values
+        return core_day_set.hourly.reindex(index, fill_value=False).values
+
+    @property
+    def temperature_out_daily(self):
+        """Daily mean outdoor temperature."""
+        return self._daily_resample("temperature_out", "mean")
+
+    @property
+    def auxiliary_heat_runtime_daily(self):
+        """Daily auxiliary heat runtime, ignoring missing hours (unlike
+        ``auxiliary_runtime_daily``, which is NaN for days with missing hours).
+        """
+        return self._daily_resample("auxiliary_heat_runtime", "sum")
+
+    @property
+    def emergency_heat_runtime_daily(self):
+        """Daily emergency heat runtime, ignoring missing hours (unlike
+        ``emergency_runtime_daily``, which is NaN for days with missing hours).
+        """
+        return self._daily_resample("emergency_heat_runtime", "sum")
 
     def validate(self):
         # Generate warnings for invalid heating / cooling types and stages
@@ -258,38 +920,28 @@ class Thermostat(object):
 
     def get_climate_zones(self):
         northwest_climate_zone_filename = "northwest_climate_zone_mapping.csv"
-        if not resource_exists(
-            "thermostat_nw.resources", northwest_climate_zone_filename
+        if northwest_climate_zone_filename not in _list_resources(
+            "thermostat_nw.resources"
         ):
             self.heating_zone_nw = None
             self.cooling_zone_nw = None
             return None
-        with resource_stream(
-            "thermostat_nw.resources", "northwest_climate_zone_mapping.csv"
-        ) as f:
-            mapping = pd.read_csv(f, dtype=str)
-        try:
-            self.heating_zone_nw = mapping.loc[
-                mapping.zipcode == self.zipcode, "heating_zone"
-            ].iloc[0]
-        except IndexError:
-            self.heating_zone_nw = None
-        try:
-            self.cooling_zone_nw = mapping.loc[
-                mapping.zipcode == self.zipcode, "cooling_zone"
-            ].iloc[0]
-        except:
-            self.cooling_zone_nw = None
+        self.heating_zone_nw, self.cooling_zone_nw = _zipcode_zone_map(
+            northwest_climate_zone_filename
+        ).get(self.zipcode, (None, None))
 
     def find_baselines(self):
         heatpump_baseline_filename = f"heatpump_baseline_nw_hz{self.heating_zone_nw}_cz{self.cooling_zone_nw}.csv"
-        if not resource_exists("thermostat_nw.resources", heatpump_baseline_filename):
+        if heatpump_baseline_filename not in _list_resources("thermostat_nw.resources"):
             heatpump_baseline_filename = "heatpump_baseline_default.csv"
-        with resource_stream(
+        # Shared between thermostats; treat as read-only.
+        self.runtime_heatpump_baseline = _load_resource_csv(
             "thermostat_nw.resources", heatpump_baseline_filename
-        ) as f:
-            self.runtime_heatpump_baseline = pd.read_csv(f)
+        )
 
+        temperature_baselines = _list_resources(
+            "thermostat_nw.resources.temperature_baselines_nw"
+        )
         if self.heat_type.startswith("heat_pump"):
             heat_type = "heat_pump"
         else:
@@ -297,44 +949,30 @@ class Thermostat(object):
         heat_temperature_baseline_filename = (
             f"temperature_baseline_hz{self.heating_zone_nw}_{heat_type}.csv"
         )
-        if not resource_exists(
-            "thermostat_nw.resources.temperature_baselines_nw",
-            heat_temperature_baseline_filename,
-        ):
+        if heat_temperature_baseline_filename not in temperature_baselines:
             heat_temperature_baseline_filename = (
-                "temperature_baseline_hz{self.heating_zone_nw}_default.csv"
+                f"temperature_baseline_hz{self.heating_zone_nw}_default.csv"
             )
-        if not resource_exists(
-            "thermostat_nw.resources.temperature_baselines_nw",
-            heat_temperature_baseline_filename,
-        ):
+        if heat_temperature_baseline_filename not in temperature_baselines:
             heat_temperature_baseline_filename = "temperature_baseline_default.csv"
-        with resource_stream(
+        self.hourly_temperature_baseline_heating = _load_resource_csv(
             "thermostat_nw.resources.temperature_baselines_nw",
             heat_temperature_baseline_filename,
-        ) as f:
-            self.hourly_temperature_baseline_heating = pd.read_csv(f)
+        )
 
         cool_temperature_baseline_filename = (
             f"temperature_baseline_cz{self.cooling_zone_nw}_{self.cool_type}.csv"
         )
-        if not resource_exists(
-            "thermostat_nw.resources.temperature_baselines_nw",
-            cool_temperature_baseline_filename,
-        ):
+        if cool_temperature_baseline_filename not in temperature_baselines:
             cool_temperature_baseline_filename = (
-                "temperature_baseline_cz{self.cooling_zone_nw}_default.csv"
+                f"temperature_baseline_cz{self.cooling_zone_nw}_default.csv"
             )
-        if not resource_exists(
-            "thermostat_nw.resources.temperature_baselines_nw",
-            cool_temperature_baseline_filename,
-        ):
+        if cool_temperature_baseline_filename not in temperature_baselines:
             cool_temperature_baseline_filename = "temperature_baseline_default.csv"
-        with resource_stream(
+        self.hourly_temperature_baseline_cooling = _load_resource_csv(
             "thermostat_nw.resources.temperature_baselines_nw",
             cool_temperature_baseline_filename,
-        ) as f:
-            self.hourly_temperature_baseline_cooling = pd.read_csv(f)
+        )
 
     def _format_rhu(self, rhu_type, low, high, duty_cycle):
         """Formats the RHU scores for output
@@ -352,18 +990,7 @@ class Thermostat(object):
         result : str
             Formatted string for the RHU type (e.g. 'rhu1_05F_to_10F_aux_duty_cycle')
         """
-        format_string = "{rhu_type}_{low:02d}F_to_{high:02d}F"
-        if low == -np.inf:
-            format_string = "{rhu_type}_less{high:02d}F"
-            low = 0  # Don't need this value so we zero it out
-        if high == np.inf:
-            format_string = "{rhu_type}_greater{low:02d}F"
-            high = 0  # Don't need this value so we zero it out
-
-        result = format_string.format(rhu_type=rhu_type, low=int(low), high=int(high))
-        if duty_cycle is not None:
-            result = "_".join((result, duty_cycle))
-        return result
+        return _format_rhu_column(rhu_type, low, high, duty_cycle)
 
     def _validate_heating(self):
         if self.has_heating:
@@ -406,38 +1033,59 @@ class Thermostat(object):
     def _interpolate(self, series, method="linear"):
         if method not in ["linear"]:
             return series
-        return series.interpolate(method="linear", limit=1, limit_direction="both")
-
-    def _protect_heating(self):
-        function_name = inspect.stack()[1][3]
+        if series.dtype.kind != "f":
+            return series.interpolate(method="linear", limit=1, limit_direction="both")
+
+        # Same result as series.interpolate(method="linear", limit=1,
+        # limit_direction="both"): each missing value next to a valid value is
+        # filled by linear interpolation on its position, holding the first or
+        # last valid value constant at the ends.
+        values = series.values.astype(np.float64)
+        invalid = np.isnan(values)
+        if invalid.any() and not invalid.all():
+            valid = ~invalid
+            next_to_valid = np.zeros_like(invalid)
+            next_to_valid[1:] |= valid[:-1]
+            next_to_valid[:-1] |= valid[1:]
+            fill = invalid & next_to_valid
+            positions = np.arange(values.shape[0])
+            values[fill] = np.interp(positions[fill], positions[valid], values[valid])
+        return pd.Series(values, index=series.index, name=series.name)
+
+    def _protect_heating(self, function_name=None):
         if not (self.has_heating):
+            if function_name is None:
+                function_name = sys._getframe(1).f_code.co_name
             message = (
                 "The function '{}', which is heating specific, cannot be"
                 " called for equipment_type {}".format(function_name, self.heat_type)
             )
             raise ValueError(message)
 
-    def _protect_cooling(self):
-        function_name = inspect.stack()[1][3]
+    def _protect_cooling(self, function_name=None):
         if not (self.has_cooling):
+            if function_name is None:
+                function_name = sys._getframe(1).f_code.co_name
             message = (
                 "The function '{}', which is cooling specific, cannot be"
                 " called for equipment_type {}".format(function_name, self.cool_type)
             )
             raise ValueError(message)
 
-    def _protect_resistance_heat(self):
-        function_name = inspect.stack()[1][3]
+    def _protect_resistance_heat(self, function_name=None):
         if not (self.has_resistance_heat):
+            if function_name is None:
+                function_name = sys._getframe(1).f_code.co_name
             message = (
                 "The function '{}', which is resistance heat specific, cannot be"
                 " called for equipment_type {}".format(function_name, self.heat_type)
             )
             raise ValueError(message)
 
-    def _protect_aux_emerg(self):
-        function_name = inspect.stack()[1][3]
+    def _protect_aux_emerg(self, function_name=None):
         if not (self.has_auxiliary and self.has_emergency):
+            if function_name is None:
+                function_name = sys._getframe(1).f_code.co_name
             message = (
                 "The function '{}', which is auxiliary/emergency heating specific, cannot be"
                 " called for equipment_type {}".format(function_name, self.heat_type)
@@ -487,11 +1135,16 @@ class Thermostat(object):
 
         self._protect_heating()
 
-        # compute inclusion thresholds
-        meets_heating_thresholds = self.heat_runtime_daily >= min_minutes_heating
+        # compute inclusion thresholds as boolean arrays on the days of the
+        # heating runtime
+        daily_index = self.heat_runtime_daily.index
+        meets_heating_thresholds = self.heat_runtime_daily.values >= min_minutes_heating
 
         if self.has_cooling:
-            meets_cooling_thresholds = self.cool_runtime_daily <= max_minutes_cooling
+            meets_cooling_thresholds = (
+                _daily_values(self.cool_runtime_daily, daily_index, np.nan)
+                <= max_minutes_cooling
+            )
         else:
             meets_cooling_thresholds = True
 
@@ -499,15 +1152,7 @@ class Thermostat(object):
 
         # Determines if enough non-null temperature is present
         # (no more than two missing hours of temperature in / out)
-        enough_temp_in = self.temperature_in.groupby(
-            self.temperature_in.index.date
-        ).apply(lambda x: x.isnull().sum() <= 2)
-
-        enough_temp_out = self.temperature_out.groupby(
-            self.temperature_out.index.date
-        ).apply(lambda x: x.isnull().sum() <= 2)
-
-        meets_thresholds &= enough_temp_in & enough_temp_out
+        meets_thresholds &= _daily_values(self._enough_temp_daily, daily_index, False)
 
         data_start_date = np.datetime64(self.heat_runtime_daily.index[0])
         data_end_date = np.datetime64(self.heat_runtime_daily.index[-1])
@@ -522,23 +1167,22 @@ class Thermostat(object):
 
             # for each potential core day set, look for core heating days.
             core_heating_day_sets = []
+            daily_index_i8 = self.heat_runtime_daily.index.asi8
             for start_year_, end_year_ in potential_core_day_sets:
                 core_day_set_start_date = np.datetime64(datetime(start_year_, 7, 1))
                 core_day_set_end_date = np.datetime64(datetime(end_year_, 7, 1))
                 start_date = max(core_day_set_start_date, data_start_date).item()
                 end_date = min(core_day_set_end_date, data_end_date).item()
-                in_range = self._get_range_boolean(
-                    self.heat_runtime_daily.index, start_date, end_date
-                )
-                inclusion_daily = pd.Series(
-                    in_range & meets_thresholds, index=self.heat_runtime_daily.index
-                )
+                in_range = self._get_range_boolean(daily_index_i8, start_date, end_date)
+                inclusion = in_range & meets_thresholds
 
-                if any(inclusion_daily):
+                if inclusion.any():
+                    inclusion_daily = pd.Series(
+                        inclusion, index=self.heat_runtime_daily.index
+                    )
                     name = "heating_{}-{}".format(start_year_, end_year_)
-                    inclusion_hourly = self._get_hourly_boolean(inclusion_daily)
                     core_day_set = CoreDaySet(
-                        name, inclusion_daily, inclusion_hourly, start_date, end_date
+                        name, inclusion_daily, start_date, end_date
                     )
                     core_heating_day_sets.append(core_day_set)
 
@@ -548,11 +1192,9 @@ class Thermostat(object):
             inclusion_daily = pd.Series(
                 meets_thresholds, index=self.heat_runtime_daily.index
             )
-            inclusion_hourly = self._get_hourly_boolean(inclusion_daily)
             core_heating_day_set = CoreDaySet(
                 "heating_ALL",
                 inclusion_daily,
-                inclusion_hourly,
                 data_start_date,
                 data_end_date,
             )
@@ -606,25 +1248,23 @@ class Thermostat(object):
         data_start_date = np.datetime64(self.cool_runtime_daily.index[0])
         data_end_date = np.datetime64(self.cool_runtime_daily.index[-1])
 
-        # compute inclusion thresholds
+        # compute inclusion thresholds as boolean arrays on the days of the
+        # cooling runtime
+        daily_index = self.cool_runtime_daily.index
         if self.has_heating:
-            meets_heating_thresholds = self.heat_runtime_daily <= max_minutes_heating
+            meets_heating_thresholds = (
+                _daily_values(self.heat_runtime_daily, daily_index, np.nan)
+                <= max_minutes_heating
+            )
         else:
             meets_heating_thresholds = True
 
-        meets_cooling_thresholds = self.cool_runtime_daily >= min_minutes_cooling
+        meets_cooling_thresholds = self.cool_runtime_daily.values >= min_minutes_cooling
         meets_thresholds = meets_heating_thresholds & meets_cooling_thresholds
 
-        # enough temperature_in
-        enough_temp_in = self.temperature_in.groupby(
-            self.temperature_in.index.date
-        ).apply(lambda x: x.isnull().sum() <= 2)
-
-        enough_temp_out = self.temperature_out.groupby(
-            self.temperature_out.index.date
-        ).apply(lambda x: x.isnull().sum() <= 2)
-
-        meets_thresholds &= enough_temp_in & enough_temp_out
+        # Determines if enough non-null temperature is present
+        # (no more than two missing hours of temperature in / out)
+        meets_thresholds &= _daily_values(self._enough_temp_daily, daily_index, False)
 
         if method == "year_end_to_end":
             start_year = data_start_date.item().year
@@ -633,23 +1273,22 @@ class Thermostat(object):
 
             # for each potential core day set, look for cooling days.
             core_cooling_day_sets = []
+            daily_index_i8 = self.cool_runtime_daily.index.asi8
             for year in potential_core_day_sets:
                 core_day_set_start_date = np.datetime64(datetime(year, 1, 1))
                 core_day_set_end_date = np.datetime64(datetime(year + 1, 1, 1))
                 start_date = max(core_day_set_start_date, data_start_date).item()
                 end_date = min(core_day_set_end_date, data_end_date).item()
-                in_range = self._get_range_boolean(
-                    self.cool_runtime_daily.index, start_date, end_date
-                )
-                inclusion_daily = pd.Series(
-                    in_range & meets_thresholds, index=self.cool_runtime_daily.index
-                )
+                in_range = self._get_range_boolean(daily_index_i8, start_date, end_date)
+                inclusion = in_range & meets_thresholds
 
-                if any(inclusion_daily):
+                if inclusion.any():
+                    inclusion_daily = pd.Series(
+                        inclusion, index=self.cool_runtime_daily.index
+                    )
                     name = "cooling_{}".format(year)
-                    inclusion_hourly = self._get_hourly_boolean(inclusion_daily)
                     core_day_set = CoreDaySet(
-                        name, inclusion_daily, inclusion_hourly, start_date, end_date
+                        name, inclusion_daily, start_date, end_date
                     )
                     core_cooling_day_sets.append(core_day_set)
 
@@ -658,32 +1297,99 @@ class Thermostat(object):
             inclusion_daily = pd.Series(
                 meets_thresholds, index=self.cool_runtime_daily.index
             )
-            inclusion_hourly = self._get_hourly_boolean(inclusion_daily)
             core_day_set = CoreDaySet(
                 "cooling_ALL",
                 inclusion_daily,
-                inclusion_hourly,
                 data_start_date,
                 data_end_date,
             )
             core_cooling_day_sets = [core_day_set]
             return core_cooling_day_sets
 
+    @property
+    def _enough_temp_daily(self):
+        if self._enough_temp_daily_cache is None:
+            self._enough_temp_daily_cache = self._compute_daily_temp_validity()
+        return self._enough_temp_daily_cache
+
+    def _compute_daily_temp_validity(self):
+        # Shared by get_core_heating_days and get_core_cooling_days. True for
+        # days with no more than two missing hours of both indoor and outdoor
+        # temperature.
+        temp_in = self.temperature_in
+        temp_out = self.temperature_out
+        if _is_whole_days_hourly(temp_in.index) and temp_in.index.equals(
+            temp_out.index
+        ):
+            # Count the missing hours of both series in a single pass.
+            hourly = np.stack([temp_in.values, temp_out.values]).reshape(2, -1, 24)
+            n_missing = pd.isnull(hourly).sum(axis=2)
+            daily_index = pd.date_range(
+                start=temp_in.index[0], periods=n_missing.shape[1], freq="D"
+            )
+            return pd.Series((n_missing <= 2).all(axis=0), index=daily_index)
+        enough_temp_in = self._enough_temperature_daily(temp_in)
+        return enough_temp_in & self._enough_temperature_daily(temp_out)
+
+    def _hourly_to_daily_sum(self, hourly):
+        """Sums hourly data to daily totals. A day with any missing hour has a
+        missing total.
+
+        Parameters
+        ----------
+        hourly : pandas.Series
+            Hourly data.
+
+        Returns
+        -------
+        daily : pandas.Series
+            Daily totals.
+        """
+        if _is_whole_days_hourly(hourly.index):
+            # np.sum propagates NaN, like agg(pd.Series.sum, skipna=False)
+            totals = hourly.values.reshape(-1, 24).sum(axis=1)
+            daily_index = pd.date_range(
+                start=hourly.index[0], periods=totals.shape[0], freq="D"
+            )
+            return pd.Series(totals, index=daily_index, name=hourly.name)
+        return hourly.resample("D").agg(pd.Series.sum, skipna=False)
+
+    def _enough_temperature_daily(self, temperature):
+        """Determines, for each day, if enough non-null temperature is present
+        (no more than two missing hours).
+
+        Parameters
+        ----------
+        temperature : pandas.Series
+            Hourly temperature data.
+
+        Returns
+        -------
+        enough_temperature : pandas.Series
+            Daily boolean series, True for days with enough temperature data.
+        """
+        missing = temperature.isnull()
+        if _is_whole_days_hourly(temperature.index):
+            n_missing = missing.values.reshape(-1, 24).sum(axis=1)
+            daily_index = pd.date_range(
+                start=temperature.index[0], periods=n_missing.shape[0], freq="D"
+            )
+            return pd.Series(n_missing <= 2, index=daily_index)
+        return missing.resample("D").sum() <= 2
+
     def _get_range_boolean(self, dt_index, start_date, end_date):
+        # Compare timezone-naive indexes as int64 nanoseconds; dt_index may
+        # also already be such an array (DatetimeIndex.asi8).
+        if isinstance(dt_index, np.ndarray) or dt_index.tz is None:
+            if not isinstance(dt_index, np.ndarray):
+                dt_index = dt_index.asi8
+            start_date = pd.Timestamp(start_date).value
+            end_date = pd.Timestamp(end_date).value
         after_start = dt_index >= start_date
         before_end = dt_index < end_date
         return after_start & before_end
 
-    def _get_hourly_boolean(self, daily_boolean):
-        values = np.repeat(daily_boolean.values, 24)
-        index = pd.date_range(
-            start=daily_boolean.index[0],
-            periods=daily_boolean.index.shape[0] * 24,
-            freq="H",
-        )
-        hourly_boolean = pd.Series(values, index)
-        return hourly_boolean
-
+    @_requires(_protect_heating)
     def total_heating_runtime(self, core_day_set):
         """Calculates total heating runtime.
 
@@ -697,9 +1403,9 @@ class Thermostat(object):
         total_runtime : float
             Total heating runtime.
         """
-        self._protect_heating()
         return self.heat_runtime_daily[core_day_set.daily].sum()
 
+    @_requires(_protect_aux_emerg)
     def total_auxiliary_heating_runtime(self, core_day_set):
         """Calculates total auxiliary heating runtime.
 
@@ -713,9 +1419,9 @@ class Thermostat(object):
         total_runtime : float
             Total auxiliary heating runtime.
         """
-        self._protect_aux_emerg()
-        return self.auxiliary_heat_runtime[core_day_set.hourly].sum()
+        return self.auxiliary_heat_runtime[self._core_hours(core_day_set)].sum()
 
+    @_requires(_protect_aux_emerg)
     def total_emergency_heating_runtime(self, core_day_set):
         """Calculates total emergency heating runtime.
 
@@ -729,9 +1435,9 @@ class Thermostat(object):
         total_runtime : float
             Total heating runtime.
         """
-        self._protect_aux_emerg()
-        return self.emergency_heat_runtime[core_day_set.hourly].sum()
+        return self.emergency_heat_runtime[self._core_hours(core_day_set)].sum()
 
+    @_requires(_protect_cooling)
     def total_cooling_runtime(self, core_day_set):
         """Calculates total cooling runtime.
 
@@ -745,9 +1451,9 @@ class Thermostat(object):
         total_runtime : float
             Total cooling runtime.
         """
-        self._protect_cooling()
         return self.cool_runtime_daily[core_day_set.daily].sum()
 
+    @_requires(_protect_aux_emerg, _protect_resistance_heat)
     def get_resistance_heat_utilization_runtime(self, core_heating_day_set):
         """Calculates resistance heat utilization runtime and filters based on
         the core heating days
@@ -766,9 +1472,6 @@ class Thermostat(object):
             not control the appropriate equipment.
         """
 
-        self._protect_aux_emerg()
-        self._protect_resistance_heat()
-
         in_core_day_set_daily = self._get_range_boolean(
             core_heating_day_set.daily.index,
             core_heating_day_set.start_date,
@@ -776,26 +1479,44 @@ class Thermostat(object):
         )
 
         # convert hourly to daily
-        temp_out_daily = self.temperature_out.resample("D").mean()
-        aux_daily = self.auxiliary_heat_runtime.resample("D").sum()
-        emg_daily = self.emergency_heat_runtime.resample("D").sum()
-
-        # Build the initial DataFrame based on daily readings
-        runtime_temp_daily = pd.DataFrame()
-        runtime_temp_daily["temperature"] = temp_out_daily
-        runtime_temp_daily["heat_runtime"] = self.heat_runtime_daily
-        runtime_temp_daily["aux_runtime"] = aux_daily
-        runtime_temp_daily["emg_runtime"] = emg_daily
-        runtime_temp_daily["in_core_daily"] = in_core_day_set_daily
-        runtime_temp_daily["total_minutes"] = 1440  # default number of minutes per day
-
-        # Filter out records that aren't part of the core day set
-        runtime_temp_daily = runtime_temp_daily[
-            runtime_temp_daily["in_core_daily"].map(lambda x: x is True)
-        ]
+        temp_out_daily = self.temperature_out_daily
+        aux_daily = self.auxiliary_heat_runtime_daily
+        emg_daily = self.emergency_heat_runtime_daily
+
+        # Build the DataFrame of daily readings, on the outdoor temperature's days,
+        # for the records that are part of the core day set
+        daily_index = temp_out_daily.index
+        n_core_days = np.count_nonzero(in_core_day_set_daily)
+        runtime_temp_daily = pd.DataFrame(
+            {
+                "temperature": temp_out_daily.values[in_core_day_set_daily],
+                "heat_runtime": self.heat_runtime_daily.reindex(daily_index).values[
+                    in_core_day_set_daily
+                ],
+                "aux_runtime": aux_daily.reindex(daily_index).values[
+                    in_core_day_set_daily
+                ],
+                "emg_runtime": emg_daily.reindex(daily_index).values[
+                    in_core_day_set_daily
+                ],
+                "in_core_daily": np.ones(n_core_days, dtype=bool),
+                # default number of minutes per day
+                "total_minutes": np.full(n_core_days, 1440, dtype=np.int64),
+            },
+            index=daily_index[in_core_day_set_daily],
+            columns=[
+                "temperature",
+                "heat_runtime",
+                "aux_runtime",
+                "emg_runtime",
+                "in_core_daily",
+                "total_minutes",
+            ],
+        )
 
         return runtime_temp_daily
 
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_resistance_heat_utilization_bins(
         self, runtime_temp, bins, core_heating_day_set, min_runtime_minutes=None
     ):
@@ -818,17 +1539,15 @@ class Thermostat(object):
             ascending by temperature bin. Returns None if the thermostat does
             not control the appropriate equipment or if the runtime_temp is None.
         """
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
         if runtime_temp is None:
             return None
 
-        # Create the bins and group by them
-        runtime_temp["bins"] = pd.cut(runtime_temp["temperature"], bins)
-        runtime_rhu = runtime_temp.groupby("bins")[
-            "heat_runtime", "aux_runtime", "emg_runtime", "total_minutes"
-        ].sum()
+        # Sum the runtimes by temperature bin
+        runtime_rhu = _sum_by_bin(
+            runtime_temp,
+            bins,
+            ["heat_runtime", "aux_runtime", "emg_runtime", "total_minutes"],
+        )
 
         # Calculate the RHU based on the bins
         runtime_rhu["rhu"] = (
@@ -840,41 +1559,40 @@ class Thermostat(object):
             runtime_rhu.heat_runtime + runtime_rhu.aux_runtime + runtime_rhu.emg_runtime
         )
 
+        data_is_nonsense = (
+            runtime_rhu["aux_runtime"].values > runtime_rhu["heat_runtime"].values
+        )
+        rhu_is_nan = data_is_nonsense
+
         # If we're passed min_runtime_minutes (RHU2) then treat the thermostat as not having run during that period
         if min_runtime_minutes:
-            runtime_rhu["rhu"].loc[
-                runtime_rhu.total_runtime < min_runtime_minutes
-            ] = np.nan
-            runtime_rhu["total_runtime"].loc[
-                runtime_rhu.total_runtime < min_runtime_minutes
-            ] = np.nan
-
-        runtime_rhu["data_is_nonsense"] = (
-            runtime_rhu["aux_runtime"] > runtime_rhu["heat_runtime"]
-        )
-        runtime_rhu.loc[
-            runtime_rhu.data_is_nonsense == True, "rhu"
-        ] = np.nan  # noqa: E712
-
-        if runtime_rhu.data_is_nonsense.any():
-            for item in runtime_rhu.itertuples():
-                if item.data_is_nonsense:
-                    warnings.warn(
-                        "WARNING: "
-                        "aux heat runtime %s > compressor runtime %s "
-                        "for %sF <= temperature < %sF "
-                        "for thermostat_id %s "
-                        "from %s to %s inclusive"
-                        % (
-                            item.aux_runtime,
-                            item.heat_runtime,
-                            item.Index.left,
-                            item.Index.right,
-                            self.thermostat_id,
-                            core_heating_day_set.start_date,
-                            core_heating_day_set.end_date,
-                        )
-                    )
+            total_runtime = runtime_rhu["total_runtime"].values
+            insufficient = total_runtime < min_runtime_minutes
+            rhu_is_nan = rhu_is_nan | insufficient
+            runtime_rhu["total_runtime"] = np.where(insufficient, np.nan, total_runtime)
+
+        runtime_rhu["rhu"] = np.where(rhu_is_nan, np.nan, runtime_rhu["rhu"].values)
+        runtime_rhu["data_is_nonsense"] = data_is_nonsense
+
+        # Only the few nonsense bins are visited to warn about them.
+        for i in np.flatnonzero(data_is_nonsense):
+            interval = runtime_rhu.index[i]
+            warnings.warn(
+                "WARNING: "
+                "aux heat runtime %s > compressor runtime %s "
+                "for %sF <= temperature < %sF "
+                "for thermostat_id %s "
+                "from %s to %s inclusive"
+                % (
+                    runtime_rhu["aux_runtime"].values[i].item(),
+                    runtime_rhu["heat_runtime"].values[i].item(),
+                    interval.left,
+                    interval.right,
+                    self.thermostat_id,
+                    core_heating_day_set.start_date,
+                    core_heating_day_set.end_date,
+                )
+            )
 
         return runtime_rhu
 
@@ -896,27 +1614,33 @@ class Thermostat(object):
             core_day_set.daily.index, core_day_set.start_date, core_day_set.end_date
         )
 
+        # Masks are plain arrays (or False, which broadcasts) so that each & is
+        # a single array operation.
         if self.has_heating:
-            has_heating = self.heat_runtime_daily > 0
-            null_heating = pd.isnull(self.heat_runtime_daily)
+            heat_runtime_daily = self.heat_runtime_daily.values
+            with np.errstate(invalid="ignore"):
+                has_heating = heat_runtime_daily > 0
+            null_heating = pd.isnull(heat_runtime_daily)
         else:
             has_heating = False
             null_heating = False  # shouldn't be counted, so False, not True
 
         if self.has_cooling:
-            has_cooling = self.cool_runtime_daily > 0
-            null_cooling = pd.isnull(self.cool_runtime_daily)
+            cool_runtime_daily = self.cool_runtime_daily.values
+            with np.errstate(invalid="ignore"):
+                has_cooling = cool_runtime_daily > 0
+            null_cooling = pd.isnull(cool_runtime_daily)
         else:
             has_cooling = False
             null_cooling = False  # shouldn't be counted, so False, not True
 
-        n_both = (in_range & has_heating & has_cooling).sum()
-        n_days_insufficient = (in_range & (null_heating | null_cooling)).sum()
+        n_both = np.count_nonzero(in_range & has_heating & has_cooling)
+        n_days_insufficient = np.count_nonzero(in_range & (null_heating | null_cooling))
         return n_both, n_days_insufficient
 
     def get_core_day_set_n_days(self, core_day_set):
         """Returns number of days in the core day set."""
-        return int(core_day_set.daily.sum())
+        return core_day_set.n_days
 
     def get_inputfile_date_range(self, core_day_set):
         """Returns number of days of data provided in input data file."""
@@ -925,6 +1649,7 @@ class Thermostat(object):
             return delta.days
         return int(delta.astype("timedelta64[D]") / np.timedelta64(1, "D"))
 
+    @_requires(_protect_cooling)
     def get_cooling_demand(self, core_cooling_day_set):
         """
         Calculates a measure of cooling demand using the hourlyavgCTD method.
@@ -986,27 +1711,30 @@ class Thermostat(object):
             Mean absolute error
         """
 
-        self._protect_cooling()
+        core_day_set_deltaT = self.hourly_deltaT[self._core_hours(core_cooling_day_set)]
+        deltaT_arr = core_day_set_deltaT.values
 
-        core_day_set_temp_in = self.temperature_in[core_cooling_day_set.hourly]
-        core_day_set_temp_out = self.temperature_out[core_cooling_day_set.hourly]
-        core_day_set_deltaT = core_day_set_temp_in - core_day_set_temp_out
+        daily_index = core_cooling_day_set.daily_index
 
-        daily_index = core_cooling_day_set.daily[core_cooling_day_set.daily].index
+        # Core days are whole days, so hours can be summed in blocks of 24,
+        # which keeps each call of the leastsq loop to a few array passes.
+        if _is_whole_days_hourly(self.temperature_in.index):
+            hours = None
+        else:
+            hours = core_day_set_deltaT.index
+        deltaT_arr = _degree_hour_deltas(deltaT_arr, -1, hours)
 
         def calc_cdd(tau):
-            hourly_cdd = (tau - core_day_set_deltaT).apply(lambda x: np.maximum(x, 0))
-            # Note - `x / 24` this should be thought of as a unit conversion, not an average.
-            return np.array(
-                [
-                    cdd.sum() / 24
-                    for day, cdd in hourly_cdd.groupby(core_day_set_deltaT.index.date)
-                ]
-            )
+            return _daily_degree_days(deltaT_arr, tau, -1)
 
         daily_runtime = self.cool_runtime_daily[core_cooling_day_set.daily]
         total_runtime = daily_runtime.sum()
+        # leastsq evaluates the residuals many times, so skip index alignment.
+        daily_runtime_arr = daily_runtime.values.astype(np.float64)
 
+        # leastsq evaluates its starting point twice and the fit is evaluated
+        # again at the solution below, so keep the estimates for each tau.
+        @lru_cache(maxsize=None)
         def calc_estimates(tau):
             cdd = calc_cdd(tau)
             total_cdd = np.sum(cdd)
@@ -1018,12 +1746,11 @@ class Thermostat(object):
                     "Alpha Estimate divided by zero: %s / %s"
                     "for thermostat %s" % (total_runtime, total_cdd, self.thermostat_id)
                 )
-            runtime_estimate = cdd * alpha_estimate
-            errors = daily_runtime - runtime_estimate
+            errors = daily_runtime_arr - cdd * alpha_estimate
             return cdd, alpha_estimate, errors
 
         def estimate_errors(tau_estimate):
-            _, _, errors = calc_estimates(tau_estimate)
+            _, _, errors = calc_estimates(float(tau_estimate))
             return errors
 
         tau_starting_guess = 0
@@ -1086,6 +1813,7 @@ class Thermostat(object):
             mesg,
         )
 
+    @_requires(_protect_heating)
     def get_heating_demand(self, core_heating_day_set):
         """
         Calculates a measure of heating demand using the hourlyavgCTD method.
@@ -1145,27 +1873,30 @@ class Thermostat(object):
             Mean absolute error
         """
 
-        self._protect_heating()
+        core_day_set_deltaT = self.hourly_deltaT[self._core_hours(core_heating_day_set)]
+        deltaT_arr = core_day_set_deltaT.values
 
-        core_day_set_temp_in = self.temperature_in[core_heating_day_set.hourly]
-        core_day_set_temp_out = self.temperature_out[core_heating_day_set.hourly]
-        core_day_set_deltaT = core_day_set_temp_in - core_day_set_temp_out
+        daily_index = core_heating_day_set.daily_index
 
-        daily_index = core_heating_day_set.daily[core_heating_day_set.daily].index
+        # Core days are whole days, so hours can be summed in blocks of 24,
+        # which keeps each call of the leastsq loop to a few array passes.
+        if _is_whole_days_hourly(self.temperature_in.index):
+            hours = None
+        else:
+            hours = core_day_set_deltaT.index
+        deltaT_arr = _degree_hour_deltas(deltaT_arr, 1, hours)
 
         def calc_hdd(tau):
-            hourly_hdd = (core_day_set_deltaT - tau).apply(lambda x: np.maximum(x, 0))
-            # Note - this `x / 24` should be thought of as a unit conversion, not an average.
-            return np.array(
-                [
-                    hdd.sum() / 24
-                    for day, hdd in hourly_hdd.groupby(core_day_set_deltaT.index.date)
-                ]
-            )
+            return _daily_degree_days(deltaT_arr, tau, 1)
 
         daily_runtime = self.heat_runtime_daily[core_heating_day_set.daily]
         total_runtime = daily_runtime.sum()
+        # leastsq evaluates the residuals many times, so skip index alignment.
+        daily_runtime_arr = daily_runtime.values.astype(np.float64)
 
+        # leastsq evaluates its starting point twice and the fit is evaluated
+        # again at the solution below, so keep the estimates for each tau.
+        @lru_cache(maxsize=None)
         def calc_estimates(tau):
             hdd = calc_hdd(tau)
             total_hdd = np.sum(hdd)
@@ -1178,12 +1909,11 @@ class Thermostat(object):
                     "for thermostat_id %s "
                     % (total_runtime, total_hdd, self.thermostat_id)
                 )
-            runtime_estimate = hdd * alpha_estimate
-            errors = daily_runtime - runtime_estimate
+            errors = daily_runtime_arr - hdd * alpha_estimate
             return hdd, alpha_estimate, errors
 
         def estimate_errors(tau_estimate):
-            _, _, errors = calc_estimates(tau_estimate)
+            _, _, errors = calc_estimates(float(tau_estimate))
             return errors
 
         tau_starting_guess = 0
@@ -1246,6 +1976,7 @@ class Thermostat(object):
             mesg,
         )
 
+    @_requires(_protect_cooling)
     def get_core_cooling_day_baseline_setpoint(
         self, core_cooling_day_set, method="tenth_percentile", source="temperature_in"
     ):
@@ -1271,11 +2002,9 @@ class Thermostat(object):
             by the given method.
         """
 
-        self._protect_cooling()
-
         if method == "tenth_percentile" and source == "temperature_in":
-            return (
-                self.temperature_in[core_cooling_day_set.hourly].dropna().quantile(0.1)
+            return _quantile(
+                self.temperature_in.values[self._core_hours(core_cooling_day_set)], 0.1
             )
 
         if source == "cooling_setpoint":
@@ -1284,6 +2013,7 @@ class Thermostat(object):
         # For everything else, return "Not Implemented"
         raise NotImplementedError
 
+    @_requires(_protect_heating)
     def get_core_heating_day_baseline_setpoint(
         self,
         core_heating_day_set,
@@ -1311,11 +2041,9 @@ class Thermostat(object):
             by the given method.
         """
 
-        self._protect_heating()
-
         if method == "ninetieth_percentile" and source == "temperature_in":
-            return (
-                self.temperature_in[core_heating_day_set.hourly].dropna().quantile(0.9)
+            return _quantile(
+                self.temperature_in.values[self._core_hours(core_heating_day_set)], 0.9
             )
 
         if source == "heating_setpoint":
@@ -1324,6 +2052,40 @@ class Thermostat(object):
         # For everything else, return "Not Implemented"
         raise NotImplementedError
 
+    def _baseline_demands(self, core_day_set, temp_baselines, tau, sign):
+        """Baseline daily demands for several baselines, computed in one pass
+        over the core hours. sign is -1 for cooling and 1 for heating.
+
+        Parameters
+        ----------
+        core_day_set : thermostat.core.CoreDaySet
+            Core days over which to calculate baseline demand.
+        temp_baselines : list
+            Baseline comfort temperatures, each either a float or an array of
+            the baseline temperature in each core hour.
+        tau : float
+            From fitted demand model.
+
+        Returns
+        -------
+        baseline_demands : numpy.ndarray
+            The baseline daily demand for each of temp_baselines, one row per
+            baseline and one column per core day.
+        """
+        core_hours = self._core_hours(core_day_set)
+        temp_out = self.temperature_out.values[core_hours]
+        if _is_whole_days_hourly(self.temperature_out.index):
+            hours = None
+        else:
+            hours = self.temperature_out.index[core_hours]
+
+        delta = np.empty((len(temp_baselines), temp_out.shape[0]))
+        for row, temp_baseline in zip(delta, temp_baselines):
+            np.subtract(temp_baseline, temp_out, out=row)
+        delta = _degree_hour_deltas(delta, sign, hours)
+        return _daily_degree_days(delta, tau, sign)
+
+    @_requires(_protect_cooling)
     def get_baseline_cooling_demand(self, core_cooling_day_set, temp_baseline, tau):
         """Calculate baseline cooling demand for a particular core cooling
         day set and fitted physical parameters.
@@ -1355,23 +2117,10 @@ class Thermostat(object):
             A series containing baseline daily heating demand for the core
             cooling day set.
         """
-        self._protect_cooling()
-
-        hourly_temp_out = self.temperature_out[core_cooling_day_set.hourly]
-
-        hourly_cdd = (tau - (temp_baseline - hourly_temp_out)).apply(
-            lambda x: np.maximum(x, 0)
-        )
-        demand = np.array(
-            [
-                cdd.sum() / 24
-                for day, cdd in hourly_cdd.groupby(hourly_temp_out.index.date)
-            ]
-        )
-
-        index = core_cooling_day_set.daily[core_cooling_day_set.daily].index
-        return pd.Series(demand, index=index)
+        demands = self._baseline_demands(core_cooling_day_set, [temp_baseline], tau, -1)
+        return _core_day_series(core_cooling_day_set, demands[0])
 
+    @_requires(_protect_heating)
     def get_baseline_heating_demand(self, core_heating_day_set, temp_baseline, tau):
         """Calculate baseline heating demand for a particular core heating day
         set and fitted physical parameters.
@@ -1402,22 +2151,8 @@ class Thermostat(object):
         baseline_heating_demand : pandas.Series
             A series containing baseline daily heating demand for the core heating days.
         """
-        self._protect_heating()
-
-        hourly_temp_out = self.temperature_out[core_heating_day_set.hourly]
-
-        hourly_hdd = (temp_baseline - hourly_temp_out - tau).apply(
-            lambda x: np.maximum(x, 0)
-        )
-        demand = np.array(
-            [
-                hdd.sum() / 24
-                for day, hdd in hourly_hdd.groupby(hourly_temp_out.index.date)
-            ]
-        )
-
-        index = core_heating_day_set.daily[core_heating_day_set.daily].index
-        return pd.Series(demand, index=index)
+        demands = self._baseline_demands(core_heating_day_set, [temp_baseline], tau, 1)
+        return _core_day_series(core_heating_day_set, demands[0])
 
     def get_baseline_cooling_runtime(self, baseline_cooling_demand, alpha):
         """Calculate baseline cooling runtime given baseline cooling demand
@@ -1437,7 +2172,7 @@ class Thermostat(object):
         baseline_cooling_runtime : pandas.Series
             A series containing estimated daily baseline cooling runtime.
         """
-        return np.maximum(alpha * (baseline_cooling_demand), 0)
+        return _baseline_runtime(baseline_cooling_demand, alpha)
 
     def get_baseline_heating_runtime(self, baseline_heating_demand, alpha):
         """Calculate baseline heating runtime given baseline heating demand.
@@ -1457,8 +2192,9 @@ class Thermostat(object):
         baseline_heating_runtime : pandas.Series
             A series containing estimated daily baseline heating runtime.
         """
-        return np.maximum(alpha * (baseline_heating_demand), 0)
+        return _baseline_runtime(baseline_heating_demand, alpha)
 
+    @_cached_per_core_day_set
     def get_temperature_constants(self, core_day_set):
         """NWMOD: Calculate the temperature constant for a specific day set.
 
@@ -1469,17 +2205,16 @@ class Thermostat(object):
         heat_loss_constant : float
             Value of heat loss constant for this core day set.
         """
+        if not core_day_set.daily_values.any():
+            return np.nan, np.nan
+
         # Error handling if heating or cooling runtime is missing
         if not self.has_cooling:
-            cool_runtime_hourly = pd.Series(
-                [0] * len(self.temperature_out.index), index=self.temperature_out.index
-            )
+            cool_runtime_hourly = pd.Series(0, index=self.temperature_out.index)
         else:
             cool_runtime_hourly = self.cool_runtime_hourly
         if not self.has_heating:
-            heat_runtime_hourly = pd.Series(
-                [0] * len(self.temperature_out.index), index=self.temperature_out.index
-            )
+            heat_runtime_hourly = pd.Series(0, index=self.temperature_out.index)
         else:
             heat_runtime_hourly = self.heat_runtime_hourly
         # Create a dataframe with four columns: heating/cooling runtime and indoor/outdoor temperatures
@@ -1496,36 +2231,28 @@ class Thermostat(object):
 
         # Calculate a new column - the temperature gradient. The difference between indoor
         # temperature in this hour minus the previous hour divided by the indoor-outdoor
-        # temperature difference in this hour
-        df["temp_gradient"] = (df.loc[:, "temp_in"] - df.shift(1).loc[:, "temp_in"]) / (
-            (df.loc[:, "temp_out"] - df.loc[:, "temp_in"]).map(
-                lambda x: 0.1 if abs(x) < 0.1 else x
-            )
-        )
-        # Heat gain constant is the mean temperature gradient with minimal heating/cooling
-        # and with the outdoor temperature larger than the indoor temperature
-        heat_gain_constant = (
-            df.loc[core_day_set.hourly]
-            .loc[
-                (df.heat_runtime <= 5)
-                & (df.cool_runtime <= 5)
-                & ((df.temp_out - df.temp_in) > 1)
-            ]
-            .temp_gradient.mean()
-        )
-        # Heat loss constant is the mean temperature gradient with minimal heating/cooling
-        # and with the indoor temperature larger than the outdoor temperature
-        heat_loss_constant = (
-            df.loc[core_day_set.hourly]
-            .loc[
-                (df.heat_runtime <= 5)
-                & (df.cool_runtime <= 5)
-                & ((df.temp_in - df.temp_out) > 1)
-            ]
-            .temp_gradient.mean()
-        )
+        # temperature difference in this hour, which is taken as 0.1 when smaller than that.
+        temp_in = df["temp_in"].values
+        temp_out_minus_in = df["temp_out"].values - temp_in
+        temp_gradient = _temperature_gradient(temp_in, temp_out_minus_in)
+        df["temp_gradient"] = temp_gradient
+        # The heat gain and loss constants are the mean temperature gradient in core day hours
+        # with minimal heating/cooling, and with the outdoor temperature larger than the indoor
+        # temperature for heat gain, or the indoor temperature larger for heat loss.
+        in_core = self._core_hours(core_day_set)
+        with np.errstate(invalid="ignore"):
+            minimal_hvac = (
+                in_core
+                & (df["heat_runtime"].values <= 5)
+                & (df["cool_runtime"].values <= 5)
+            )
+            gain = minimal_hvac & (temp_out_minus_in > 1)
+            loss = minimal_hvac & (-temp_out_minus_in > 1)
+        heat_gain_constant = pd.Series(temp_gradient[gain]).mean()
+        heat_loss_constant = pd.Series(temp_gradient[loss]).mean()
         return heat_gain_constant, heat_loss_constant
 
+    @_cached_per_core_day_set
     def get_temperature_variance(self, core_day_set):
         """NWMOD: Calculate the temperature variance for a specific day set.
 
@@ -1536,21 +2263,20 @@ class Thermostat(object):
         weekly_temperature_variance : float
             Standard deviation of indoor temperatures for this core day set grouped by hour of week.
         """
-        # Generate a dataframe with indoor temperature, hour of day, hour of week and day of week
-        df = pd.DataFrame(self.temperature_in)
-        if len(df.index) == 0:
+        if len(self.temperature_in.index) == 0:
             return np.nan, np.nan
-        df["hour_of_day"] = df.index.hour
-        df["day_of_week"] = df.index.weekday
-        df["hour_of_week"] = df.day_of_week * 24 + df.hour_of_day
 
         # Filter by core day set
-        df = df.loc[core_day_set.hourly]
+        temperature_in = self.temperature_in[self._core_hours(core_day_set)]
         # Group by hour of week and take the mean
-        df_grouped = df.groupby("hour_of_week").agg({"temp_in": np.mean})
+        index = temperature_in.index
+        hour_of_week = index.weekday.values * 24 + index.hour.values
+        hour_of_week_means = temperature_in.groupby(hour_of_week).mean()
 
-        return df.temp_in.std(), df_grouped.temp_in.std()
+        return temperature_in.std(), hour_of_week_means.std()
 
+    @_requires(_protect_cooling)
+    @_cached_per_core_day_set
     def get_cooling_hvac_constant(self, core_day_set):
         """NWMOD: Calculate the HVAC time constant for a specific day set.
 
@@ -1559,38 +2285,30 @@ class Thermostat(object):
         cooling_hvac_constant : float
             Value of HVAC time constant for this core day set.
         """
-        self._protect_cooling()
+        if not core_day_set.daily_values.any():
+            return np.nan
 
-        # Generate a dataframe with cooling runtime, and indoor/outdoor temperatures
-        df = pd.concat(
-            [self.cool_runtime_hourly, self.temperature_in, self.temperature_out],
-            axis=1,
-        )
-        df.columns = ["cool_runtime", "temp_in", "temp_out"]
+        # The cooling runtime and indoor/outdoor temperatures share the hourly index
+        temp_in = self.temperature_in.values
+        temp_out_minus_in = self.temperature_out.values - temp_in
+        cool_runtime = self.cool_runtime_hourly.values
 
-        # Calculate a new column - the temperature gradient. The difference between indoor
+        # Calculate the temperature gradient. The difference between indoor
         # temperature in this hour minus the prvious hour divided by the indoor-outdoor
-        # temperature difference in this hour
-        df["temp_gradient"] = (
-            (df.loc[:, "temp_in"] - df.shift(1).loc[:, "temp_in"])
-            / (
-                (df.loc[:, "temp_out"] - df.loc[:, "temp_in"]).map(
-                    lambda x: 0.1 if abs(x) < 0.1 else x
-                )
-            )
-            / df.cool_runtime.map(lambda x: 0.1 if abs(x) < 0.1 else x)
-            * 60
-        )
+        # temperature difference and the runtime in this hour, each taken as 0.1 when
+        # smaller than that.
+        temp_gradient = _temperature_gradient(temp_in, temp_out_minus_in, cool_runtime)
 
         # Cooling HVAC constant is the mean temperature gradient with cooling runtime over 15 minutes
         # and with the outdoor temperature larger than the indoor temperature
-        cooling_hvac_constant = (
-            df.loc[core_day_set.hourly]
-            .loc[(df.cool_runtime >= 15) & ((df.temp_out - df.temp_in) > 1)]
-            .temp_gradient.mean()
-        )
+        in_core = self._core_hours(core_day_set)
+        with np.errstate(invalid="ignore"):
+            mask = in_core & (cool_runtime >= 15) & (temp_out_minus_in > 1)
+        cooling_hvac_constant = pd.Series(temp_gradient[mask]).mean()
         return cooling_hvac_constant
 
+    @_requires(_protect_heating)
+    @_cached_per_core_day_set
     def get_heating_hvac_constant(self, core_day_set):
         """NWMOD: Calculate the HVAC time constant for a specific day set.
 
@@ -1599,36 +2317,26 @@ class Thermostat(object):
         heating_hvac_constant : float
             Value of HVAC time constant for this core day set.
         """
-        self._protect_heating()
+        if not core_day_set.daily_values.any():
+            return np.nan
 
-        # Generate a dataframe with cooling runtime, and indoor/outdoor temperatures
-        df = pd.concat(
-            [self.heat_runtime_hourly, self.temperature_in, self.temperature_out],
-            axis=1,
-        )
-        df.columns = ["heat_runtime", "temp_in", "temp_out"]
+        # The heating runtime and indoor/outdoor temperatures share the hourly index
+        temp_in = self.temperature_in.values
+        temp_out_minus_in = self.temperature_out.values - temp_in
+        heat_runtime = self.heat_runtime_hourly.values
 
-        # Calculate a new column - the temperature gradient. The difference between indoor
+        # Calculate the temperature gradient. The difference between indoor
         # temperature in this hour minus the prvious hour divided by the indoor-outdoor
-        # temperature difference in this hour
-        df["temp_gradient"] = (
-            (df.loc[:, "temp_in"] - df.shift(1).loc[:, "temp_in"])
-            / (
-                (df.loc[:, "temp_out"] - df.loc[:, "temp_in"]).map(
-                    lambda x: 0.1 if abs(x) < 0.1 else x
-                )
-            )
-            / df.heat_runtime.map(lambda x: 0.1 if abs(x) < 0.1 else x)
-            * 60
-        )
+        # temperature difference and the runtime in this hour, each taken as 0.1 when
+        # smaller than that.
+        temp_gradient = _temperature_gradient(temp_in, temp_out_minus_in, heat_runtime)
 
         # Heating HVAC constant is the mean temperature gradient with heating runtime over 15 minutes
         # and with the indoor temperature larger than the outdoor temperature
-        heating_hvac_constant = (
-            df.loc[core_day_set.hourly]
-            .loc[(df.heat_runtime >= 15) & ((df.temp_in - df.temp_out) > 1)]
-            .temp_gradient.mean()
-        )
+        in_core = self._core_hours(core_day_set)
+        with np.errstate(invalid="ignore"):
+            mask = in_core & (heat_runtime >= 15) & (-temp_out_minus_in > 1)
+        heating_hvac_constant = pd.Series(temp_gradient[mask]).mean()
         return heating_hvac_constant
 
     def fit_sigmoid_model(self, runtime_rhu, n_points_threshold=2):
@@ -1655,35 +2363,47 @@ class Thermostat(object):
             largest temperature bins (0-60F by default).
         """
         # Function to optimize
-        def calc_estimates(parameters, runtime_rhu):
+        def calc_estimates(parameters, temperatures, rhu, n_points, out):
             mu = parameters[0]
             sigma = parameters[1]
-            # Drop temperature bins that have little or no data
-            rhu = runtime_rhu.dropna()
-            rhu = rhu.loc[rhu.n_points > n_points_threshold]
-            # Get temperature value from temperature bins
-            temperatures = pd.Series([x.mid for x in rhu.index])
-            # Calculate the sigmoid function and associated errors.
-            function_fit = 0.5 * (1 - erf((temperatures - mu) / (sigma * np.sqrt(2))))
-            errors = (function_fit.values - rhu.rhu.values) ** 2
-            return np.sqrt(np.sum(errors) / np.sum(rhu.n_points))
+            # Calculate the sigmoid function and associated errors, reusing the
+            # out buffer for every step:
+            # (0.5 * (1 - erf((temperatures - mu) / (sigma * np.sqrt(2)))) - rhu) ** 2
+            np.subtract(temperatures, mu, out=out)
+            np.divide(out, sigma * np.sqrt(2), out=out)
+            erf(out, out=out)
+            np.subtract(1, out, out=out)
+            np.multiply(0.5, out, out=out)
+            np.subtract(out, rhu, out=out)
+            np.square(out, out=out)
+            return np.sqrt(np.sum(out) / np.sum(n_points))
 
         initial_parameters = [30, 5]
         try:
+            # Get temperature value from temperature bins; the index holds the
+            # bin intervals, categorical or not.
+            bin_temperatures = pd.IntervalIndex(runtime_rhu.index).mid.values
+            # Drop temperature bins that have little or no data; the arrays are
+            # selected once rather than on every call of calc_estimates.
+            keep = (
+                ~runtime_rhu.isnull().any(axis=1)
+                & (runtime_rhu.n_points > n_points_threshold)
+            ).values
+            fit_arrays = {
+                "temperatures": bin_temperatures[keep],
+                "rhu": runtime_rhu.rhu.values[keep],
+                "n_points": runtime_rhu.n_points.values[keep],
+                "out": np.empty(np.count_nonzero(keep)),
+            }
             # Do the least squares optimization on the sigmoid function
-            y = least_squares(
-                calc_estimates, initial_parameters, kwargs={"runtime_rhu": runtime_rhu}
-            )
+            y = least_squares(calc_estimates, initial_parameters, kwargs=fit_arrays)
             mu_estimate = y.x[0]
             sigma_estimate = y.x[1]
-            sigmoid_model_error = calc_estimates(y.x, runtime_rhu)
+            sigmoid_model_error = calc_estimates(y.x, **fit_arrays)
             # Calculate the estimated sigmiod function over all bins and integrate
             runtime_rhu["estimated_rhu"] = 0.5 * (
                 1
-                - erf(
-                    ([x.mid for x in runtime_rhu.index] - mu_estimate)
-                    / (sigma_estimate * np.sqrt(2))
-                )
+                - erf((bin_temperatures - mu_estimate) / (sigma_estimate * np.sqrt(2)))
             )
             sigmoid_integral = np.sum(runtime_rhu.estimated_rhu)
         except:
@@ -1694,6 +2414,7 @@ class Thermostat(object):
 
         return mu_estimate, sigma_estimate, sigmoid_model_error, sigmoid_integral
 
+    @_requires(_protect_cooling)
     def fit_linear_cooling_model(self, core_day_set):
         """NWMOD: Calculate an OLS model between indoor-outdoor temperature
         delta and runtime
@@ -1714,33 +2435,29 @@ class Thermostat(object):
         excess_resistance_scores : float
             Scores calculated over 1, 2 and 3 hr rolling windows.
         """
-        self._protect_cooling()
-
+        # Nothing to fit without core days
+        if not core_day_set.daily_values.any():
+            return _NO_LINEAR_MODEL
         df_daily = self.get_delta_df_cooling(core_day_set)
-        if df_daily.shape[0] == 0:
-            return (
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-                np.nan,
-            )
-        model = smf.ols(formula="temperature_delta ~ cool_runtime", data=df_daily)
+        # OLS of temperature_delta on an intercept and cool_runtime, dropping
+        # incomplete days as the formula interface does.
+        model = sm.OLS(
+            df_daily["temperature_delta"].values,
+            np.column_stack(
+                [np.ones(df_daily.shape[0]), df_daily["cool_runtime"].values]
+            ),
+            missing="drop",
+        )
+        fit = model.fit()
 
-        rsquared = model.fit().rsquared
-        intercept = model.fit().params["Intercept"]
-        intercept_se = model.fit().bse["Intercept"]
-        cool_slope = model.fit().params["cool_runtime"]
-        cool_slope_se = model.fit().bse["cool_runtime"]
+        rsquared = fit.rsquared
+        intercept = fit.params[0]
+        intercept_se = fit.bse[0]
+        cool_slope = fit.params[1]
+        cool_slope_se = fit.bse[1]
         resistance_slope = np.nan
         resistance_slope_se = np.nan
-        mse = np.nanmean((model.fit().resid) ** 2)
+        mse = np.nanmean((fit.resid) ** 2)
         rmse = mse ** 0.5
         mean_daily_runtime = np.nanmean(df_daily.cool_runtime)
 
@@ -1770,49 +2487,44 @@ class Thermostat(object):
             excess_resistance_score_3hr,
         )
 
+    @_requires(_protect_cooling)
     def get_delta_df_cooling(self, core_day_set):
         """NWMOD: return a daily dataframe of temperature delta and runtime"""
-        self._protect_cooling()
-
-        df = pd.DataFrame()
-        df["temperature_out"] = self.temperature_out
-        df["temperature_in"] = self.temperature_in
-        df["temperature_delta"] = df.temperature_out - df.temperature_in
-        df["cool_runtime"] = self.cool_runtime_hourly
-
-        df_daily = df.resample("D").agg(
-            {"temperature_delta": np.mean, "cool_runtime": np.sum}
+        # Outdoor minus indoor temperature; negating the mean indoor minus
+        # outdoor difference is exact.
+        df_daily = pd.DataFrame(
+            {
+                "temperature_delta": -self._daily_resample("hourly_deltaT", "mean"),
+                "cool_runtime": self._daily_resample("cool_runtime_hourly", "sum"),
+            }
         )
-        df_daily = df_daily[core_day_set.daily]
-        return df_daily.loc[:, ["temperature_delta", "cool_runtime"]]
+        return df_daily[core_day_set.daily]
 
+    @_requires(_protect_heating)
     def fit_linear_heating_model(self, core_day_set):
-        self._protect_heating()
-
+        # Nothing to fit without core days
+        if not core_day_set.daily_values.any():
+            return _NO_LINEAR_MODEL
         if self.has_auxiliary:
             df_daily = self.get_delta_df_heatpump(core_day_set)
-            if df_daily.shape[0] == 0:
-                return (
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                )
-            model = smf.ols(
-                formula="temperature_delta ~ adjusted_heat_runtime + resistance_runtime",
-                data=df_daily,
-            )
-            resistance_slope = model.fit().params["resistance_runtime"]
-            resistance_slope_se = model.fit().bse["resistance_runtime"]
-            heat_slope = model.fit().params["adjusted_heat_runtime"]
-            heat_slope_se = model.fit().bse["adjusted_heat_runtime"]
+            # OLS of temperature_delta on an intercept, adjusted_heat_runtime and
+            # resistance_runtime.
+            model = sm.OLS(
+                df_daily["temperature_delta"].values,
+                np.column_stack(
+                    [
+                        np.ones(df_daily.shape[0]),
+                        df_daily["adjusted_heat_runtime"].values,
+                        df_daily["resistance_runtime"].values,
+                    ]
+                ),
+                missing="drop",
+            )
+            fit = model.fit()
+            resistance_slope = fit.params[2]
+            resistance_slope_se = fit.bse[2]
+            heat_slope = fit.params[1]
+            heat_slope_se = fit.bse[1]
             mean_daily_runtime = np.nanmean(df_daily.adjusted_heat_runtime)
 
             (
@@ -1825,34 +2537,28 @@ class Thermostat(object):
 
         else:
             df_daily = self.get_delta_df_furnace(core_day_set)
-            if df_daily.shape[0] == 0:
-                return (
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                    np.nan,
-                )
-            model = smf.ols(formula="temperature_delta ~ heat_runtime", data=df_daily)
+            # OLS of temperature_delta on an intercept and heat_runtime.
+            model = sm.OLS(
+                df_daily["temperature_delta"].values,
+                np.column_stack(
+                    [np.ones(df_daily.shape[0]), df_daily["heat_runtime"].values]
+                ),
+                missing="drop",
+            )
+            fit = model.fit()
             resistance_slope = np.nan
             resistance_slope_se = np.nan
-            heat_slope = model.fit().params["heat_runtime"]
-            heat_slope_se = model.fit().bse["heat_runtime"]
+            heat_slope = fit.params[1]
+            heat_slope_se = fit.bse[1]
             mean_daily_runtime = np.nanmean(df_daily.heat_runtime)
             excess_resistance_score_1hr = np.nan
             excess_resistance_score_2hr = np.nan
             excess_resistance_score_3hr = np.nan
 
-        rsquared = model.fit().rsquared
-        intercept = model.fit().params["Intercept"]
-        intercept_se = model.fit().bse["Intercept"]
-        mse = np.nanmean((model.fit().resid) ** 2)
+        rsquared = fit.rsquared
+        intercept = fit.params[0]
+        intercept_se = fit.bse[0]
+        mse = np.nanmean((fit.resid) ** 2)
         rmse = mse ** 0.5
 
         try:
@@ -1878,142 +2584,77 @@ class Thermostat(object):
             excess_resistance_score_3hr,
         )
 
+    @_requires(_protect_heating)
     def get_delta_df_furnace(self, core_day_set):
-        self._protect_heating()
-
-        df = pd.DataFrame()
-        df["temperature_out"] = self.temperature_out
-        df["temperature_in"] = self.temperature_in
-        df["temperature_delta"] = df.temperature_in - df.temperature_out
-        df["heat_runtime"] = self.heat_runtime_hourly
-
-        df_daily = df.resample("D").agg(
-            {"temperature_delta": np.mean, "heat_runtime": np.sum}
+        df_daily = pd.DataFrame(
+            {
+                "temperature_delta": self._daily_resample("hourly_deltaT", "mean"),
+                "heat_runtime": self._daily_resample("heat_runtime_hourly", "sum"),
+            }
         )
-        df_daily = df_daily[core_day_set.daily]
-
-        return df_daily.loc[:, ["temperature_delta", "heat_runtime"]]
+        return df_daily[core_day_set.daily]
 
+    @_requires(_protect_heating)
     def get_delta_df_heatpump(self, core_day_set):
-        self._protect_heating()
-
-        df = pd.DataFrame()
-        df["temperature_out"] = self.temperature_out
-        df["temperature_in"] = self.temperature_in
-        df["temperature_delta"] = df.temperature_in - df.temperature_out
-        df["heat_runtime"] = self.heat_runtime_hourly
-        df["adjusted_heat_runtime"] = df.heat_runtime * (
-            1 - 0.012 * (47 - df.temperature_out)
-        )
-        df["resistance_runtime"] = (
-            self.auxiliary_heat_runtime + self.emergency_heat_runtime
-        )
-
-        df_daily = df.resample("D").agg(
+        # The heat pump runtime is adjusted for capacity at the outdoor
+        # temperature hour by hour, so the product is summed rather than the
+        # daily runtime adjusted.
+        adjusted_heat_runtime = self.adjusted_heat_runtime_hourly
+        resistance_runtime = self.auxiliary_heat_runtime + self.emergency_heat_runtime
+        df_daily = pd.DataFrame(
             {
-                "temperature_delta": np.mean,
-                "adjusted_heat_runtime": np.sum,
-                "resistance_runtime": np.sum,
+                "temperature_delta": self._daily_resample("hourly_deltaT", "mean"),
+                "heat_runtime": self._daily_resample("heat_runtime_hourly", "sum"),
+                "adjusted_heat_runtime": adjusted_heat_runtime.resample("D").sum(),
+                "resistance_runtime": resistance_runtime.resample("D").sum(),
             }
         )
-        df_daily = df_daily[core_day_set.daily]
-
-        return df_daily.loc[
-            :,
-            [
-                "temperature_delta",
-                "heat_runtime",
-                "adjusted_heat_runtime",
-                "resistance_runtime",
-            ],
-        ]
+        return df_daily[core_day_set.daily]
 
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_excess_resistance_scores(self, core_day_set, heat_slope, resistance_slope):
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
-        df = pd.DataFrame()
-        df["temperature_out"] = self.temperature_out
-        df["temperature_in"] = self.temperature_in
-        df["temperature_delta"] = df.temperature_in - df.temperature_out
-        df["heat_runtime"] = self.heat_runtime_hourly
-        df["adjusted_heat_runtime"] = df.heat_runtime * (
-            1 - 0.012 * (47 - df.temperature_out)
-        )
-        df["full_heat_runtime"] = 60 * (1 - 0.012 * (47 - df.temperature_out))
-
-        df["available_compressor_runtime"] = (
-            df.full_heat_runtime - df.adjusted_heat_runtime
-        )
-        df["available_compressor_runtime_nm1"] = df.available_compressor_runtime.shift(
-            1
-        )
-        df["available_compressor_runtime_nm2"] = df.available_compressor_runtime.shift(
-            2
+        adjusted_heat_runtime = self.adjusted_heat_runtime_hourly.values
+        available_compressor_runtime = (
+            self.full_heat_runtime_hourly.values - adjusted_heat_runtime
         )
-
-        df["resistance_runtime"] = (
+        resistance_runtime = (
             self.auxiliary_heat_runtime + self.emergency_heat_runtime
-        )
-        df["resistance_runtime_nm1"] = df.resistance_runtime.shift(1)
-        df["resistance_runtime_nm2"] = df.resistance_runtime.shift(2)
-
-        df = df[core_day_set.hourly]
-
-        df["excess_resistance_1hr"] = df.apply(
-            lambda x: min(
-                x.resistance_runtime * resistance_slope,
-                x.available_compressor_runtime * heat_slope,
-            ),
-            axis=1,
-        )
-        df["excess_resistance_2hr"] = df.apply(
-            lambda x: min(
-                (x.resistance_runtime + x.resistance_runtime_nm1) * resistance_slope,
-                (x.available_compressor_runtime + x.available_compressor_runtime_nm1)
-                * heat_slope,
-            )
-            / 2,
-            axis=1,
-        )
-        df["excess_resistance_3hr"] = df.apply(
-            lambda x: min(
-                (
-                    x.resistance_runtime
-                    + x.resistance_runtime_nm1
-                    + x.resistance_runtime_nm2
+        ).values
+
+        in_core = self._core_hours(core_day_set)
+        denominator = (
+            pd.Series(resistance_runtime[in_core] * resistance_slope).sum()
+            + pd.Series(adjusted_heat_runtime[in_core] * heat_slope).sum()
+        )
+
+        # Excess resistance over an n hour window is the smaller of the
+        # resistance runtime and the available compressor runtime in the
+        # window (this hour and the n - 1 before it), averaged over the window.
+        excess_resistance_scores = []
+        resistance_window = 0
+        compressor_window = 0
+        for hours in (1, 2, 3):
+            resistance_window = (
+                resistance_window + _shift(resistance_runtime, hours - 1)[in_core]
+            )
+            compressor_window = (
+                compressor_window
+                + _shift(available_compressor_runtime, hours - 1)[in_core]
+            )
+            excess_resistance = (
+                _elementwise_min(
+                    resistance_window * resistance_slope,
+                    compressor_window * heat_slope,
                 )
-                * resistance_slope,
-                (
-                    x.available_compressor_runtime
-                    + x.available_compressor_runtime_nm1
-                    + x.available_compressor_runtime_nm2
-                )
-                * heat_slope,
+                / hours
+            )
+            excess_resistance_scores.append(
+                pd.Series(excess_resistance).sum() / denominator
             )
-            / 3,
-            axis=1,
-        )
-
-        excess_resistance_score_1hr = df.excess_resistance_1hr.sum() / (
-            (df.resistance_runtime * resistance_slope).sum()
-            + (df.adjusted_heat_runtime * heat_slope).sum()
-        )
-        excess_resistance_score_2hr = df.excess_resistance_2hr.sum() / (
-            (df.resistance_runtime * resistance_slope).sum()
-            + (df.adjusted_heat_runtime * heat_slope).sum()
-        )
-        excess_resistance_score_3hr = df.excess_resistance_3hr.sum() / (
-            (df.resistance_runtime * resistance_slope).sum()
-            + (df.adjusted_heat_runtime * heat_slope).sum()
-        )
 
-        return (
-            excess_resistance_score_1hr,
-            excess_resistance_score_2hr,
-            excess_resistance_score_3hr,
-        )
+        return tuple(excess_resistance_scores)
 
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_binned_demand_daily(self, demand, bins):
         """NWMOD: Create a binned dataframe for thermal demand.
 
@@ -2029,16 +2670,13 @@ class Thermostat(object):
         binned_demand : pandas.DataFrame
             A dataframe containing a timeseries of thermal demand and temperature bin.
         """
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
         if demand is None:
             return None
         elif type(demand) == pd.Series:
             demand = pd.DataFrame(demand).rename(columns={0: "demand"})
-            temperature = pd.DataFrame(
-                self.temperature_out.resample("D").agg(np.mean)
-            ).rename(columns={0: "temperature_out"})
+            temperature = pd.DataFrame(self.temperature_out_daily).rename(
+                columns={0: "temperature_out"}
+            )
         # Merge the demand df with outdoor temperature by timestamp
         df = demand.merge(temperature, left_index=True, right_index=True)
 
@@ -2046,6 +2684,7 @@ class Thermostat(object):
         df["bins"] = pd.cut(df.temperature_out, bins)
         return df
 
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_rh_metrics_daily(self, bins, core_day_set):
         """NWMOD: Calculate resistance heat utilization metrics using daily data.
 
@@ -2054,70 +2693,114 @@ class Thermostat(object):
         rh_metrics : dict
             Dictionary of resistance heat metrics
         """
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
-        # Get resistance heat runtime timeseries and bin by outdoor temperature
+        # Get resistance heat runtime timeseries
         runtime_temp = self.get_resistance_heat_utilization_runtime(core_day_set)
         runtime_temp["n_points"] = 1
-        runtime_temp["bins"] = pd.cut(runtime_temp["temperature"], bins)
-        runtime_rhu = runtime_temp.groupby("bins")[
-            "heat_runtime", "aux_runtime", "emg_runtime", "n_points"
-        ].sum()
+
+        # Get the daily baseline resistance heat runtime
+        runtime_temp_baseline = self.runtime_heatpump_baseline.groupby(
+            "day_of_year"
+        ).agg(
+            {
+                "temperature": "mean",
+                "heat_runtime": "sum",
+                "aux_runtime": "sum",
+                "emg_runtime": "sum",
+            }
+        )
+
+        return self._rh_metrics(
+            runtime_temp,
+            runtime_temp_baseline,
+            partial(self.get_binned_demand_daily, self.heating_demand, bins),
+            bins,
+            n_points_threshold=2,
+            frequency="daily",
+        )
+
+    def _rh_metrics(
+        self,
+        runtime_temp,
+        runtime_temp_baseline,
+        get_binned_demand,
+        bins,
+        n_points_threshold,
+        frequency,
+    ):
+        """NWMOD: Calculate resistance heat utilization metrics from binned
+        runtimes; shared by get_rh_metrics_daily and get_rh_metrics_hourly.
+
+        Parameters
+        ----------
+        runtime_temp : pandas.DataFrame
+            Heat, auxiliary and emergency runtime, outdoor temperature and
+            number of points of the core day set.
+        runtime_temp_baseline : pandas.DataFrame
+            Baseline heat, auxiliary and emergency runtime and outdoor
+            temperature at the same frequency.
+        get_binned_demand : callable
+            Returns the binned heating demand at the same frequency.
+        bins : list
+            List of bin endpoints for resistance heat utilization calculations.
+        n_points_threshold : int
+            Data quality filter of the sigmoid model fit.
+        frequency : str
+            "daily" or "hourly", the suffix of the metric names.
+
+        Returns
+        -------
+        rh_metrics : dict
+            Dictionary of resistance heat metrics
+        """
+        metric_names = [
+            "{}_{}".format(name, frequency)
+            for name in (
+                "dnru",
+                "dnru_reduction",
+                "mu_estimate",
+                "sigma_estimate",
+                "sigmoid_model_error",
+                "sigmoid_integral",
+                "aux_exceeds_heat_runtime",
+            )
+        ]
+
         # Calculate the resistance heat utilization in every temperature bin
+        runtime_rhu = _sum_by_bin(
+            runtime_temp,
+            bins,
+            ["heat_runtime", "aux_runtime", "emg_runtime", "n_points"],
+        )
         runtime_rhu["rhu"] = (
             runtime_rhu["aux_runtime"] + runtime_rhu["emg_runtime"]
         ) / (runtime_rhu["heat_runtime"] + runtime_rhu["emg_runtime"])
 
         # Error catching for empty dataframes
-        if (self.heating_demand is None) | (len(runtime_rhu.dropna().index) == 0):
-            return {
-                "dnru_daily": np.nan,
-                "dnru_reduction_daily": np.nan,
-                "mu_estimate_daily": np.nan,
-                "sigma_estimate_daily": np.nan,
-                "sigmoid_model_error_daily": np.nan,
-                "sigmoid_integral_daily": np.nan,
-                "aux_exceeds_heat_runtime_daily": np.nan,
-            }
-        if len(self.heating_demand) == 0:
-            return {
-                "dnru_daily": np.nan,
-                "dnru_reduction_daily": np.nan,
-                "mu_estimate_daily": np.nan,
-                "sigma_estimate_daily": np.nan,
-                "sigmoid_model_error_daily": np.nan,
-                "sigmoid_integral_daily": np.nan,
-                "aux_exceeds_heat_runtime_daily": np.nan,
-            }
-        # Merge demand timeseries with resistance heat utilization on
-        # outdoor temperature bin
-        binned_demand = self.get_binned_demand_daily(self.heating_demand, bins)
-        binned_demand = binned_demand.merge(
-            runtime_rhu.loc[:, "rhu"], left_on="bins", right_index=True
-        )
+        if (
+            self.heating_demand is None
+            or len(runtime_rhu.dropna().index) == 0
+            or len(self.heating_demand) == 0
+        ):
+            return dict.fromkeys(metric_names, np.nan)
+
+        # Look up the resistance heat utilization of the outdoor temperature bin
+        # of every demand row, dropping rows outside the bins.
+        binned_demand = get_binned_demand()
+        bin_idx = binned_demand["bins"].cat.codes.values
+        in_bins = bin_idx >= 0
+        bin_idx = bin_idx[in_bins]
+        demand = binned_demand["demand"].values[in_bins]
+        demand_sum = pd.Series(demand).sum()
+        rhu = runtime_rhu["rhu"].values[bin_idx]
         # Get the weighted average resistance heat utilization
-        binned_demand["rhu_norm"] = binned_demand.demand * binned_demand.rhu
-        dnru_daily = binned_demand.rhu_norm.sum() / binned_demand.demand.sum()
+        dnru = pd.Series(demand * rhu).sum() / demand_sum
 
-        # Get the baseline resistance heat runtime and assign temperature bins
-        runtime_temp_baseline = self.runtime_heatpump_baseline.groupby(
-            "day_of_year"
-        ).agg(
-            {
-                "temperature": np.mean,
-                "heat_runtime": np.sum,
-                "aux_runtime": np.sum,
-                "emg_runtime": np.sum,
-            }
+        # Get the baseline resistance heat utilization by temperature bin
+        runtime_rhu_baseline = _sum_by_bin(
+            runtime_temp_baseline,
+            bins,
+            ["heat_runtime", "aux_runtime", "emg_runtime"],
         )
-        runtime_temp_baseline["bins"] = pd.cut(
-            runtime_temp_baseline["temperature"], bins
-        )
-        runtime_rhu_baseline = runtime_temp_baseline.groupby("bins")[
-            "heat_runtime", "aux_runtime", "emg_runtime"
-        ].sum()
-        # Calculate resistance heat utilization
         runtime_rhu_baseline["rhu_baseline"] = (
             runtime_rhu_baseline["aux_runtime"] + runtime_rhu_baseline["emg_runtime"]
         ) / (
@@ -2125,21 +2808,10 @@ class Thermostat(object):
             + runtime_rhu_baseline["emg_runtime"]
             + 0.00001
         )
-        # Merge demand timeseries with resistance heat utilization on
-        # outdoor temperature bin
-        binned_demand = binned_demand.merge(
-            runtime_rhu_baseline.loc[:, "rhu_baseline"],
-            left_on="bins",
-            right_index=True,
-        )
+        rhu_baseline = runtime_rhu_baseline["rhu_baseline"].values[bin_idx]
         # Get the demand normalized difference in resistance heat utilization and
         # calculate the weighted average
-        binned_demand["rhu_norm_reduction"] = binned_demand.demand * (
-            binned_demand.rhu_baseline - binned_demand.rhu
-        )
-        dnru_reduction_daily = (
-            binned_demand.rhu_norm_reduction.sum() / binned_demand.demand.sum()
-        )
+        dnru_reduction = pd.Series(demand * (rhu_baseline - rhu)).sum() / demand_sum
 
         # Get the sigmoid model outputs
         (
@@ -2147,20 +2819,29 @@ class Thermostat(object):
             sigma_estimate,
             sigmoid_model_error,
             sigmoid_integral,
-        ) = self.fit_sigmoid_model(runtime_rhu)
-
-        return {
-            "dnru_daily": dnru_daily,
-            "dnru_reduction_daily": dnru_reduction_daily,
-            "mu_estimate_daily": mu_estimate,
-            "sigma_estimate_daily": sigma_estimate,
-            "sigmoid_model_error_daily": sigmoid_model_error,
-            "sigmoid_integral_daily": sigmoid_integral,
-            "aux_exceeds_heat_runtime_daily": any(
-                runtime_rhu.aux_runtime > runtime_rhu.heat_runtime
-            ),
-        }
+        ) = self.fit_sigmoid_model(runtime_rhu, n_points_threshold)
 
+        aux_exceeds_heat_runtime = bool(
+            np.any(
+                runtime_rhu["aux_runtime"].values > runtime_rhu["heat_runtime"].values
+            )
+        )
+        return dict(
+            zip(
+                metric_names,
+                (
+                    dnru,
+                    dnru_reduction,
+                    mu_estimate,
+                    sigma_estimate,
+                    sigmoid_model_error,
+                    sigmoid_integral,
+                    aux_exceeds_heat_runtime,
+                ),
+            )
+        )
+
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_binned_demand_hourly(self, bins):
         """NWMOD: Create a binned dataframe for thermal demand.
 
@@ -2176,23 +2857,21 @@ class Thermostat(object):
         binned_demand : pandas.DataFrame
             A dataframe containing a timeseries of thermal demand and temperature bin.
         """
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
-        demand = (self.temperature_in - self.temperature_out - self.tau).apply(
-            lambda x: np.maximum(x, 0)
-        )
-        demand = pd.DataFrame(demand).rename(columns={0: "demand"})
-        temperature = pd.DataFrame(self.temperature_out).rename(
-            columns={0: "temperature"}
+        # Demand and outdoor temperature share the hourly index, so the frame is
+        # built from the arrays directly.
+        df = pd.DataFrame(
+            {
+                "demand": np.maximum(self.hourly_deltaT.values - self.tau, 0.0),
+                "temperature": self.temperature_out.values,
+            },
+            index=self.temperature_out.index,
         )
-        # Merge the demand df with outdoor temperature by timestamp
-        df = demand.merge(temperature, left_index=True, right_index=True)
 
         # Create the bins and group by them
         df["bins"] = pd.cut(df.temperature, bins)
         return df
 
+    @_requires(_protect_resistance_heat, _protect_aux_emerg)
     def get_rh_metrics_hourly(self, bins, core_day_set):
         """NWMOD: Calculate resistance heat utilization metrics using hourly data.
 
@@ -2201,111 +2880,36 @@ class Thermostat(object):
         rh_metrics : dict
             Dictionary of resistance heat metrics
         """
-        self._protect_resistance_heat()
-        self._protect_aux_emerg()
-
-        # Build a resistance heat runtime timeseries and bin by outdoor temperature
-        runtime_temp = pd.DataFrame()
-        runtime_temp["temperature"] = self.temperature_out
-        runtime_temp["heat_runtime"] = self.heat_runtime_hourly
-        runtime_temp["aux_runtime"] = self.auxiliary_heat_runtime
-        runtime_temp["emg_runtime"] = self.emergency_heat_runtime
-        runtime_temp["n_points"] = 1
-        runtime_temp["bins"] = pd.cut(runtime_temp["temperature"], bins)
-        runtime_temp = runtime_temp[core_day_set.hourly]
-
-        # Calculate the resistance heat utilization in every temperature bin
-        runtime_rhu = runtime_temp.groupby("bins")[
-            "heat_runtime", "aux_runtime", "emg_runtime", "n_points"
-        ].sum()
-        runtime_rhu["rhu"] = (
-            runtime_rhu["aux_runtime"] + runtime_rhu["emg_runtime"]
-        ) / (runtime_rhu["heat_runtime"] + runtime_rhu["emg_runtime"])
-
-        # Error catching for empty dataframes
-        if len(runtime_rhu.dropna().index) == 0:
-            return {
-                "dnru_hourly": np.nan,
-                "dnru_reduction_hourly": np.nan,
-                "mu_estimate_hourly": np.nan,
-                "sigma_estimate_hourly": np.nan,
-                "sigmoid_model_error_hourly": np.nan,
-                "sigmoid_integral_hourly": np.nan,
-                "aux_exceeds_heat_runtime_hourly": np.nan,
-            }
-        if len(self.heating_demand) == 0:
-            return {
-                "dnru_hourly": np.nan,
-                "dnru_reduction_hourly": np.nan,
-                "mu_estimate_hourly": np.nan,
-                "sigma_estimate_hourly": np.nan,
-                "sigmoid_model_error_hourly": np.nan,
-                "sigmoid_integral_hourly": np.nan,
-                "aux_exceeds_heat_runtime_hourly": np.nan,
-            }
-
-        # Merge demand timeseries with resistance heat utilization on
-        # outdoor temperature bin
-        binned_demand = self.get_binned_demand_hourly(bins)
-        binned_demand = binned_demand.merge(
-            runtime_rhu.loc[:, "rhu"], left_on="bins", right_index=True
-        )
-        # Get the weighted average resistance heat utilization
-        binned_demand["rhu_norm"] = binned_demand.demand * binned_demand.rhu
-        dnru_hourly = binned_demand.rhu_norm.sum() / binned_demand.demand.sum()
-
-        # Get the baseline resistance heat runtime and assign temperature bins
-        runtime_temp_baseline = self.runtime_heatpump_baseline
-        runtime_temp_baseline["bins"] = pd.cut(
-            runtime_temp_baseline["temperature"], bins
-        )
-        runtime_rhu_baseline = runtime_temp_baseline.groupby("bins")[
-            "heat_runtime", "aux_runtime", "emg_runtime"
-        ].sum()
-        # Calculate resistance heat utilization
-        runtime_rhu_baseline["rhu_baseline"] = (
-            runtime_rhu_baseline["aux_runtime"] + runtime_rhu_baseline["emg_runtime"]
-        ) / (
-            runtime_rhu_baseline["heat_runtime"]
-            + runtime_rhu_baseline["emg_runtime"]
-            + 0.00001
-        )
-        # Merge demand timeseries with resistance heat utilization on
-        # outdoor temperature bin
-        binned_demand = binned_demand.merge(
-            runtime_rhu_baseline.loc[:, "rhu_baseline"],
-            left_on="bins",
-            right_index=True,
-        )
-        # Get the demand normalized difference in resistance heat utilization and
-        # calculate the weighted average
-        binned_demand["rhu_norm_reduction"] = binned_demand.demand * (
-            binned_demand.rhu_baseline - binned_demand.rhu
-        )
-        dnru_reduction_hourly = (
-            binned_demand.rhu_norm_reduction.sum() / binned_demand.demand.sum()
-        )
-
-        # Get the sigmoid model outputs
-        (
-            mu_estimate,
-            sigma_estimate,
-            sigmoid_model_error,
-            sigmoid_integral,
-        ) = self.fit_sigmoid_model(runtime_rhu, 48)
-
-        return {
-            "dnru_hourly": dnru_hourly,
-            "dnru_reduction_hourly": dnru_reduction_hourly,
-            "mu_estimate_hourly": mu_estimate,
-            "sigma_estimate_hourly": sigma_estimate,
-            "sigmoid_model_error_hourly": sigmoid_model_error,
-            "sigmoid_integral_hourly": sigmoid_integral,
-            "aux_exceeds_heat_runtime_hourly": any(
-                runtime_rhu.aux_runtime > runtime_rhu.heat_runtime
-            ),
-        }
+        # Build a resistance heat runtime timeseries for the core hours
+        runtime_temp = pd.DataFrame(
+            {
+                "temperature": self.temperature_out,
+                "heat_runtime": self.heat_runtime_hourly,
+                "aux_runtime": self.auxiliary_heat_runtime,
+                "emg_runtime": self.emergency_heat_runtime,
+                "n_points": 1,
+            },
+            index=self.temperature_out.index,
+        )
+        runtime_temp = runtime_temp[self._core_hours(core_day_set)]
+
+        return self._rh_metrics(
+            runtime_temp,
+            self.runtime_heatpump_baseline,
+            partial(self.get_binned_demand_hourly, bins),
+            bins,
+            n_points_threshold=48,
+            frequency="hourly",
+        )
+
+    def _hourly_baseline_temperature(self, core_day_set, temp_baseline):
+        """NWMOD: Baseline indoor temperature of each core hour, looked up by
+        hour of year in an hourly temperature baseline.
+        """
+        baseline = _baseline_by_hour_of_year(temp_baseline)
+        return baseline[self.hour_of_year[self._core_hours(core_day_set)]]
 
+    @_requires(_protect_cooling)
     def get_baseline_hourly_cooling_demand(
         self, core_cooling_day_set, temp_baseline, tau
     ):
@@ -2316,41 +2920,19 @@ class Thermostat(object):
         baseline_hourly_demand : pd.Series
             Timeseries of daily demand using a regional baseline
         """
-        self._protect_cooling()
-
         # Get the outdoor temperature for this core day set
-        hourly_temp_out = self.temperature_out[core_cooling_day_set.hourly]
-        if len(hourly_temp_out) == 0:
+        if not self._core_hours(core_cooling_day_set).any():
             return pd.Series()
 
-        # Build a dataframe of outdoor temperature and merge it with the
-        # baseline temperature timeseries
-        df = pd.DataFrame()
-        df["temperature_out"] = hourly_temp_out
-        df.index = hourly_temp_out.index
-        df["leap_adjustment"] = (df.index.is_leap_year) & (df.index.dayofyear >= 59)
-        df["hour_of_year"] = (
-            1 + df.index.hour + (df.index.dayofyear - 1 - df.leap_adjustment) * 24
+        temperature_in = self._hourly_baseline_temperature(
+            core_cooling_day_set, temp_baseline
         )
-
-        df = df.merge(temp_baseline, on="hour_of_year")
-
-        # Calculate demand using the difference between actual indoor temperature
-        # and the baseline temperature adjusted by tau
-        hourly_cdd = (tau - (df.temperature_in - df.temperature_out)).apply(
-            lambda x: np.maximum(x, 0)
-        )
-        # Aggregate to daily level
-        demand = np.array(
-            [
-                cdd.sum() / 24
-                for day, cdd in hourly_cdd.groupby(hourly_temp_out.index.date)
-            ]
+        demands = self._baseline_demands(
+            core_cooling_day_set, [temperature_in], tau, -1
         )
+        return _core_day_series(core_cooling_day_set, demands[0])
 
-        index = core_cooling_day_set.daily[core_cooling_day_set.daily].index
-        return pd.Series(demand, index=index)
-
+    @_requires(_protect_heating)
     def get_baseline_hourly_heating_demand(
         self, core_heating_day_set, temp_baseline, tau
     ):
@@ -2361,46 +2943,22 @@ class Thermostat(object):
         baseline_hourly_demand : pd.Series
             Timeseries of daily demand using a regional baseline
         """
-        self._protect_heating()
-
         # Get the outdoor temperature for this core day set
-        hourly_temp_out = self.temperature_out[core_heating_day_set.hourly]
-        if len(hourly_temp_out) == 0:
+        if not self._core_hours(core_heating_day_set).any():
             return pd.Series()
 
-        # Build a dataframe of outdoor temperature and merge it with the
-        # baseline temperature timeseries
-        df = pd.DataFrame()
-        df["temperature_out"] = hourly_temp_out
-        df.index = hourly_temp_out.index
-        df["leap_adjustment"] = (df.index.is_leap_year) & (df.index.dayofyear >= 59)
-        df["hour_of_year"] = (
-            1 + df.index.hour + (df.index.dayofyear - 1 - df.leap_adjustment) * 24
-        )
-
-        df = df.merge(temp_baseline, on="hour_of_year")
-
-        # Calculate demand using the difference between actual indoor temperature
-        # and the baseline temperature adjusted by tau
-        hourly_hdd = (df.temperature_in - df.temperature_out - tau).apply(
-            lambda x: np.maximum(x, 0)
-        )
-        # Aggregate to daily level
-        demand = np.array(
-            [
-                hdd.sum() / 24
-                for day, hdd in hourly_hdd.groupby(hourly_temp_out.index.date)
-            ]
+        temperature_in = self._hourly_baseline_temperature(
+            core_heating_day_set, temp_baseline
         )
-
-        index = core_heating_day_set.daily[core_heating_day_set.daily].index
-        return pd.Series(demand, index=index)
+        demands = self._baseline_demands(core_heating_day_set, [temperature_in], tau, 1)
+        return _core_day_series(core_heating_day_set, demands[0])
 
     def calculate_epa_field_savings_metrics(
         self,
         core_cooling_day_set_method="year_end_to_end",
         core_heating_day_set_method="year_mid_to_mid",
         climate_zone_mapping=None,
+        parallel=False,
     ):
         """Calculates metrics for connected thermostat savings as defined by
         the specification defined by the EPA Energy Star program and stakeholders.
@@ -2431,6 +2989,12 @@ class Thermostat(object):
 
             :download:`default mapping <./resources/Building America Climate Zone to Zipcode Database_Rev2_2016.09.08.csv>`
 
+        parallel : bool, default: False
+            If True, the core day sets are computed in separate processes.
+            Not available inside a multiprocessing pool worker such as those of
+            :any:`thermostat_nw.multiple`, which already compute one thermostat
+            per process.
+
         Returns
         -------
         metrics : list
@@ -2447,42 +3011,99 @@ class Thermostat(object):
             retval.baseline_regional_heating_comfort_temperature
         )
 
-        metrics = []
-
+        tasks = []
         if self.has_cooling:
             for core_cooling_day_set in self.get_core_cooling_days(
                 method=core_cooling_day_set_method
             ):
-
-                outputs = self._calculate_cooling_epa_field_savings_metrics(
-                    climate_zone,
-                    core_cooling_day_set,
-                    core_cooling_day_set_method,
-                    baseline_regional_cooling_comfort_temperature,
+                tasks.append(
+                    (
+                        "cooling",
+                        climate_zone,
+                        core_cooling_day_set,
+                        core_cooling_day_set_method,
+                        baseline_regional_cooling_comfort_temperature,
+                    )
                 )
-                metrics.append(outputs)
 
         if self.has_heating:
             for core_heating_day_set in self.get_core_heating_days(
                 method=core_heating_day_set_method
             ):
-                outputs = self._calculate_heating_epa_field_savings_metrics(
-                    climate_zone,
-                    core_heating_day_set,
-                    core_heating_day_set_method,
-                    baseline_regional_heating_comfort_temperature,
+                tasks.append(
+                    (
+                        "heating",
+                        climate_zone,
+                        core_heating_day_set,
+                        core_heating_day_set_method,
+                        baseline_regional_heating_comfort_temperature,
+                    )
                 )
 
-                if self.has_auxiliary and self.has_emergency:
-                    additional_outputs = (
-                        self._calculate_aux_emerg_epa_field_savings_metrics(
-                            core_heating_day_set
-                        )
-                    )
-                    outputs.update(additional_outputs)
+        if parallel and len(tasks) > 1:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(partial(_core_day_set_metrics, self), tasks))
+        return [self._core_day_set_metrics(*task) for task in tasks]
+
+    def _core_day_set_metrics(
+        self,
+        heating_or_cooling,
+        climate_zone,
+        core_day_set,
+        core_day_set_method,
+        baseline_regional_comfort_temperature,
+    ):
+        """Output metrics of one core cooling or heating day set, as returned
+        in the list of calculate_epa_field_savings_metrics, with Python rather
+        than NumPy scalars.
+        """
+        if heating_or_cooling == "cooling":
+            outputs = self._calculate_cooling_epa_field_savings_metrics(
+                climate_zone,
+                core_day_set,
+                core_day_set_method,
+                baseline_regional_comfort_temperature,
+            )
+        else:
+            outputs = self._calculate_heating_epa_field_savings_metrics(
+                climate_zone,
+                core_day_set,
+                core_day_set_method,
+                baseline_regional_comfort_temperature,
+            )
+            if self.has_auxiliary and self.has_emergency:
+                outputs.update(
+                    self._calculate_aux_emerg_epa_field_savings_metrics(core_day_set)
+                )
+        return _python_scalars(outputs)
+
+    def _mean_daily_runtimes(self, core_day_set):
+        """Mean daily cooling, heating, auxiliary and emergency runtime over the
+        days of core_day_set, computed together from one (4, days) array.
+        Days with missing runtime are skipped, like in Series.mean; equipment
+        without runtime has a NaN mean.
+        """
+        days = core_day_set.daily
+        in_core = core_day_set.daily_values
+        runtimes = np.empty((4, core_day_set.n_days))
+        for row, runtime_daily in zip(
+            runtimes,
+            (
+                self.cool_runtime_daily,
+                self.heat_runtime_daily,
+                self.auxiliary_runtime_daily,
+                self.emergency_runtime_daily,
+            ),
+        ):
+            if not runtime_daily.index.equals(days.index):
+                runtime_daily = runtime_daily.reindex(days.index)
+            row[:] = runtime_daily.values[in_core]
 
-                metrics.append(outputs)
-        return metrics
+        missing = np.isnan(runtimes)
+        runtimes[missing] = 0.0
+        n_days = runtimes.shape[1] - missing.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return tuple(runtimes.sum(axis=1) / n_days)
 
     def _calculate_cooling_epa_field_savings_metrics(
         self,
@@ -2512,8 +3133,9 @@ class Thermostat(object):
         ) = self.get_cooling_demand(core_cooling_day_set)
 
         total_runtime_core_cooling = daily_runtime.sum()
-        n_days = core_cooling_day_set.daily.sum()
-        n_hours = core_cooling_day_set.hourly.sum()
+        mean_demand = np.nanmean(demand)
+        n_days = core_cooling_day_set.n_days
+        n_hours = core_cooling_day_set.n_hours
 
         if np.isnan(total_runtime_core_cooling):
             warnings.warn(
@@ -2528,138 +3150,41 @@ class Thermostat(object):
         if n_hours == 0:
             warnings.warn("WARNING: Number of valid cooling hours is zero.")
 
-        average_daily_cooling_runtime = np.divide(total_runtime_core_cooling, n_days)
-
-        avg_daily_cooling_runtime = self.cool_runtime_daily[
-            core_cooling_day_set.daily
-        ].mean()
-        avg_daily_heating_runtime = self.heat_runtime_daily[
-            core_cooling_day_set.daily
-        ].mean()
-        avg_daily_auxiliary_runtime = self.auxiliary_runtime_daily[
-            core_cooling_day_set.daily
-        ].mean()
-        avg_daily_emergency_runtime = self.emergency_runtime_daily[
-            core_cooling_day_set.daily
-        ].mean()
-
-        baseline10_demand = self.get_baseline_cooling_demand(
-            core_cooling_day_set,
-            baseline10_comfort_temperature,
-            tau,
-        )
-
-        baseline10_runtime = self.get_baseline_cooling_runtime(baseline10_demand, alpha)
-
-        avoided_runtime_baseline10 = avoided(baseline10_runtime, daily_runtime)
-
-        savings_baseline10 = percent_savings(
-            avoided_runtime_baseline10, baseline10_runtime, self.thermostat_id
-        )
-
-        if baseline_regional_cooling_comfort_temperature is not None:
-
-            baseline_regional_demand = self.get_baseline_cooling_demand(
-                core_cooling_day_set, baseline_regional_cooling_comfort_temperature, tau
-            )
-
-            baseline_regional_runtime = self.get_baseline_cooling_runtime(
-                baseline_regional_demand, alpha
-            )
-
-            avoided_runtime_baseline_regional = avoided(
-                baseline_regional_runtime, daily_runtime
-            )
-
-            percent_savings_baseline_regional = percent_savings(
-                avoided_runtime_baseline_regional,
-                baseline_regional_runtime,
-                self.thermostat_id,
-            )
-
-            avoided_daily_mean_core_day_runtime_baseline_regional = (
-                avoided_runtime_baseline_regional.mean()
-            )
-            avoided_total_core_day_runtime_baseline_regional = (
-                avoided_runtime_baseline_regional.sum()
-            )
-            baseline_daily_mean_core_day_runtime_baseline_regional = (
-                baseline_regional_runtime.mean()
-            )
-            baseline_total_core_day_runtime_baseline_regional = (
-                baseline_regional_runtime.sum()
-            )
-            _daily_mean_core_day_demand_baseline_baseline_regional = np.nanmean(
-                baseline_regional_demand
-            )
-
-        else:
-
-            baseline_regional_demand = None
-            baseline_regional_runtime = None
-
-            avoided_runtime_baseline_regional = None
-
-            percent_savings_baseline_regional = None
-            avoided_daily_mean_core_day_runtime_baseline_regional = None
-            avoided_total_core_day_runtime_baseline_regional = None
-            baseline_daily_mean_core_day_runtime_baseline_regional = None
-            baseline_total_core_day_runtime_baseline_regional = None
-            _daily_mean_core_day_demand_baseline_baseline_regional = None
+        # Scalar division on a NumPy float, as in percent_savings: no days
+        # still gives nan.
+        average_daily_cooling_runtime = np.float64(total_runtime_core_cooling) / n_days
 
+        (
+            avg_daily_cooling_runtime,
+            avg_daily_heating_runtime,
+            avg_daily_auxiliary_runtime,
+            avg_daily_emergency_runtime,
+        ) = self._mean_daily_runtimes(core_cooling_day_set)
+
+        # The percentile, regional and hourly regional baseline demands are
+        # computed together, in one pass over the core hours.
         if self.hourly_temperature_baseline_cooling is not None:
-
-            baseline_hourly_regional_demand = self.get_baseline_hourly_cooling_demand(
-                core_cooling_day_set,
-                self.hourly_temperature_baseline_cooling,
-                tau,
-            )
-
-            baseline_hourly_regional_runtime = self.get_baseline_cooling_runtime(
-                baseline_hourly_regional_demand,
-                alpha,
-            )
-
-            avoided_runtime_baseline_hourly_regional = avoided(
-                baseline_hourly_regional_runtime, daily_runtime
-            )
-
-            percent_savings_baseline_hourly_regional = percent_savings(
-                avoided_runtime_baseline_hourly_regional,
-                baseline_hourly_regional_runtime,
-                self.thermostat_id,
-            )
-
-            avoided_daily_mean_core_day_runtime_baseline_hourly_regional = (
-                avoided_runtime_baseline_hourly_regional.mean()
-            )
-            avoided_total_core_day_runtime_baseline_hourly_regional = (
-                avoided_runtime_baseline_hourly_regional.sum()
+            hourly_temp_baseline = self._hourly_baseline_temperature(
+                core_cooling_day_set, self.hourly_temperature_baseline_cooling
             )
-            baseline_daily_mean_core_day_runtime_baseline_hourly_regional = (
-                baseline_hourly_regional_runtime.mean()
-            )
-            baseline_total_core_day_runtime_baseline_hourly_regional = (
-                baseline_hourly_regional_runtime.sum()
-            )
-            _daily_mean_core_day_demand_baseline_baseline_hourly_regional = np.nanmean(
-                baseline_hourly_regional_demand
-            )
-
         else:
-
-            baseline_hourly_regional_demand = None
-
-            baseline_hourly_regional_runtime = None
-
-            avoided_runtime_baseline_hourly_regional = None
-
-            percent_savings_baseline_hourly_regional = None
-            avoided_daily_mean_core_day_runtime_baseline_hourly_regional = None
-            avoided_total_core_day_runtime_baseline_hourly_regional = None
-            baseline_daily_mean_core_day_runtime_baseline_hourly_regional = None
-            baseline_total_core_day_runtime_baseline_hourly_regional = None
-            _daily_mean_core_day_demand_baseline_baseline_hourly_regional = None
+            hourly_temp_baseline = None
+        temp_baselines = {
+            "baseline_percentile": baseline10_comfort_temperature,
+            "baseline_regional": baseline_regional_cooling_comfort_temperature,
+            "baseline_hourly_regional": hourly_temp_baseline,
+        }
+        temp_baselines = {
+            baseline: temp_baseline
+            for baseline, temp_baseline in temp_baselines.items()
+            if temp_baseline is not None
+        }
+        baseline_demands = self._baseline_demands(
+            core_cooling_day_set, list(temp_baselines.values()), tau, -1
+        )
+        savings_outputs = _savings_outputs(
+            list(temp_baselines), baseline_demands, alpha, daily_runtime.values
+        )
 
         n_days_both, n_days_insufficient_data = self.get_ignored_days(
             core_cooling_day_set
@@ -2669,11 +3194,12 @@ class Thermostat(object):
             core_cooling_day_set
         )
 
+        core_hours = self._core_hours(core_cooling_day_set)
         core_cooling_days_mean_indoor_temperature = self.temperature_in[
-            core_cooling_day_set.hourly
+            core_hours
         ].mean()
         core_cooling_days_mean_outdoor_temperature = self.temperature_out[
-            core_cooling_day_set.hourly
+            core_hours
         ].mean()
 
         heat_gain_constant, heat_loss_constant = self.get_temperature_constants(
@@ -2710,39 +3236,16 @@ class Thermostat(object):
             "zipcode": self.zipcode,
             "station": self.station,
             "climate_zone": climate_zone,
-            "start_date": pd.Timestamp(core_cooling_day_set.start_date)
-            .to_pydatetime()
-            .isoformat(),
-            "end_date": pd.Timestamp(core_cooling_day_set.end_date)
-            .to_pydatetime()
-            .isoformat(),
+            "start_date": _isoformat(core_cooling_day_set.start_date),
+            "end_date": _isoformat(core_cooling_day_set.end_date),
             "n_days_in_inputfile_date_range": n_days_in_inputfile_date_range,
             "n_days_both_heating_and_cooling": n_days_both,
             "n_days_insufficient_data": n_days_insufficient_data,
             "n_core_cooling_days": n_core_cooling_days,
             "baseline_percentile_core_cooling_comfort_temperature": baseline10_comfort_temperature,
             "regional_average_baseline_cooling_comfort_temperature": baseline_regional_cooling_comfort_temperature,
-            "percent_savings_baseline_percentile": savings_baseline10,
-            "avoided_daily_mean_core_day_runtime_baseline_percentile": avoided_runtime_baseline10.mean(),
-            "avoided_total_core_day_runtime_baseline_percentile": avoided_runtime_baseline10.sum(),
-            "baseline_daily_mean_core_day_runtime_baseline_percentile": baseline10_runtime.mean(),
-            "baseline_total_core_day_runtime_baseline_percentile": baseline10_runtime.sum(),
-            "_daily_mean_core_day_demand_baseline_baseline_percentile": np.nanmean(
-                baseline10_demand
-            ),
-            "percent_savings_baseline_regional": percent_savings_baseline_regional,
-            "avoided_daily_mean_core_day_runtime_baseline_regional": avoided_daily_mean_core_day_runtime_baseline_regional,
-            "avoided_total_core_day_runtime_baseline_regional": avoided_total_core_day_runtime_baseline_regional,
-            "baseline_daily_mean_core_day_runtime_baseline_regional": baseline_daily_mean_core_day_runtime_baseline_regional,
-            "baseline_total_core_day_runtime_baseline_regional": baseline_total_core_day_runtime_baseline_regional,
-            "_daily_mean_core_day_demand_baseline_baseline_regional": _daily_mean_core_day_demand_baseline_baseline_regional,
-            "percent_savings_baseline_hourly_regional": percent_savings_baseline_hourly_regional,
-            "avoided_daily_mean_core_day_runtime_baseline_hourly_regional": avoided_daily_mean_core_day_runtime_baseline_hourly_regional,
-            "avoided_total_core_day_runtime_baseline_hourly_regional": avoided_total_core_day_runtime_baseline_hourly_regional,
-            "baseline_daily_mean_core_day_runtime_baseline_hourly_regional": baseline_daily_mean_core_day_runtime_baseline_hourly_regional,
-            "baseline_total_core_day_runtime_baseline_hourly_regional": baseline_total_core_day_runtime_baseline_hourly_regional,
-            "_daily_mean_core_day_demand_baseline_baseline_hourly_regional": _daily_mean_core_day_demand_baseline_baseline_hourly_regional,
-            "mean_demand": np.nanmean(demand),
+            **savings_outputs,
+            "mean_demand": mean_demand,
             "tau": tau,
             "alpha": alpha,
             "mean_sq_err": mse,
@@ -2815,8 +3318,9 @@ class Thermostat(object):
         self.tau = tau
 
         total_runtime_core_heating = daily_runtime.sum()
-        n_days = core_heating_day_set.daily.sum()
-        n_hours = core_heating_day_set.hourly.sum()
+        mean_demand = np.nanmean(demand)
+        n_days = core_heating_day_set.n_days
+        n_hours = core_heating_day_set.n_hours
 
         if np.isnan(total_runtime_core_heating):
             warnings.warn(
@@ -2831,145 +3335,41 @@ class Thermostat(object):
         if n_hours == 0:
             warnings.warn("WARNING: Number of valid cooling hours is zero.")
 
-        average_daily_heating_runtime = np.divide(total_runtime_core_heating, n_days)
-
-        avg_daily_cooling_runtime = self.cool_runtime_daily[
-            core_heating_day_set.daily
-        ].mean()
-        avg_daily_heating_runtime = self.heat_runtime_daily[
-            core_heating_day_set.daily
-        ].mean()
-        avg_daily_auxiliary_runtime = self.auxiliary_runtime_daily[
-            core_heating_day_set.daily
-        ].mean()
-        avg_daily_emergency_runtime = self.emergency_runtime_daily[
-            core_heating_day_set.daily
-        ].mean()
-
-        baseline90_demand = self.get_baseline_heating_demand(
-            core_heating_day_set,
-            baseline90_comfort_temperature,
-            tau,
-        )
-
-        baseline90_runtime = self.get_baseline_heating_runtime(
-            baseline90_demand,
-            alpha,
-        )
-
-        avoided_runtime_baseline90 = avoided(baseline90_runtime, daily_runtime)
-
-        savings_baseline90 = percent_savings(
-            avoided_runtime_baseline90, baseline90_runtime, self.thermostat_id
-        )
-
-        if baseline_regional_heating_comfort_temperature is not None:
-
-            baseline_regional_demand = self.get_baseline_heating_demand(
-                core_heating_day_set,
-                baseline_regional_heating_comfort_temperature,
-                tau,
-            )
-
-            baseline_regional_runtime = self.get_baseline_heating_runtime(
-                baseline_regional_demand,
-                alpha,
-            )
-
-            avoided_runtime_baseline_regional = avoided(
-                baseline_regional_runtime, daily_runtime
-            )
-
-            percent_savings_baseline_regional = percent_savings(
-                avoided_runtime_baseline_regional,
-                baseline_regional_runtime,
-                self.thermostat_id,
-            )
-
-            avoided_daily_mean_core_day_runtime_baseline_regional = (
-                avoided_runtime_baseline_regional.mean()
-            )
-            avoided_total_core_day_runtime_baseline_regional = (
-                avoided_runtime_baseline_regional.sum()
-            )
-            baseline_daily_mean_core_day_runtime_baseline_regional = (
-                baseline_regional_runtime.mean()
-            )
-            baseline_total_core_day_runtime_baseline_regional = (
-                baseline_regional_runtime.sum()
-            )
-            _daily_mean_core_day_demand_baseline_baseline_regional = np.nanmean(
-                baseline_regional_demand
-            )
-
-        else:
-
-            baseline_regional_demand = None
-
-            baseline_regional_runtime = None
-
-            avoided_runtime_baseline_regional = None
-
-            percent_savings_baseline_regional = None
-            avoided_daily_mean_core_day_runtime_baseline_regional = None
-            avoided_total_core_day_runtime_baseline_regional = None
-            baseline_daily_mean_core_day_runtime_baseline_regional = None
-            baseline_total_core_day_runtime_baseline_regional = None
-            _daily_mean_core_day_demand_baseline_baseline_regional = None
+        # Scalar division on a NumPy float, as in percent_savings: no days
+        # still gives nan.
+        average_daily_heating_runtime = np.float64(total_runtime_core_heating) / n_days
 
+        (
+            avg_daily_cooling_runtime,
+            avg_daily_heating_runtime,
+            avg_daily_auxiliary_runtime,
+            avg_daily_emergency_runtime,
+        ) = self._mean_daily_runtimes(core_heating_day_set)
+
+        # The percentile, regional and hourly regional baseline demands are
+        # computed together, in one pass over the core hours.
         if self.hourly_temperature_baseline_heating is not None:
-
-            baseline_hourly_regional_demand = self.get_baseline_hourly_heating_demand(
-                core_heating_day_set,
-                self.hourly_temperature_baseline_heating,
-                tau,
-            )
-
-            baseline_hourly_regional_runtime = self.get_baseline_heating_runtime(
-                baseline_hourly_regional_demand,
-                alpha,
-            )
-
-            avoided_runtime_baseline_hourly_regional = avoided(
-                baseline_hourly_regional_runtime, daily_runtime
-            )
-
-            percent_savings_baseline_hourly_regional = percent_savings(
-                avoided_runtime_baseline_hourly_regional,
-                baseline_hourly_regional_runtime,
-                self.thermostat_id,
+            hourly_temp_baseline = self._hourly_baseline_temperature(
+                core_heating_day_set, self.hourly_temperature_baseline_heating
             )
-
-            avoided_daily_mean_core_day_runtime_baseline_hourly_regional = (
-                avoided_runtime_baseline_hourly_regional.mean()
-            )
-            avoided_total_core_day_runtime_baseline_hourly_regional = (
-                avoided_runtime_baseline_hourly_regional.sum()
-            )
-            baseline_daily_mean_core_day_runtime_baseline_hourly_regional = (
-                baseline_hourly_regional_runtime.mean()
-            )
-            baseline_total_core_day_runtime_baseline_hourly_regional = (
-                baseline_hourly_regional_runtime.sum()
-            )
-            _daily_mean_core_day_demand_baseline_baseline_hourly_regional = np.nanmean(
-                baseline_hourly_regional_demand
-            )
-
         else:
-
-            baseline_hourly_regional_demand = None
-
-            baseline_hourly_regional_runtime = None
-
-            avoided_runtime_baseline_hourly_regional = None
-
-            percent_savings_baseline_hourly_regional = None
-            avoided_daily_mean_core_day_runtime_baseline_hourly_regional = None
-            avoided_total_core_day_runtime_baseline_hourly_regional = None
-            baseline_daily_mean_core_day_runtime_baseline_hourly_regional = None
-            baseline_total_core_day_runtime_baseline_hourly_regional = None
-            _daily_mean_core_day_demand_baseline_baseline_hourly_regional = None
+            hourly_temp_baseline = None
+        temp_baselines = {
+            "baseline_percentile": baseline90_comfort_temperature,
+            "baseline_regional": baseline_regional_heating_comfort_temperature,
+            "baseline_hourly_regional": hourly_temp_baseline,
+        }
+        temp_baselines = {
+            baseline: temp_baseline
+            for baseline, temp_baseline in temp_baselines.items()
+            if temp_baseline is not None
+        }
+        baseline_demands = self._baseline_demands(
+            core_heating_day_set, list(temp_baselines.values()), tau, 1
+        )
+        savings_outputs = _savings_outputs(
+            list(temp_baselines), baseline_demands, alpha, daily_runtime.values
+        )
 
         n_days_both, n_days_insufficient_data = self.get_ignored_days(
             core_heating_day_set
@@ -2979,11 +3379,12 @@ class Thermostat(object):
             core_heating_day_set
         )
 
+        core_hours = self._core_hours(core_heating_day_set)
         core_heating_days_mean_indoor_temperature = self.temperature_in[
-            core_heating_day_set.hourly
+            core_hours
         ].mean()
         core_heating_days_mean_outdoor_temperature = self.temperature_out[
-            core_heating_day_set.hourly
+            core_hours
         ].mean()
 
         heat_gain_constant, heat_loss_constant = self.get_temperature_constants(
@@ -3020,39 +3421,16 @@ class Thermostat(object):
             "zipcode": self.zipcode,
             "station": self.station,
             "climate_zone": climate_zone,
-            "start_date": pd.Timestamp(core_heating_day_set.start_date)
-            .to_pydatetime()
-            .isoformat(),
-            "end_date": pd.Timestamp(core_heating_day_set.end_date)
-            .to_pydatetime()
-            .isoformat(),
+            "start_date": _isoformat(core_heating_day_set.start_date),
+            "end_date": _isoformat(core_heating_day_set.end_date),
             "n_days_in_inputfile_date_range": n_days_in_inputfile_date_range,
             "n_days_both_heating_and_cooling": n_days_both,
             "n_days_insufficient_data": n_days_insufficient_data,
             "n_core_heating_days": n_core_heating_days,
             "baseline_percentile_core_heating_comfort_temperature": baseline90_comfort_temperature,
             "regional_average_baseline_heating_comfort_temperature": baseline_regional_heating_comfort_temperature,
-            "percent_savings_baseline_percentile": savings_baseline90,
-            "avoided_daily_mean_core_day_runtime_baseline_percentile": avoided_runtime_baseline90.mean(),
-            "avoided_total_core_day_runtime_baseline_percentile": avoided_runtime_baseline90.sum(),
-            "baseline_daily_mean_core_day_runtime_baseline_percentile": baseline90_runtime.mean(),
-            "baseline_total_core_day_runtime_baseline_percentile": baseline90_runtime.sum(),
-            "_daily_mean_core_day_demand_baseline_baseline_percentile": np.nanmean(
-                baseline90_demand
-            ),
-            "percent_savings_baseline_regional": percent_savings_baseline_regional,
-            "avoided_daily_mean_core_day_runtime_baseline_regional": avoided_daily_mean_core_day_runtime_baseline_regional,
-            "avoided_total_core_day_runtime_baseline_regional": avoided_total_core_day_runtime_baseline_regional,
-            "baseline_daily_mean_core_day_runtime_baseline_regional": baseline_daily_mean_core_day_runtime_baseline_regional,
-            "baseline_total_core_day_runtime_baseline_regional": baseline_total_core_day_runtime_baseline_regional,
-            "_daily_mean_core_day_demand_baseline_baseline_regional": _daily_mean_core_day_demand_baseline_baseline_regional,
-            "percent_savings_baseline_hourly_regional": percent_savings_baseline_hourly_regional,
-            "avoided_daily_mean_core_day_runtime_baseline_hourly_regional": avoided_daily_mean_core_day_runtime_baseline_hourly_regional,
-            "avoided_total_core_day_runtime_baseline_hourly_regional": avoided_total_core_day_runtime_baseline_hourly_regional,
-            "baseline_daily_mean_core_day_runtime_baseline_hourly_regional": baseline_daily_mean_core_day_runtime_baseline_hourly_regional,
-            "baseline_total_core_day_runtime_baseline_hourly_regional": baseline_total_core_day_runtime_baseline_hourly_regional,
-            "_daily_mean_core_day_demand_baseline_baseline_hourly_regional": _daily_mean_core_day_demand_baseline_baseline_hourly_regional,
-            "mean_demand": np.nanmean(demand),
+            **savings_outputs,
+            "mean_demand": mean_demand,
             "tau": tau,
             "alpha": alpha,
             "mean_sq_err": mse,
@@ -3093,7 +3471,7 @@ class Thermostat(object):
 
         return outputs
 
-    def _rhu_outputs(self, rhu_type, rhu_bins, rhu_usage_bins, duty_cycle):
+    def _rhu_outputs(self, rhu_type, rhu_bins, rhu_usage_bins):
         """Helper function for formatting the RHU scores.
             rhu_type : str
                 String representation of the RHU type (rhu1, rhu2)
@@ -3101,32 +3479,25 @@ class Thermostat(object):
                 Data for the RHU calculation from get_resistance_heat_utilization_bins
             rhu_usage_bins :  list of tuples
                 List of the lower and upper bounds for the given RHU bin to fill with None if rhu_bins is None
-            duty_cycle : str
-                The duty cycle (e.g.: None, 'aux_duty_cycle', 'emg_duty_cycle', 'compressor_duty_cycle')
 
         Returns
         -------
         local_outputs : dict
             Dictionary of the columns and RHU data for output
         """
-        local_outputs = {}
         if rhu_bins is not None:
-            for item in rhu_bins.itertuples():
-                column = self._format_rhu(
-                    rhu_type=rhu_type,
-                    low=item.Index.left,
-                    high=item.Index.right,
-                    duty_cycle=duty_cycle,
-                )
-                if duty_cycle is None:
-                    local_outputs[column] = item.rhu
-                else:
-                    local_outputs[column] = getattr(item, duty_cycle)
+            intervals = pd.IntervalIndex(rhu_bins.index)
+            bin_pairs = zip(intervals.left.tolist(), intervals.right.tolist())
+            values = rhu_bins["rhu"].tolist()
         else:
-            for (low, high) in rhu_usage_bins:
-                column = self._format_rhu(rhu_type, low, high, duty_cycle)
+            bin_pairs = rhu_usage_bins
+            values = [None] * len(rhu_usage_bins)
 
-                local_outputs[column] = None
+        # We no longer track different duty cycles (aux, emg, compressor, etc.)
+        local_outputs = {
+            _format_rhu_column(rhu_type, low, high, None): value
+            for (low, high), value in zip(bin_pairs, values)
+        }
         return local_outputs
 
     def _calculate_aux_emerg_epa_field_savings_metrics(self, core_heating_day_set):
@@ -3140,16 +3511,25 @@ class Thermostat(object):
         }
 
         # Add RHU Calculations
+        rhu_runtime = self.get_resistance_heat_utilization_runtime(core_heating_day_set)
+        additional_outputs.update(
+            self.get_rh_metrics_daily(
+                bins=RESISTANCE_HEAT_USE_BIN, core_day_set=core_heating_day_set
+            )
+        )
+        additional_outputs.update(
+            self.get_rh_metrics_hourly(
+                bins=RESISTANCE_HEAT_USE_BIN, core_day_set=core_heating_day_set
+            )
+        )
+
+        # Only the RHU bins depend on the RHU type.
         for rhu_type in ("rhu1", "rhu2"):
             if rhu_type == "rhu2":
                 min_runtime_minutes = VAR_MIN_RHU_RUNTIME
             else:
                 min_runtime_minutes = None
 
-            rhu_runtime = self.get_resistance_heat_utilization_runtime(
-                core_heating_day_set
-            )
-
             rhu = self.get_resistance_heat_utilization_bins(
                 rhu_runtime,
                 RESISTANCE_HEAT_USE_BIN,
@@ -3164,25 +3544,11 @@ class Thermostat(object):
                 min_runtime_minutes,
             )
 
-            # We no longer track different duty cycles (aux, emg, compressor, etc.)
-            duty_cycle = None
-
-            additional_outputs.update(
-                self.get_rh_metrics_daily(
-                    bins=RESISTANCE_HEAT_USE_BIN, core_day_set=core_heating_day_set
-                )
-            )
-            additional_outputs.update(
-                self.get_rh_metrics_hourly(
-                    bins=RESISTANCE_HEAT_USE_BIN, core_day_set=core_heating_day_set
-                )
-            )
             additional_outputs.update(
                 self._rhu_outputs(
                     rhu_type=rhu_type,
                     rhu_bins=rhu,
                     rhu_usage_bins=RESISTANCE_HEAT_USE_BIN_PAIRS,
-                    duty_cycle=duty_cycle,
                 )
             )
 
@@ -3191,7 +3557,6 @@ class Thermostat(object):
                     rhu_type=rhu_type,
                     rhu_bins=rhu_wide,
                     rhu_usage_bins=RESISTANCE_HEAT_USE_WIDE_BIN_PAIRS,
-                    duty_cycle=duty_cycle,
                 )
             )
 
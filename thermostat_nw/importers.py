@@ -213,6 +213,36 @@ def from_csv(
     return iter(results)
 
 
+def from_records(records, processes=None, chunksize=100):
+    """
+    Creates Thermostat objects in parallel from already loaded data.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Keyword arguments for thermostat.Thermostat, one dict per thermostat.
+    processes : int
+        Number of worker processes. Defaults to the number of available cores.
+    chunksize : int
+        Number of records sent to a worker process at a time.
+
+    Returns
+    -------
+    thermostats : list of thermostat.Thermostat objects
+        Thermostats built from the records, in the same order.
+    """
+    if processes is None:
+        processes = NUMBER_OF_CORES
+    with Pool(processes) as p:
+        return p.map(_thermostat_from_record, records, chunksize)
+
+
+def _thermostat_from_record(record):
+    """Builds a single thermostat for from_records. It is not intended to be
+    called directly."""
+    return Thermostat(**record)
+
+
 def _multiprocess_func(
     metadata, metadata_filename, verbose=False, save_cache=False, cache_path=None
 ):
@@ -1,4 +1,5 @@
 from multiprocessing import Pool
+from functools import partial
 import warnings
 
 
@@ -42,6 +43,104 @@ def _calc_epa_func_entire_dataset(thermostat):
     return results
 
 
+def _fit_func(thermostat, how, cooling_fit, heating_fit):
+    """Takes an individual thermostat and fits a cooling and heating model on
+    each of its core day sets. This method is necessary for the
+    multiprocessing pool as map / imap need a function to run on.
+
+    Parameters
+    ----------
+    thermostat : thermostat
+    how : str
+        "entire_dataset" for a single cooling and heating core day set,
+        otherwise one per cooling and heating season.
+    cooling_fit, heating_fit : str
+        Names of the thermostat methods that fit a core cooling or heating day
+        set, e.g. "get_cooling_demand" and "get_heating_demand".
+
+    Returns
+    -------
+    fits : dict
+        Results of cooling_fit or heating_fit, keyed by the name of the core
+        day set.
+    """
+    if how == "entire_dataset":
+        cooling_method, heating_method = "entire_dataset", "entire_dataset"
+    else:
+        cooling_method, heating_method = "year_end_to_end", "year_mid_to_mid"
+
+    fits = {}
+    if thermostat.has_cooling:
+        fit = getattr(thermostat, cooling_fit)
+        for core_day_set in thermostat.get_core_cooling_days(method=cooling_method):
+            fits[core_day_set.name] = fit(core_day_set)
+    if thermostat.has_heating:
+        fit = getattr(thermostat, heating_fit)
+        for core_day_set in thermostat.get_core_heating_days(method=heating_method):
+            fits[core_day_set.name] = fit(core_day_set)
+    return fits
+
+
+def multiple_thermostat_fit_demands(thermostats, how="split_dataset"):
+    """Takes a list of thermostats and fits their demand models, running as
+    many processes in parallel as the system will allow.
+
+    Parameters
+    ----------
+    thermostats : thermostats iterator
+        A list of the thermostats to fit.
+    how : str
+        "entire_dataset" to fit each thermostat on all of its data, otherwise
+        on each cooling and heating season (the core day sets used by
+        calculate_epa_field_savings_metrics by default).
+
+    Returns
+    -------
+    demands : list of dict
+        For each thermostat, in the order given, the results of
+        get_cooling_demand and get_heating_demand keyed by core day set name.
+    """
+    fit_demands = partial(
+        _fit_func,
+        how=how,
+        cooling_fit="get_cooling_demand",
+        heating_fit="get_heating_demand",
+    )
+    with Pool() as pool:
+        return pool.map(fit_demands, list(thermostats))
+
+
+def multiple_thermostat_fit_linear_models(thermostats, how="split_dataset"):
+    """Takes a list of thermostats and fits their linear (OLS) models of the
+    indoor-outdoor temperature difference on runtime, running as many
+    processes in parallel as the system will allow.
+
+    Parameters
+    ----------
+    thermostats : thermostats iterator
+        A list of the thermostats to fit.
+    how : str
+        "entire_dataset" to fit each thermostat on all of its data, otherwise
+        on each cooling and heating season (the core day sets used by
+        calculate_epa_field_savings_metrics by default).
+
+    Returns
+    -------
+    linear_models : list of dict
+        For each thermostat, in the order given, the results of
+        fit_linear_cooling_model and fit_linear_heating_model keyed by core
+        day set name.
+    """
+    fit_linear_models = partial(
+        _fit_func,
+        how=how,
+        cooling_fit="fit_linear_cooling_model",
+        heating_fit="fit_linear_heating_model",
+    )
+    with Pool() as pool:
+        return pool.map(fit_linear_models, list(thermostats))
+
+
 def multiple_thermostat_calculate_epa_field_savings_metrics(
     thermostats, how="split_dataset"
 ):